@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 
 # Import components
 from components.data_loader import (
@@ -8,7 +7,7 @@ from components.data_loader import (
     load_tourism_gdp_data, load_tourism_employment_data, load_fee_earnings_data,
     load_india_world_share_data, load_ita_data, load_ita_monthly_data,
     load_duration_stay_data, load_age_statistics_data, load_all_lean_peak_data,
-    load_state_tourism_data, load_state_foreign_tourism_data
+    load_state_tourism_data, load_state_foreign_tourism_data, load_state_domestic_tourism_data
 )
 from components.homepage import show_homepage
 from components.festivals import show_festivals_section
@@ -18,7 +17,8 @@ from components.chapter1_heritage_heartbeat import show_heritage_heartbeat
 from components.chapter2_economic_multiplier import show_economic_multiplier
 from components.chapter3_travelers_journey import show_travelers_journey
 from components.chapter4_regional_tapestry import show_regional_tapestry
-from styles.css_styles import apply_custom_css, apply_dance_styles, apply_sidebar_styles
+from styles.css_styles import apply_app_styles
+from utils.lite_mode import lite_mode_toggle
 
 # Page configuration
 st.set_page_config(
@@ -28,10 +28,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Apply CSS styles
-apply_custom_css()
-apply_dance_styles()
-apply_sidebar_styles()
+# Apply CSS styles (one cached stylesheet for the whole app)
+apply_app_styles()
 
 def main():
     # Home
@@ -58,6 +56,10 @@ def main():
     if st.sidebar.button("🗺️ Chapter 4: Regional Tapestry", use_container_width=True):
         st.session_state.page = "🗺️ Chapter 4: Regional Tapestry"
 
+    # Static chart images for slow connections and low-end devices
+    st.sidebar.markdown("---")
+    lite_mode_toggle()
+
     # Initialize page if not set
     if 'page' not in st.session_state:
         st.session_state.page = "🏠 Home"
@@ -132,11 +134,7 @@ def main():
         state_total_df = load_state_tourism_data()  # This loads total arrivals
         state_foreign_df = load_state_foreign_tourism_data()
 
-        # Load domestic data separately
-        try:
-            state_domestic_df = pd.read_csv('Datasets/State_Wise_Domestic_Tourist_Arrivals_2017_2023.csv')
-        except:
-            state_domestic_df = pd.DataFrame()
+        state_domestic_df = load_state_domestic_tourism_data()
 
         show_regional_tapestry(
             state_total_df,
@@ -7,6 +7,12 @@ import numpy as np
 from PIL import Image
 import os
 from styles.css_styles import apply_heritage_chapter_background
+from utils.image_pipeline import image_tag, prepare_images
+from utils.data_version import get_data_version
+from utils.card_templates import CardTemplate
+from utils.figure_cache import cached_figure
+from utils.lite_mode import render_chart
+from utils.card_grid import render_card_grid
 
 def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_foreign_df,
                            centrally_protected_domestic_df, centrally_protected_foreign_df):
@@ -166,17 +172,12 @@ def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_
 
         top_unesco_sites = unesco_with_visitors_sorted.nlargest(6, 'Total_Visitors') if 'Total_Visitors' in unesco_with_visitors_sorted.columns else unesco_with_visitors_sorted.head(6)
 
+        # Card HTML (images included) is memoized on the exact rows it renders, which
+        # carry the visitor numbers and ranking from every frame joined above
+        unesco_cards = build_unesco_cards_html(get_data_version(top_unesco_sites), top_unesco_sites)
+
         # Display top 6 UNESCO sites in festival-style card format (3 columns, 2 rows)
-        for row in range(2):
-            cols = st.columns(3)
-            for col_idx in range(3):
-                site_idx = row * 3 + col_idx
-                if site_idx < len(top_unesco_sites):
-                    site = top_unesco_sites.iloc[site_idx]
-
-                    with cols[col_idx]:
-                        # Create festival-style card for UNESCO site
-                        display_unesco_heritage_card(site)
+        render_card_grid(unesco_cards[:6])
     else:
         # Fallback message if UNESCO data is not available
         st.markdown("""
@@ -211,69 +212,77 @@ def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_
 
         with col1:
             # Domestic Visitors - Donut Chart
-            fig_domestic = go.Figure(data=[go.Pie(
-                labels=top_monuments_domestic_df['MONUMENT_NAME'][:8],
-                values=top_monuments_domestic_df['DOMESTIC_TOTAL_VISITS_MILLIONS'][:8],
-                hole=0.5,
-                marker=dict(
-                    colors=['#FF6B35', '#F7931E', '#FFD23F', '#06FFA5', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
-                    line=dict(color='#FFFFFF', width=2)
-                ),
-                textinfo='label+percent',
-                textfont=dict(size=10, color='black'),
-                hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Share: %{percent}<extra></extra>'
-            )])
-
-            fig_domestic.update_layout(
-                title=dict(
-                    text="🇮🇳 Domestic Visitor Distribution",
-                    font=dict(size=16, color='#8B4513', family="Georgia"),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                font=dict(color='#333', size=10),
-                height=400,
-                showlegend=False,
-                plot_bgcolor='rgba(139,69,19,0.1)',
-                paper_bgcolor='rgba(139,69,19,0.1)',
-                annotations=[dict(text='Domestic<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#8B4513')]
-            )
-
-            st.plotly_chart(fig_domestic, use_container_width=True)
+            def build_domestic_visitors_figure():
+                fig_domestic = go.Figure(data=[go.Pie(
+                    labels=top_monuments_domestic_df['MONUMENT_NAME'][:8],
+                    values=top_monuments_domestic_df['DOMESTIC_TOTAL_VISITS_MILLIONS'][:8],
+                    hole=0.5,
+                    marker=dict(
+                        colors=['#FF6B35', '#F7931E', '#FFD23F', '#06FFA5', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
+                        line=dict(color='#FFFFFF', width=2)
+                    ),
+                    textinfo='label+percent',
+                    textfont=dict(size=10, color='black'),
+                    hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Share: %{percent}<extra></extra>'
+                )])
+
+                fig_domestic.update_layout(
+                    title=dict(
+                        text="🇮🇳 Domestic Visitor Distribution",
+                        font=dict(size=16, color='#8B4513', family="Georgia"),
+                        x=0.5,
+                        xanchor='center'
+                    ),
+                    font=dict(color='#333', size=10),
+                    height=400,
+                    showlegend=False,
+                    plot_bgcolor='rgba(139,69,19,0.1)',
+                    paper_bgcolor='rgba(139,69,19,0.1)',
+                    annotations=[dict(text='Domestic<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#8B4513')]
+                )
+                return fig_domestic
+
+            fig_domestic = cached_figure(build_domestic_visitors_figure)
+
+            render_chart(fig_domestic)
 
         with col2:
             # Foreign Visitors - Sunburst Chart
             foreign_col = 'FOREIGN_TOTAL_VISITS_LAKHS' if 'FOREIGN_TOTAL_VISITS_LAKHS' in top_monuments_foreign_df.columns else 'FOREIGN_TOTAL_VISITS_THOUSANDS'
 
-            fig_foreign = go.Figure(data=[go.Pie(
-                labels=top_monuments_foreign_df['MONUMENT_NAME'][:8],
-                values=top_monuments_foreign_df[foreign_col][:8],
-                hole=0.5,
-                marker=dict(
-                    colors=['#E17055', '#FDCB6E', '#6C5CE7', '#A29BFE', '#FD79A8', '#E84393', '#00B894', '#00CEC9'],
-                    line=dict(color='#FFFFFF', width=2)
-                ),
-                textinfo='label+percent',
-                textfont=dict(size=10, color='black'),
-                hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}L<br>Share: %{percent}<extra></extra>'
-            )])
-
-            fig_foreign.update_layout(
-                title=dict(
-                    text="🌍 International Visitor Distribution",
-                    font=dict(size=16, color='#D2691E', family="Georgia"),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                font=dict(color='#333', size=10),
-                height=400,
-                showlegend=False,
-                plot_bgcolor='rgba(139,69,19,0.1)',
-                paper_bgcolor='rgba(139,69,19,0.1)',
-                annotations=[dict(text='International<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#D2691E')]
-            )
-
-            st.plotly_chart(fig_foreign, use_container_width=True)
+            def build_foreign_visitors_figure():
+                fig_foreign = go.Figure(data=[go.Pie(
+                    labels=top_monuments_foreign_df['MONUMENT_NAME'][:8],
+                    values=top_monuments_foreign_df[foreign_col][:8],
+                    hole=0.5,
+                    marker=dict(
+                        colors=['#E17055', '#FDCB6E', '#6C5CE7', '#A29BFE', '#FD79A8', '#E84393', '#00B894', '#00CEC9'],
+                        line=dict(color='#FFFFFF', width=2)
+                    ),
+                    textinfo='label+percent',
+                    textfont=dict(size=10, color='black'),
+                    hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}L<br>Share: %{percent}<extra></extra>'
+                )])
+
+                fig_foreign.update_layout(
+                    title=dict(
+                        text="🌍 International Visitor Distribution",
+                        font=dict(size=16, color='#D2691E', family="Georgia"),
+                        x=0.5,
+                        xanchor='center'
+                    ),
+                    font=dict(color='#333', size=10),
+                    height=400,
+                    showlegend=False,
+                    plot_bgcolor='rgba(139,69,19,0.1)',
+                    paper_bgcolor='rgba(139,69,19,0.1)',
+                    annotations=[dict(text='International<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#D2691E')]
+                )
+                return fig_foreign
+
+            fig_foreign = cached_figure(build_foreign_visitors_figure)
+
+            render_chart(fig_foreign)
 
         # Add insights below the charts
         st.markdown("""
@@ -330,77 +339,78 @@ def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_
     """, unsafe_allow_html=True)
 
 
-def display_unesco_heritage_card(site):
-    """Display UNESCO heritage site in festival-style card format"""
-
-    # Site information
-    domestic_visitors = site.get('Domestic_Visitors_Millions', 'N/A')
-    foreign_visitors = site.get('Foreign_Visitors_Lakhs', 'N/A')
-    year = site.get('YEAR', 'N/A')
-    location = site.get('LOCATION', 'N/A')
-    site_name = site['SITE']
-
-    # Load UNESCO site image
-    image_path = f"Images/unesco_india_images/{site.get('DOWNLOADED_DANCE_IMAGES', 'default.jpg')}"
+def unesco_image_path(site):
+    """Path of a UNESCO site's image"""
+    return f"Images/unesco_india_images/{site.get('DOWNLOADED_DANCE_IMAGES', 'default.jpg')}"
 
-    # Create the card with festival-style design
-    st.markdown(f"""
+UNESCO_CARD = CardTemplate('unesco', """
     <div style="background: white; border-radius: 20px; overflow: hidden; box-shadow: 0 15px 35px rgba(0,0,0,0.15);
                 margin-bottom: 2rem; border: 3px solid #4ECDC4; transition: transform 0.3s ease;">
         <div style="position: relative;">
-    """, unsafe_allow_html=True)
-
-    # Display image or fallback
-    try:
-        if os.path.exists(image_path):
-            image = Image.open(image_path)
-            st.image(image, use_container_width=True)
-        else:
-            # Fallback with gradient background
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B4513, #D2691E); color: white; padding: 4rem 2rem; text-align: center; height: 200px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
-                <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🏛️</div>
-                <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{site_name}</div>
-            </div>
-            """, unsafe_allow_html=True)
-    except Exception:
-        # Exception fallback
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #8B4513, #D2691E); color: white; padding: 4rem 2rem; text-align: center; height: 200px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
-            <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🏛️</div>
-            <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{site_name}</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Card content in festival style
-    st.markdown(f"""
+            $image_html
         </div>
         <div style="padding: 1rem;">
             <h2 style="color: #8B4513; font-family: 'Playfair Display', serif; font-size: 1.3rem;
                        margin-bottom: 0.5rem; font-weight: bold; text-align: center;">
-                🏛️ {site_name}
+                🏛️ $site_name
             </h2>
             <div style="margin-bottom: 0.8rem;">
                 <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.3rem;">
                     <span style="font-size: 1rem; width: 20px;">📍</span>
-                    <span style="color: #D2691E; font-weight: bold; font-size: 0.9rem;">{location}</span>
+                    <span style="color: #D2691E; font-weight: bold; font-size: 0.9rem;">$location</span>
                 </div>
             </div>
             <div style="background: rgba(139,69,19,0.1); padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
                 <div style="display: flex; justify-content: space-between; text-align: center;">
                     <div>
-                        <div style="font-size: 1.2rem; font-weight: bold; color: #8B4513;">{domestic_visitors if domestic_visitors != 'N/A' else '—'}</div>
+                        <div style="font-size: 1.2rem; font-weight: bold; color: #8B4513;">$domestic_visitors</div>
                         <div style="font-size: 0.8rem; color: #666;">Domestic (M)</div>
                     </div>
                     <div>
-                        <div style="font-size: 1.2rem; font-weight: bold; color: #D2691E;">{foreign_visitors if foreign_visitors != 'N/A' else '—'}</div>
+                        <div style="font-size: 1.2rem; font-weight: bold; color: #D2691E;">$foreign_visitors</div>
                         <div style="font-size: 0.8rem; color: #666;">Foreign (L)</div>
                     </div>
                 </div>
             </div>
             <div style="color: #333; line-height: 1.6; font-family: 'Poppins', sans-serif; font-size: 0.85rem;">
-                {site.get('DESCRIPTION', 'A magnificent UNESCO World Heritage Site showcasing India\'s rich cultural heritage.')[:120]}...
+                $description...
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+""")
+
+UNESCO_IMAGE_PLACEHOLDER = CardTemplate('unesco_placeholder', """
+    <div style="background: linear-gradient(135deg, #8B4513, #D2691E); color: white; padding: 4rem 2rem; text-align: center; height: 200px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
+        <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🏛️</div>
+        <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">$site_name</div>
+    </div>
+""")
+
+def build_unesco_card_html(site, image_src):
+    """Build a UNESCO heritage site card in festival-style format"""
+
+    # Site information
+    domestic_visitors = site.get('Domestic_Visitors_Millions', 'N/A')
+    foreign_visitors = site.get('Foreign_Visitors_Lakhs', 'N/A')
+    site_name = site['SITE']
+    description = site.get('DESCRIPTION', "A magnificent UNESCO World Heritage Site showcasing India's rich cultural heritage.")
+
+    # Image or fallback with gradient background
+    if image_src:
+        image_html = image_tag(image_src, unesco_image_path(site), (480, 320), alt=site_name,
+                               style="width: 100%; height: auto; display: block;",
+                               sizes="(max-width: 640px) 100vw, 33vw")
+    else:
+        image_html = UNESCO_IMAGE_PLACEHOLDER.render(site_name=site_name)
+
+    return UNESCO_CARD.render(image_html=image_html, site_name=site_name, location=site.get('LOCATION', 'N/A'),
+                              domestic_visitors=domestic_visitors if domestic_visitors != 'N/A' else '—',
+                              foreign_visitors=foreign_visitors if foreign_visitors != 'N/A' else '—',
+                              description=description[:120])
+
+@st.cache_data(show_spinner=False)
+def build_unesco_cards_html(data_version, _top_unesco_sites):
+    """Build the top UNESCO site cards once per data version, so reruns do no image I/O"""
+    sites = [site for _, site in _top_unesco_sites.iterrows()]
+    image_srcs, _ = prepare_images([unesco_image_path(site) for site in sites], (480, 320))
+    return [build_unesco_card_html(site, image_src) for site, image_src in zip(sites, image_srcs)]
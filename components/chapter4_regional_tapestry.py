@@ -1,6 +1,70 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
+from utils.figure_cache import cached_figure, figure_cache
+from utils.figure_specs import build_figure, colorscale
+from utils.lite_mode import render_chart
+from utils.card_grid import compact_html, render_card_grid
+from utils.card_templates import CardTemplate
+from utils.data_version import get_data_version
+
+REGION_CARD = CardTemplate('regional_champion', """
+    <div style="background: $color; padding: 0.5rem; border-radius: 6px; margin: 0.25rem 0; color: white; box-shadow: 0 2px 4px rgba(0,0,0,0.2);">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <span style="font-weight: bold; font-size: 1.2rem;">$region</span>
+            <span style="font-size: 0.85rem; font-weight: bold;">${visitors}M</span>
+        </div>
+        <div style="font-size: 0.85rem; margin-top: 0.15rem; opacity: 0.95;">$description</div>
+        <div style="background: rgba(255,255,255,0.4); height: 3px; border-radius: 2px; margin-top: 0.3rem;">
+            <div style="background: white; height: 100%; width: $percentage%; border-radius: 2px;"></div>
+        </div>
+        <small style="opacity: 0.95; font-size: 1rem;">$percentage_label% of total</small>
+    </div>
+""")
+
+@figure_cache
+def create_recovery_champions_chart(state_total_df):
+    """Twelve states with the highest 2023 arrivals relative to 2019, as horizontal bars"""
+    recovery_rate = (((state_total_df['YEAR_2023'] - state_total_df['YEAR_2019']) / state_total_df['YEAR_2019']) * 100).fillna(0)
+    top_recoverers = state_total_df.assign(Recovery_Rate=recovery_rate).nlargest(12, 'Recovery_Rate')[['STATE', 'Recovery_Rate', 'YEAR_2019', 'YEAR_2023']].copy()
+    top_recoverers['YEAR_2019_M'] = top_recoverers['YEAR_2019'] / 10 / 1_000_000  # Apply correction
+    top_recoverers['YEAR_2023_M'] = top_recoverers['YEAR_2023'] / 10 / 1_000_000  # Apply correction
+
+    # Bars for recovery rate
+    data = [{
+        'type': 'bar',
+        'x': top_recoverers['Recovery_Rate'],
+        'y': top_recoverers['STATE'],
+        'orientation': 'h',
+        'name': 'Recovery Rate (%)',
+        'marker': {
+            'color': top_recoverers['Recovery_Rate'],
+            'colorscale': colorscale('RdYlGn'),
+            'colorbar': {'title': {'text': "Recovery %"}},
+            'line': {'color': 'white', 'width': 1},
+        },
+        'text': [f"+{x:.0f}%" if x > 0 else f"{x:.0f}%" for x in top_recoverers['Recovery_Rate']],
+        'textposition': 'outside',
+        'hovertemplate': '<b>%{y}</b><br>Recovery: %{x:.1f}%<br>2019: %{customdata[0]:.1f}M<br>2023: %{customdata[1]:.1f}M<extra></extra>',
+        'customdata': top_recoverers[['YEAR_2019_M', 'YEAR_2023_M']].values,
+    }]
+
+    layout = dict(
+        title=dict(
+            text="Recovery Performance: Growth vs Pre-Pandemic Levels",
+            font=dict(size=18, color='#FF6347'),
+            x=0.3
+        ),
+        xaxis=dict(title=dict(text="Recovery Rate vs 2019 (%)")),
+        yaxis=dict(title=dict(text=""), categoryorder='total ascending'),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='black'),
+        height=600,
+        showlegend=False,
+        margin=dict(l=150, r=100, t=80, b=60)
+    )
+    return build_figure(data, layout)
 
 def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
     """Chapter 4: The Regional Tapestry - State-wise Tourism Analysis"""
@@ -89,85 +153,79 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
             # Darker, more intense colors for better contrast
             colors = ['#DC2626', '#B91C1C', '#EA580C', '#D97706', '#059669']
 
-            for i, (_, row) in enumerate(regional_totals.iterrows()):
-                region = row['REGION']
+            # Regional descriptions for new 5-region structure
+            descriptions = {
+                'SOUTH': '🌴 Temples & Tech Hubs',
+                'WEST': '🏖️ Beaches & Business',
+                'NORTH': '🏔️ Heritage & Hills',
+                'EAST': '🎭 Culture & Tribes',
+                'CENTER': '🏛️ Heart of India'
+            }
+
+            def region_card_fields(i, row):
                 visitors = row['YEAR_2023']
                 percentage = (visitors / regional_totals['YEAR_2023'].sum()) * 100
+                return dict(color=colors[i], region=row['REGION'], visitors=f"{visitors:.1f}",
+                            description=descriptions.get(row['REGION'], '🌟 Unique Experiences'),
+                            percentage=percentage, percentage_label=f"{percentage:.1f}")
 
-                # Regional descriptions for new 5-region structure
-                descriptions = {
-                    'SOUTH': '🌴 Temples & Tech Hubs',
-                    'WEST': '🏖️ Beaches & Business',
-                    'NORTH': '🏔️ Heritage & Hills',
-                    'EAST': '🎭 Culture & Tribes',
-                    'CENTER': '🏛️ Heart of India'
-                }
-
-                desc = descriptions.get(region, '🌟 Unique Experiences')
-
-                st.markdown(f"""
-                <div style="background: {colors[i]}; padding: 0.5rem; border-radius: 6px; margin: 0.25rem 0; color: white; box-shadow: 0 2px 4px rgba(0,0,0,0.2);">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <span style="font-weight: bold; font-size: 1.2rem;">{region}</span>
-                        <span style="font-size: 0.85rem; font-weight: bold;">{visitors:.1f}M</span>
-                    </div>
-                    <div style="font-size: 0.85rem; margin-top: 0.15rem; opacity: 0.95;">{desc}</div>
-                    <div style="background: rgba(255,255,255,0.4); height: 3px; border-radius: 2px; margin-top: 0.3rem;">
-                        <div style="background: white; height: 100%; width: {percentage}%; border-radius: 2px;"></div>
-                    </div>
-                    <small style="opacity: 0.95; font-size: 1rem;">{percentage:.1f}% of total</small>
-                </div>
-                """, unsafe_allow_html=True)
+            # Cards are memoized per region and version of the totals
+            data_version = get_data_version(regional_totals)
+            region_cards = [REGION_CARD.render_cached(row['REGION'], data_version,
+                                                      lambda i=i, row=row: region_card_fields(i, row))
+                            for i, (_, row) in enumerate(regional_totals.iterrows())]
+            st.markdown("".join(region_cards), unsafe_allow_html=True)
 
         with col2:
             # Regional distribution donut chart
-            fig = go.Figure(data=[
-                go.Pie(
-                    labels=regional_totals['REGION'],
-                    values=regional_totals['YEAR_2023'],
-                    hole=0.6,
-                    marker_colors=colors[:len(regional_totals)],
-                    textinfo='label+percent',
-                    textposition='outside',
-                    hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Share: %{percent}<extra></extra>',
-                    textfont_size=12,
-                    marker=dict(
-                        line=dict(color='white', width=3)
+            def build_regional_share_figure():
+                data = [{
+                    'type': 'pie',
+                    'labels': regional_totals['REGION'],
+                    'values': regional_totals['YEAR_2023'],
+                    'hole': 0.6,
+                    'marker': {
+                        'colors': colors[:len(regional_totals)],
+                        'line': {'color': 'white', 'width': 3},
+                    },
+                    'textinfo': 'label+percent',
+                    'textposition': 'outside',
+                    'hovertemplate': '<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Share: %{percent}<extra></extra>',
+                    'textfont': {'size': 12},
+                }]
+
+                layout = dict(
+                    # Center text
+                    annotations=[dict(
+                        text=f"<b>{regional_totals['YEAR_2023'].sum():.1f}M</b><br><span style='font-size:14px'>Total Visitors</span>",
+                        x=0.5, y=0.5,
+                        font=dict(size=20, color='#FF6347'),
+                        showarrow=False
+                    )],
+                    title=dict(
+                        text="🌟 Regional Tourism Distribution (2023)",
+                        font=dict(size=22, color='#FF6347'),
+                        x=0.15
+                    ),
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    font=dict(color='#333'),
+                    height=650,
+                    showlegend=True,
+                    legend=dict(
+                        orientation="v",
+                        yanchor="middle",
+                        y=0.5,
+                        xanchor="left",
+                        x=1.05,
+                        font=dict(color='black', size=12)
                     )
                 )
-            ])
-
-            # Add center text
-            fig.add_annotation(
-                text=f"<b>{regional_totals['YEAR_2023'].sum():.1f}M</b><br><span style='font-size:14px'>Total Visitors</span>",
-                x=0.5, y=0.5,
-                font_size=20,
-                font_color='#FF6347',
-                showarrow=False
-            )
+                return build_figure(data, layout)
 
-            fig.update_layout(
-                title=dict(
-                    text="🌟 Regional Tourism Distribution (2023)",
-                    font=dict(size=22, color='#FF6347'),
-                    x=0.15
-                ),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#333'),
-                height=650,
-                showlegend=True,
-                legend=dict(
-                    orientation="v",
-                    yanchor="middle",
-                    y=0.5,
-                    xanchor="left",
-                    x=1.05,
-                    font=dict(color='black', size=12)
-                )
-            )
+            fig = cached_figure(build_regional_share_figure)
 
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart(fig)
 
     # Top Performing States
     if not state_total_df.empty:
@@ -207,45 +265,47 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
             color_mapping = {state: discrete_colors[i] for i, state in enumerate(top_states_sorted['STATE'])}
             colors = [color_mapping[state] for state in top_states['STATE']]
 
-            fig = go.Figure(go.Treemap(
-                labels=top_states['STATE'],
-                values=top_states['YEAR_2023'],
-                parents=[""] * len(top_states),
-                textinfo="label+value",
-                texttemplate="<b>%{label}</b><br>%{value:.1f}M",
-                hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Region: %{customdata}<extra></extra>',
-                customdata=top_states['REGION'],
-                marker_colors=colors,  # Use marker_colors instead of marker dict
-                marker_line_width=3,
-                marker_line_color='white',
-                textfont_size=11,
-                textfont_color='white'
-            ))
-
-            fig.update_layout(
-                title=dict(
-                    text="🌟 Top 10 States by Visitors (2023)",
-                    font=dict(size=16, color="#FDF2F1", family='Arial Black'),
-                    x=0.25
-                ),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='black',
-                font=dict(color='#333', family='Arial'),
-                height=500,
-                margin=dict(t=50, l=25, r=25, b=25),
-                # Add annotations for better text visibility on smaller segments
-                annotations=[
-                    dict(
-                        text="<i>Hover over segments for detailed information</i>",
-                        x=0.5, y=-0.1,
-                        xref="paper", yref="paper",
-                        showarrow=False,
-                        font=dict(size=10, color='#666')
-                    )
-                ]
-            )
+            def build_state_treemap_figure():
+                data = [{
+                    'type': 'treemap',
+                    'labels': top_states['STATE'],
+                    'values': top_states['YEAR_2023'],
+                    'parents': [""] * len(top_states),
+                    'textinfo': "label+value",
+                    'texttemplate': "<b>%{label}</b><br>%{value:.1f}M",
+                    'hovertemplate': '<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Region: %{customdata}<extra></extra>',
+                    'customdata': top_states['REGION'],
+                    'marker': {'colors': colors, 'line': {'width': 3, 'color': 'white'}},
+                    'textfont': {'size': 11, 'color': 'white'},
+                }]
+
+                layout = dict(
+                    title=dict(
+                        text="🌟 Top 10 States by Visitors (2023)",
+                        font=dict(size=16, color="#FDF2F1", family='Arial Black'),
+                        x=0.25
+                    ),
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='black',
+                    font=dict(color='#333', family='Arial'),
+                    height=500,
+                    margin=dict(t=50, l=25, r=25, b=25),
+                    # Add annotations for better text visibility on smaller segments
+                    annotations=[
+                        dict(
+                            text="<i>Hover over segments for detailed information</i>",
+                            x=0.5, y=-0.1,
+                            xref="paper", yref="paper",
+                            showarrow=False,
+                            font=dict(size=10, color='#666')
+                        )
+                    ]
+                )
+                return build_figure(data, layout)
 
-            st.plotly_chart(fig, use_container_width=True)
+            fig = cached_figure(build_state_treemap_figure)
+
+            render_chart(fig)
 
         with col2:
             # Tourism Champions Story
@@ -326,8 +386,7 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
                     """)
 
                 # Display stories
-                for story in stories:
-                    st.markdown(story, unsafe_allow_html=True)
+                st.markdown(compact_html("".join(stories)), unsafe_allow_html=True)
 
 
 
@@ -344,52 +403,56 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
         # Get top 5 states for trend analysis
         top_5_states = state_total_df.nlargest(5, 'YEAR_2023').copy()
 
-        fig = go.Figure()
+        def build_top_states_trend_figure():
+            # Create line for each top state
+            years = ['YEAR_2017', 'YEAR_2018', 'YEAR_2019', 'YEAR_2020', 'YEAR_2021', 'YEAR_2022', 'YEAR_2023']
+            year_labels = ['2017', '2018', '2019', '2020', '2021', '2022', '2023']
+
+            colors_line = ['#FF6347', '#FF7F50', '#FFA07A', '#FFB6C1', '#FFC0CB']
+
+            data = []
+            for i, (_, state_row) in enumerate(top_5_states.iterrows()):
+                # Apply correction: divide by 10 and convert to millions, trim decimals
+                values = [int(state_row[year] / 10 / 1_000_000) for year in years if year in state_row and pd.notna(state_row[year])]
+                valid_years = [year_labels[j] for j, year in enumerate(years) if year in state_row and pd.notna(state_row[year])]
+
+                data.append({
+                    'type': 'scatter',
+                    'x': valid_years,
+                    'y': values,
+                    'mode': 'lines+markers',
+                    'name': state_row['STATE'],
+                    'line': {'color': colors_line[i], 'width': 3},
+                    'marker': {'size': 8, 'color': colors_line[i]},
+                    'hovertemplate': '<b>%{fullData.name}</b><br>Year: %{x}<br>Visitors: %{y}M<extra></extra>',
+                })
+
+            layout = dict(
+                title=dict(
+                    text="📊 State-wise Tourism Evolution: The Champions' Journey",
+                    font=dict(size=18, color='#FF6347'),
+                    x=0.3
+                ),
+                xaxis=dict(title=dict(text="Year")),
+                yaxis=dict(title=dict(text="Visitors (Millions)")),
+                plot_bgcolor='rgba(248,249,250,0.8)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#333'),
+                height=550,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="center",
+                    x=0.5
+                ),
+                hovermode='x unified'
+            )
+            return build_figure(data, layout)
 
-        # Create line for each top state
-        years = ['YEAR_2017', 'YEAR_2018', 'YEAR_2019', 'YEAR_2020', 'YEAR_2021', 'YEAR_2022', 'YEAR_2023']
-        year_labels = ['2017', '2018', '2019', '2020', '2021', '2022', '2023']
+        fig = cached_figure(build_top_states_trend_figure)
 
-        colors_line = ['#FF6347', '#FF7F50', '#FFA07A', '#FFB6C1', '#FFC0CB']
-
-        for i, (_, state_row) in enumerate(top_5_states.iterrows()):
-            # Apply correction: divide by 10 and convert to millions, trim decimals
-            values = [int(state_row[year] / 10 / 1_000_000) for year in years if year in state_row and pd.notna(state_row[year])]
-            valid_years = [year_labels[j] for j, year in enumerate(years) if year in state_row and pd.notna(state_row[year])]
-
-            fig.add_trace(go.Scatter(
-                x=valid_years,
-                y=values,
-                mode='lines+markers',
-                name=state_row['STATE'],
-                line=dict(color=colors_line[i], width=3),
-                marker=dict(size=8, color=colors_line[i]),
-                hovertemplate='<b>%{fullData.name}</b><br>Year: %{x}<br>Visitors: %{y}M<extra></extra>'
-            ))
-
-        fig.update_layout(
-            title=dict(
-                text="📊 State-wise Tourism Evolution: The Champions' Journey",
-                font=dict(size=18, color='#FF6347'),
-                x=0.3
-            ),
-            xaxis_title="Year",
-            yaxis_title="Visitors (Millions)",
-            plot_bgcolor='rgba(248,249,250,0.8)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='#333'),
-            height=550,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="center",
-                x=0.5
-            ),
-            hovermode='x unified'
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
 
 
@@ -413,49 +476,9 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
         """, unsafe_allow_html=True)
 
         # Recovery Champions vs Strugglers - Full width for better visibility
-        top_recoverers = state_total_df.nlargest(12, 'Recovery_Rate')[['STATE', 'Recovery_Rate', 'YEAR_2019', 'YEAR_2023']].copy()
-        top_recoverers['YEAR_2019_M'] = top_recoverers['YEAR_2019'] / 10 / 1_000_000  # Apply correction
-        top_recoverers['YEAR_2023_M'] = top_recoverers['YEAR_2023'] / 10 / 1_000_000  # Apply correction
-
-        # Create recovery champions chart
-        fig = go.Figure()
-
-        # Add bars for recovery rate
-        fig.add_trace(go.Bar(
-            x=top_recoverers['Recovery_Rate'],
-            y=top_recoverers['STATE'],
-            orientation='h',
-            name='Recovery Rate (%)',
-            marker=dict(
-                color=top_recoverers['Recovery_Rate'],
-                colorscale='RdYlGn',
-                colorbar=dict(title="Recovery %"),
-                line=dict(color='white', width=1)
-            ),
-            text=[f"+{x:.0f}%" if x > 0 else f"{x:.0f}%" for x in top_recoverers['Recovery_Rate']],
-            textposition='outside',
-            hovertemplate='<b>%{y}</b><br>Recovery: %{x:.1f}%<br>2019: %{customdata[0]:.1f}M<br>2023: %{customdata[1]:.1f}M<extra></extra>',
-            customdata=top_recoverers[['YEAR_2019_M', 'YEAR_2023_M']].values
-        ))
-
-        fig.update_layout(
-            title=dict(
-                text="Recovery Performance: Growth vs Pre-Pandemic Levels",
-                font=dict(size=18, color='#FF6347'),
-                x=0.3
-            ),
-            xaxis_title="Recovery Rate vs 2019 (%)",
-            yaxis_title="",
-            plot_bgcolor='rgba(248,249,250,0.8)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='black'),
-            height=600,
-            showlegend=False,
-            yaxis={'categoryorder':'total ascending'},
-            margin=dict(l=150, r=100, t=80, b=60)
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        fig = create_recovery_champions_chart(state_total_df)
+
+        render_chart(fig)
 
         # COVID Impact and Recovery Analysis - Simplified View
         st.markdown("""
@@ -474,88 +497,93 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
             if 'Pandemic_Impact' in state_total_df.columns:
                 worst_hit = state_total_df.nsmallest(10, 'Pandemic_Impact')[['STATE', 'Pandemic_Impact']].copy()
 
-                fig = go.Figure()
-                fig.add_trace(go.Bar(
-                    x=worst_hit['Pandemic_Impact'],
-                    y=worst_hit['STATE'],
-                    orientation='h',
-                    marker=dict(
-                        color=worst_hit['Pandemic_Impact'],
-                        colorscale='Reds_r',  # Reverse red scale so darker = worse impact
-                        line=dict(width=1, color='white')
-                    ),
-                    text=[f"{x:.1f}%" for x in worst_hit['Pandemic_Impact']],
-                    textposition='outside',
-                    textfont=dict(color='black', size=12),  # Black font for better contrast
-                    hovertemplate='<b>%{y}</b><br>Impact: %{x:.1f}%<extra></extra>',
-                    showlegend=False
-                ))
-
-                fig.update_layout(
-                    title=dict(
-                        text="📉 Most Affected States (2020)",
-                        font=dict(size=16, color='#DC143C'),
-                        x=0.5
-                    ),
-                    xaxis_title="Impact (%)",
-                    yaxis_title="",
-                    plot_bgcolor='rgba(248,249,250,0.8)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='black'),
-                    height=400,
-                    yaxis={'categoryorder':'total ascending'},
-                    margin=dict(l=100, r=50, t=60, b=40)
-                )
+                def build_pandemic_impact_figure():
+                    data = [{
+                        'type': 'bar',
+                        'x': worst_hit['Pandemic_Impact'],
+                        'y': worst_hit['STATE'],
+                        'orientation': 'h',
+                        'marker': {
+                            'color': worst_hit['Pandemic_Impact'],
+                            'colorscale': colorscale('Reds_r'),  # Reverse red scale so darker = worse impact
+                            'line': {'width': 1, 'color': 'white'},
+                        },
+                        'text': [f"{x:.1f}%" for x in worst_hit['Pandemic_Impact']],
+                        'textposition': 'outside',
+                        'textfont': {'color': 'black', 'size': 12},  # Black font for better contrast
+                        'hovertemplate': '<b>%{y}</b><br>Impact: %{x:.1f}%<extra></extra>',
+                        'showlegend': False,
+                    }]
+
+                    layout = dict(
+                        title=dict(
+                            text="📉 Most Affected States (2020)",
+                            font=dict(size=16, color='#DC143C'),
+                            x=0.5
+                        ),
+                        xaxis=dict(title=dict(text="Impact (%)")),
+                        yaxis=dict(title=dict(text=""), categoryorder='total ascending'),
+                        plot_bgcolor='rgba(248,249,250,0.8)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='black'),
+                        height=400,
+                        margin=dict(l=100, r=50, t=60, b=40)
+                    )
+                    return build_figure(data, layout)
+
+                fig = cached_figure(build_pandemic_impact_figure)
 
-                st.plotly_chart(fig, use_container_width=True)
+                render_chart(fig)
 
         with col2:
             # Best recovery states (2023 vs 2019)
             if 'Recovery_Rate' in state_total_df.columns:
                 best_recovery = state_total_df.nlargest(10, 'Recovery_Rate')[['STATE', 'Recovery_Rate']].copy()
 
-                fig = go.Figure()
-                fig.add_trace(go.Bar(
-                    x=best_recovery['Recovery_Rate'],
-                    y=best_recovery['STATE'],
-                    orientation='h',
-                    marker=dict(
-                        color=best_recovery['Recovery_Rate'],
-                        colorscale='Greens',
-                        line=dict(width=1, color='white')
-                    ),
-                    text=[f"{x:.1f}%" for x in best_recovery['Recovery_Rate']],
-                    textposition='outside',
-                    textfont=dict(color='black', size=12),  # Black font for better contrast
-                    hovertemplate='<b>%{y}</b><br>Recovery: %{x:.1f}%<extra></extra>',
-                    showlegend=False
-                ))
-
-                fig.update_layout(
-                    title=dict(
-                        text="📈 Best Recovery States (2023)",
-                        font=dict(size=16, color='#228B22'),
-                        x=0.5
-                    ),
-                    xaxis_title="Recovery (%)",
-                    yaxis_title="",
-                    plot_bgcolor='rgba(248,249,250,0.8)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='black'),
-                    xaxis=dict(
-                        title_font=dict(color='#006400', size=14),
-                        tickfont=dict(color='#006400', size=12)
-                    ),
-                    yaxis=dict(
-                        title_font=dict(color='#006400', size=14),
-                        tickfont=dict(color='#006400', size=12),
-                        categoryorder='total ascending'
-                    ),
-                    height=400,
-                    margin=dict(l=100, r=50, t=60, b=40)
-                )
+                def build_recovery_rate_figure():
+                    data = [{
+                        'type': 'bar',
+                        'x': best_recovery['Recovery_Rate'],
+                        'y': best_recovery['STATE'],
+                        'orientation': 'h',
+                        'marker': {
+                            'color': best_recovery['Recovery_Rate'],
+                            'colorscale': colorscale('Greens'),
+                            'line': {'width': 1, 'color': 'white'},
+                        },
+                        'text': [f"{x:.1f}%" for x in best_recovery['Recovery_Rate']],
+                        'textposition': 'outside',
+                        'textfont': {'color': 'black', 'size': 12},  # Black font for better contrast
+                        'hovertemplate': '<b>%{y}</b><br>Recovery: %{x:.1f}%<extra></extra>',
+                        'showlegend': False,
+                    }]
+
+                    layout = dict(
+                        title=dict(
+                            text="📈 Best Recovery States (2023)",
+                            font=dict(size=16, color='#228B22'),
+                            x=0.5
+                        ),
+                        plot_bgcolor='rgba(248,249,250,0.8)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='black'),
+                        xaxis=dict(
+                            title=dict(text="Recovery (%)", font=dict(color='#006400', size=14)),
+                            tickfont=dict(color='#006400', size=12)
+                        ),
+                        yaxis=dict(
+                            title=dict(text="", font=dict(color='#006400', size=14)),
+                            tickfont=dict(color='#006400', size=12),
+                            categoryorder='total ascending'
+                        ),
+                        height=400,
+                        margin=dict(l=100, r=50, t=60, b=40)
+                    )
+                    return build_figure(data, layout)
 
-                st.plotly_chart(fig, use_container_width=True)
+                fig = cached_figure(build_recovery_rate_figure)
+
+                render_chart(fig)
 
         # Recovery Story Narrative
         if not state_total_df.empty:
@@ -579,34 +607,29 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
                 """, unsafe_allow_html=True)
 
                 # Create metrics cards
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.markdown(f"""
+                render_card_grid([
+                    f"""
                     <div style="background: rgba(0,128,128,0.4); padding: 1.5rem; border-radius: 15px; backdrop-filter: blur(10px); text-align: center; color: white; border: 1px solid rgba(255,255,255,0.3); box-shadow: 3px 3px 10px rgba(0,0,0,0.3);">
                         <h5 style="margin: 0 0 0.5rem 0; color: #FFD700; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">🎯 Recovery Success Rate</h5>
                         <p style="margin: 0; font-size: 1.2rem; font-weight: bold; color: white; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">{recovered_states}/{total_states} states</p>
                         <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: white; opacity: 0.9; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">({(recovered_states/total_states)*100:.1f}%) exceeded 2019 levels</p>
                     </div>
-                    """, unsafe_allow_html=True)
-
-                with col2:
-                    st.markdown(f"""
+                    """,
+                    f"""
                     <div style="background: rgba(0,128,128,0.4); padding: 1.5rem; border-radius: 15px; backdrop-filter: blur(10px); text-align: center; color: white; border: 1px solid rgba(255,255,255,0.3); box-shadow: 3px 3px 10px rgba(0,0,0,0.3);">
                         <h5 style="margin: 0 0 0.5rem 0; color: #FFD700; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">📈 Average Recovery</h5>
                         <p style="margin: 0; font-size: 1.2rem; font-weight: bold; color: white; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">{avg_recovery:.1f}%</p>
                         <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: white; opacity: 0.9; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">growth vs pre-pandemic</p>
                     </div>
-                    """, unsafe_allow_html=True)
-
-                with col3:
-                    st.markdown(f"""
+                    """,
+                    f"""
                     <div style="background: rgba(0,128,128,0.4); padding: 1.5rem; border-radius: 15px; backdrop-filter: blur(10px); text-align: center; color: white; border: 1px solid rgba(255,255,255,0.3); box-shadow: 3px 3px 10px rgba(0,0,0,0.3);">
                         <h5 style="margin: 0 0 0.5rem 0; color: #FFD700; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">🏆 Recovery Champion</h5>
                         <p style="margin: 0; font-size: 1.1rem; font-weight: bold; color: white; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">{best_recovery_state}</p>
                         <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: white; opacity: 0.9; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);">+{best_recovery_rate:.1f}% growth</p>
                     </div>
-                    """, unsafe_allow_html=True)
+                    """,
+                ])
 
                 # Narrative text
                 st.markdown(f"""
@@ -659,77 +682,81 @@ def show_regional_tapestry(state_total_df, state_domestic_df, state_foreign_df):
                 foreign_totals.append(0)
 
         # Create the trend comparison chart
-        fig = go.Figure()
-
-        # Add domestic tourism line
-        fig.add_trace(go.Scatter(
-            x=year_labels,
-            y=domestic_totals,
-            mode='lines+markers+text',
-            name='🇮🇳 Domestic Tourism',
-            line=dict(color='#FF6347', width=4),
-            marker=dict(size=10, color='#FF6347', line=dict(width=2, color='white')),
-            text=[f"{x:.0f}M" for x in domestic_totals],
-            textposition='top center',
-            textfont=dict(color='black', size=12),
-            hovertemplate='<b>Domestic Tourism</b><br>Year: %{x}<br>Visitors: %{y:.1f}M<extra></extra>'
-        ))
-
-        # Add foreign tourism line
-        fig.add_trace(go.Scatter(
-            x=year_labels,
-            y=foreign_totals,
-            mode='lines+markers+text',
-            name='🌍 International Tourism',
-            line=dict(color='#4169E1', width=4),
-            marker=dict(size=10, color='#4169E1', line=dict(width=2, color='white')),
-            text=[f"{x:.1f}M" for x in foreign_totals],
-            textposition='bottom center',
-            textfont=dict(color='black', size=12),
-            hovertemplate='<b>International Tourism</b><br>Year: %{x}<br>Visitors: %{y:.1f}M<extra></extra>'
-        ))
-
-        # Add COVID-19 impact annotation
-        fig.add_annotation(
-            x='2020',
-            y=max(max(domestic_totals), max(foreign_totals)) * 0.8,
-            text="🦠 COVID-19<br>Impact",
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1,
-            arrowwidth=2,
-            arrowcolor="red",
-            font=dict(size=12, color='red'),
-            bgcolor="rgba(255,255,255,0.8)",
-            bordercolor="red",
-            borderwidth=1
-        )
-
-        fig.update_layout(
-            title=dict(
-                text="Tourism Trends: Domestic vs International Visitors (2017-2023)",
-                font=dict(size=20, color='#FF6347'),
-                x=0.25
-            ),
-            xaxis_title="Year",
-            yaxis_title="Visitors (Millions)",
-            plot_bgcolor='rgba(248,249,250,0.8)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='black'),
-            height=500,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="center",
-                x=0.5,
-                font=dict(size=14)
-            ),
-            margin=dict(l=80, r=80, t=100, b=60),
-            hovermode='x unified'
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        def build_domestic_foreign_trend_figure():
+            data = [
+                # Domestic tourism line
+                {
+                    'type': 'scatter',
+                    'x': year_labels,
+                    'y': domestic_totals,
+                    'mode': 'lines+markers+text',
+                    'name': '🇮🇳 Domestic Tourism',
+                    'line': {'color': '#FF6347', 'width': 4},
+                    'marker': {'size': 10, 'color': '#FF6347', 'line': {'width': 2, 'color': 'white'}},
+                    'text': [f"{x:.0f}M" for x in domestic_totals],
+                    'textposition': 'top center',
+                    'textfont': {'color': 'black', 'size': 12},
+                    'hovertemplate': '<b>Domestic Tourism</b><br>Year: %{x}<br>Visitors: %{y:.1f}M<extra></extra>',
+                },
+                # Foreign tourism line
+                {
+                    'type': 'scatter',
+                    'x': year_labels,
+                    'y': foreign_totals,
+                    'mode': 'lines+markers+text',
+                    'name': '🌍 International Tourism',
+                    'line': {'color': '#4169E1', 'width': 4},
+                    'marker': {'size': 10, 'color': '#4169E1', 'line': {'width': 2, 'color': 'white'}},
+                    'text': [f"{x:.1f}M" for x in foreign_totals],
+                    'textposition': 'bottom center',
+                    'textfont': {'color': 'black', 'size': 12},
+                    'hovertemplate': '<b>International Tourism</b><br>Year: %{x}<br>Visitors: %{y:.1f}M<extra></extra>',
+                },
+            ]
+
+            layout = dict(
+                # COVID-19 impact annotation
+                annotations=[dict(
+                    x='2020',
+                    y=max(max(domestic_totals), max(foreign_totals)) * 0.8,
+                    text="🦠 COVID-19<br>Impact",
+                    showarrow=True,
+                    arrowhead=2,
+                    arrowsize=1,
+                    arrowwidth=2,
+                    arrowcolor="red",
+                    font=dict(size=12, color='red'),
+                    bgcolor="rgba(255,255,255,0.8)",
+                    bordercolor="red",
+                    borderwidth=1
+                )],
+                title=dict(
+                    text="Tourism Trends: Domestic vs International Visitors (2017-2023)",
+                    font=dict(size=20, color='#FF6347'),
+                    x=0.25
+                ),
+                xaxis=dict(title=dict(text="Year")),
+                yaxis=dict(title=dict(text="Visitors (Millions)")),
+                plot_bgcolor='rgba(248,249,250,0.8)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='black'),
+                height=500,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="center",
+                    x=0.5,
+                    font=dict(size=14)
+                ),
+                margin=dict(l=80, r=80, t=100, b=60),
+                hovermode='x unified'
+            )
+            return build_figure(data, layout)
+
+        fig = cached_figure(build_domestic_foreign_trend_figure)
+
+        render_chart(fig)
 
         # Tourism Trends Analysis Narrative
         if domestic_totals and foreign_totals:
@@ -2,19 +2,12 @@ import streamlit as st
 import pandas as pd
 import os
 from PIL import Image
+from utils.image_pipeline import render_image
+from utils.prefetch import neighbor_indices, prefetch_images
 from .data_loader import clear_dance_cache
-
-@st.cache_data
-def load_and_cache_dance_image(image_path):
-    """Load and cache dance image to avoid repeated file system calls"""
-    if os.path.exists(image_path):
-        try:
-            image = Image.open(image_path)
-            return image
-        except Exception as e:
-            st.error(f"Error loading dance image {image_path}: {e}")
-            return None
-    return None
+from utils.data_version import get_data_version
+from utils.card_templates import CardTemplate
+from styles.css_styles import apply_page_theme
 
 @st.cache_data
 def get_dance_image_info(image_path):
@@ -29,6 +22,7 @@ def get_dance_image_info(image_path):
 
 def show_dance_section(dance_df):
     """Display enhanced dance forms information with slideshow and Indian dance information"""
+    apply_page_theme('dance')
     st.markdown('<h2 class="section-header">🗺️ Explore Dance Forms by State</h2>', unsafe_allow_html=True)
 
     if dance_df.empty:
@@ -74,24 +68,19 @@ def show_automatic_dance_slideshow(dance_df):
     # Get current dance
     current_dance = dances_with_images.iloc[st.session_state.slideshow_index]
 
+    # Warm the neighbouring slides in the background so ◀/▶ hit a built derivative
+    neighbor_images = dances_with_images['DOWNLOADED_DANCE_IMAGES'].iloc[
+        neighbor_indices(st.session_state.slideshow_index, len(dances_with_images))]
+    prefetch_images([f"Images/dance_photos/{image}" for image in neighbor_images], (800, 500), exact=True)
+
     # Center the slideshow content
     col1, col2, col3 = st.columns([1, 2, 1])
 
     with col2:
-        # Display image using cached loading
+        # Always show the image at a consistent size (enlarged if needed) via the derivative pipeline
         img_path = f"Images/dance_photos/{current_dance['DOWNLOADED_DANCE_IMAGES']}"
-        img = load_and_cache_dance_image(img_path)
-        if img:
-            try:
-                # Create a copy for resizing to avoid modifying cached image
-                img_copy = img.copy()
-                # Always resize image to a consistent size (enlarge if needed)
-                img_copy = img_copy.resize((800, 500), Image.Resampling.LANCZOS)
-                st.image(img_copy, use_container_width=True)
-            except Exception as e:
-                st.error(f"Error processing image: {e}")
-                show_dance_placeholder()
-        else:
+        if not render_image(img_path, (800, 500), alt=current_dance['FOLK_DANCE'], exact=True,
+                            sizes="(max-width: 640px) 100vw, 50vw"):
             show_dance_placeholder()
 
     # Simple navigation controls with better alignment
@@ -119,34 +108,6 @@ def show_automatic_dance_slideshow(dance_df):
             st.session_state.slideshow_index = (st.session_state.slideshow_index + 1) % len(dances_with_images)
             st.rerun()
 
-    # Add custom CSS for better button styling
-    st.markdown("""
-    <style>
-    div[data-testid="column"]:nth-child(2) button,
-    div[data-testid="column"]:nth-child(4) button {
-        width: 50px !important;
-        height: 38px !important;
-        border-radius: 50% !important;
-        background: #008080 !important;
-        color: white !important;
-        border: none !important;
-        font-size: 1.2rem !important;
-        font-weight: bold !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        margin: 0 auto !important;
-        transition: all 0.2s ease !important;
-    }
-
-    div[data-testid="column"]:nth-child(2) button:hover,
-    div[data-testid="column"]:nth-child(4) button:hover {
-        background: #20B2AA !important;
-        transform: scale(1.1) !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
 def show_indian_dance_info():
     """Display general information about Indian Dance"""
     st.markdown('<h3 style="color: white; text-align: center; margin: 2rem 0; font-family: Playfair Display, serif; font-size: 2rem;">A Living Heritage of Expression and Devotion</h3>', unsafe_allow_html=True)
@@ -291,17 +252,8 @@ def show_featured_state_dances(dance_df, selected_state):
         # Display main dance image using cached loading
         img_path = f"Images/dance_photos/{main_dance['DOWNLOADED_DANCE_IMAGES']}"
         if pd.notna(main_dance['DOWNLOADED_DANCE_IMAGES']):
-            img = load_and_cache_dance_image(img_path)
-            if img:
-                try:
-                    # Create a copy for thumbnail to avoid modifying cached image
-                    img_copy = img.copy()
-                    img_copy.thumbnail((400, 350), Image.Resampling.LANCZOS)
-                    st.image(img_copy, caption=main_dance['FOLK_DANCE'], use_container_width=True)
-                except Exception as e:
-                    st.error(f"Error processing image: {e}")
-                    show_dance_placeholder()
-            else:
+            if not render_image(img_path, (400, 350), caption=main_dance['FOLK_DANCE'],
+                                sizes="(max-width: 640px) 100vw, 50vw"):
                 show_dance_placeholder()
         else:
             show_dance_placeholder()
@@ -320,22 +272,36 @@ def show_featured_state_dances(dance_df, selected_state):
         st.markdown('<h3 style="color: white; text-align: center; margin: 2rem 0;">Other Dance Forms of the State</h3>', unsafe_allow_html=True)
 
         # Display other dances in a grid with better alignment
+        data_version = get_data_version(dance_df)
         cols = st.columns(2)
         for i, dance_info in enumerate(other_dances):
             with cols[i % 2]:
-                # Shorten dance name if too long and add state info
-                dance_name = dance_info['FOLK_DANCE']
-                if len(dance_name) > 15:
-                    dance_name = dance_name[:15] + "..."
-
-                st.markdown(f"""
-                <div class="dance-description-card">
-                    <h4 class="dance-description-title" style="color: #008080;">{dance_name} - {selected_state}</h4>
-                    <p class="dance-description-text">
-                        {dance_info['DESCRIPTION'][:150] + '...' if pd.notna(dance_info['DESCRIPTION']) and len(dance_info['DESCRIPTION']) > 150 else dance_info['DESCRIPTION'] if pd.notna(dance_info['DESCRIPTION']) else 'A traditional dance form from ' + selected_state}
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(DANCE_DESCRIPTION_CARD.render_cached(
+                    dance_info.name, data_version, lambda dance_info=dance_info: dance_card_fields(dance_info, selected_state)
+                ), unsafe_allow_html=True)
+
+DANCE_DESCRIPTION_CARD = CardTemplate('dance_description', """
+    <div class="dance-description-card">
+        <h4 class="dance-description-title" style="color: #008080;">$dance_name - $state</h4>
+        <p class="dance-description-text">
+            $description
+        </p>
+    </div>
+""")
+
+def dance_card_fields(dance_info, selected_state):
+    """Values for DANCE_DESCRIPTION_CARD: a shortened name and description"""
+    # Shorten dance name if too long and add state info
+    dance_name = dance_info['FOLK_DANCE']
+    if len(dance_name) > 15:
+        dance_name = dance_name[:15] + "..."
+
+    description = dance_info['DESCRIPTION']
+    if pd.isna(description):
+        description = 'A traditional dance form from ' + selected_state
+    elif len(description) > 150:
+        description = description[:150] + '...'
+    return dict(dance_name=dance_name, state=selected_state, description=description)
 
 def show_dance_placeholder():
     """Show a placeholder for dance images"""
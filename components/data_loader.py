@@ -82,6 +82,15 @@ def load_state_foreign_tourism_data():
         st.error("Datasets/State_Wise_Foreign_Tourist_Arrivals_2017_2023.csv file not found!")
         return pd.DataFrame()
 
+@st.cache_data
+def load_state_domestic_tourism_data():
+    """Load state-wise domestic tourist arrivals data"""
+    try:
+        return pd.read_csv('Datasets/State_Wise_Domestic_Tourist_Arrivals_2017_2023.csv')
+    except FileNotFoundError:
+        st.error("Datasets/State_Wise_Domestic_Tourist_Arrivals_2017_2023.csv file not found!")
+        return pd.DataFrame()
+
 @st.cache_data
 def load_centrally_protected_domestic_data():
     """Load centrally protected monuments domestic visits data"""
@@ -261,6 +270,7 @@ def clear_all_cache():
     load_ita_monthly_data.clear()
     load_state_tourism_data.clear()
     load_state_foreign_tourism_data.clear()
+    load_state_domestic_tourism_data.clear()
     load_centrally_protected_domestic_data.clear()
     load_centrally_protected_foreign_data.clear()
     load_top_monuments_domestic_data.clear()
@@ -284,6 +294,7 @@ def load_all_data():
         'ita_monthly_df': load_ita_monthly_data(),
         'state_tourism_df': load_state_tourism_data(),
         'state_foreign_tourism_df': load_state_foreign_tourism_data(),
+        'state_domestic_tourism_df': load_state_domestic_tourism_data(),
         'centrally_protected_domestic_df': load_centrally_protected_domestic_data(),
         'centrally_protected_foreign_df': load_centrally_protected_foreign_data(),
         'top_monuments_domestic_df': load_top_monuments_domestic_data(),
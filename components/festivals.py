@@ -3,18 +3,11 @@ import pandas as pd
 import plotly.express as px
 import os
 from PIL import Image
-
-@st.cache_data
-def load_and_cache_festival_image(image_path):
-    """Load and cache festival image to avoid repeated file system calls"""
-    if os.path.exists(image_path):
-        try:
-            image = Image.open(image_path)
-            return image
-        except Exception as e:
-            st.error(f"Error loading festival image {image_path}: {e}")
-            return None
-    return None
+from utils.image_pipeline import get_image_src, image_tag
+from utils.prefetch import prefetch_images
+from utils.card_templates import CardTemplate
+from utils.lite_mode import render_chart
+from utils.data_version import get_data_version
 
 @st.cache_data
 def get_festival_image_info(image_path):
@@ -183,7 +176,7 @@ def show_monthly_festival_chart(festivals_df):
     )
 
     # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+    render_chart(fig)
 
     # Add some insights with better contrasting colors
     max_month = max(monthly_counts, key=monthly_counts.get)
@@ -274,6 +267,13 @@ def show_festivals_section(festivals_df):
         festivals_displayed = len(display_df)
         current_page_num = st.session_state.current_page + 1
         total_pages = (total_festivals + festivals_per_page - 1) // festivals_per_page
+
+        # Warm the next and previous pages' card images in the background
+        for page in (st.session_state.current_page + 1, st.session_state.current_page - 1):
+            if 0 <= page < total_pages:
+                page_names = filtered_df['FESTIVAL_NAME'].iloc[page * festivals_per_page:(page + 1) * festivals_per_page]
+                prefetch_images([f"Images/Festivals_images/{FESTIVAL_IMAGE_MAPPING[name]}"
+                                 for name in page_names if name in FESTIVAL_IMAGE_MAPPING], (350, 250))
     else:
         display_df = filtered_df
         festivals_displayed = total_festivals
@@ -303,8 +303,7 @@ def show_festivals_section(festivals_df):
 
     # Display festivals in beautiful cards
     if not display_df.empty:
-        for _, festival in display_df.iterrows():
-            display_festival_card(festival)
+        display_festival_cards(display_df, get_data_version(festivals_df))
 
         # Add pagination navigation
         if show_pagination and total_pages > 1:
@@ -353,149 +352,74 @@ def show_festivals_section(festivals_df):
         """, unsafe_allow_html=True)
 
 
-def display_festival_card(festival):
-    """Display festival in a beautiful rectangular card with image on left and description on right"""
-
-    # Get image path using exact mapping with caching
-    festival_name = festival['FESTIVAL_NAME']
-    image_path = None
-
-    if festival_name in FESTIVAL_IMAGE_MAPPING:
-        image_filename = FESTIVAL_IMAGE_MAPPING[festival_name]
-        potential_path = f"Images/Festivals_images/{image_filename}"
-        image_info = get_festival_image_info(potential_path)
-        if image_info["exists"]:
-            image_path = potential_path
-
-    # Create the entire card using a different approach - custom CSS with data attributes
-    card_id = f"festival-card-{festival_name.replace(' ', '-').lower()}"
-
-    # Add custom CSS for this specific card
-    st.markdown(f"""
-    <style>
-    #{card_id} {{
-        background: white !important;
-        padding: 2rem !important;
-        margin: 2rem 0 !important;
-        border-radius: 20px !important;
-        box-shadow: 0 15px 35px rgba(0,0,0,0.15) !important;
-        border: 3px solid #4ECDC4 !important;
-        display: flex !important;
-        align-items: flex-start !important;
-        gap: 2rem !important;
-        min-height: 300px !important;
-    }}
-    #{card_id} .image-section {{
-        flex: 1 !important;
-        max-width: 350px !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        min-height: 300px !important;
-    }}
-    #{card_id} .content-section {{
-        flex: 2 !important;
-        padding-left: 1rem !important;
-    }}
-    #{card_id} .image-container {{
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        width: 100% !important;
-        height: 100% !important;
-    }}
-    #{card_id} img {{
-        border-radius: 15px !important;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.2) !important;
-        max-width: 100% !important;
-        max-height: 250px !important;
-        width: auto !important;
-        height: auto !important;
-        object-fit: contain !important;
-    }}
-    </style>
-    """, unsafe_allow_html=True)
-
-    # Get image HTML using cached loading
-    if image_path:
-        img = load_and_cache_festival_image(image_path)
-        if img:
-            try:
-                # Create a copy for thumbnail to avoid modifying cached image
-                img_copy = img.copy()
-                img_copy.thumbnail((350, 250), Image.Resampling.LANCZOS)
-                # Convert to base64 for embedding
-                import base64
-                import io
-                img_buffer = io.BytesIO()
-                img_copy.save(img_buffer, format='PNG')
-                img_str = base64.b64encode(img_buffer.getvalue()).decode()
-                image_html = f'<div class="image-container"><img src="data:image/png;base64,{img_str}" alt="{festival_name}"></div>'
-            except:
-                image_html = f"""
-                <div class="image-container">
-                    <div style="height: 250px; display: flex; align-items: center; justify-content: center;
-                                background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-                                border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.2);">
-                        <div style="text-align: center; color: white;">
-                            <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🎪</div>
-                            <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{festival_name}</div>
-                        </div>
-                    </div>
-                </div>
-                """
-        else:
-            image_html = f"""
-            <div class="image-container">
-                <div style="height: 250px; display: flex; align-items: center; justify-content: center;
-                            background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-                            border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.2);">
-                    <div style="text-align: center; color: white;">
-                        <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🎪</div>
-                        <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{festival_name}</div>
-                    </div>
-                </div>
-            </div>
-            """
-    else:
-        image_html = f"""
-        <div class="image-container">
-            <div style="height: 250px; display: flex; align-items: center; justify-content: center;
-                        background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-                        border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.2);">
-                <div style="text-align: center; color: white;">
-                    <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🎪</div>
-                    <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{festival_name}</div>
-                </div>
-            </div>
-        </div>
-        """
-
-    # Create the complete card as a single HTML block
-    st.markdown(f"""
-    <div id="{card_id}">
+FESTIVAL_CARD = CardTemplate('festival', """
+    <div id="$card_id" class="festival-list-card">
         <div class="image-section">
-            {image_html}
+            <div class="image-container">$image_html</div>
         </div>
         <div class="content-section">
             <h2 style="color: #008080; font-family: 'Playfair Display', serif;
                        font-size: 2rem; margin-bottom: 1rem; font-weight: bold;">
-                🎭 {festival['FESTIVAL_NAME']}
+                🎭 $name
             </h2>
             <div style="margin-bottom: 1.5rem;">
                 <p style="color: #20B2AA; font-weight: bold; font-size: 1.1rem; margin-bottom: 0.5rem;">
-                    📍 {festival['STATE']}
+                    📍 $state
                 </p>
                 <p style="color: #008080; font-weight: bold; font-size: 1rem; margin-bottom: 1rem;">
-                    📅 {festival['MONTH_SEASON']}
+                    📅 $month_season
                 </p>
             </div>
             <div style="color: #333; line-height: 1.6; font-family: 'Poppins', sans-serif; font-size: 0.95rem;">
-                {festival['DESCRIPTION']}
+                $description
             </div>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    <br>
+""")
+
+FESTIVAL_IMAGE_PLACEHOLDER = CardTemplate('festival_placeholder', """
+    <div style="height: 250px; display: flex; align-items: center; justify-content: center;
+                background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
+                border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.2);">
+        <div style="text-align: center; color: white;">
+            <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🎪</div>
+            <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">$name</div>
+        </div>
+    </div>
+""")
+
+def festival_card_fields(festival):
+    """Values for FESTIVAL_CARD: the image on the left and the description on the right"""
+
+    # Get image path using exact mapping with caching
+    festival_name = festival['FESTIVAL_NAME']
+    image_path = None
+
+    if festival_name in FESTIVAL_IMAGE_MAPPING:
+        image_filename = FESTIVAL_IMAGE_MAPPING[festival_name]
+        potential_path = f"Images/Festivals_images/{image_filename}"
+        image_info = get_festival_image_info(potential_path)
+        if image_info["exists"]:
+            image_path = potential_path
+
+    # Get image HTML from the shared derivative pipeline (static URL when available)
+    image_src = get_image_src(image_path, (350, 250)) if image_path else None
+    if image_src:
+        image_html = image_tag(image_src, image_path, (350, 250), alt=festival_name, sizes="(max-width: 768px) 100vw, 350px")
+    else:
+        image_html = FESTIVAL_IMAGE_PLACEHOLDER.render(name=festival_name)
+
+    return dict(card_id=f"festival-card-{festival_name.replace(' ', '-').lower()}", image_html=image_html,
+                name=festival_name, state=festival['STATE'], month_season=festival['MONTH_SEASON'],
+                description=festival['DESCRIPTION'])
+
+def display_festival_cards(festivals_df, data_version):
+    """Display every festival card as one element; their styles are in FESTIVAL_CARD_CSS
 
-    # Add spacing between cards
-    st.markdown("<br>", unsafe_allow_html=True)
+    Cards are memoized per festival row and data version, so paging back and
+    forth or switching filters reuses markup already rendered.
+    """
+    cards = [FESTIVAL_CARD.render_cached(index, data_version, lambda festival=festival: festival_card_fields(festival))
+             for index, festival in festivals_df.iterrows()]
+    st.markdown("".join(cards), unsafe_allow_html=True)
@@ -2,18 +2,11 @@ import streamlit as st
 import pandas as pd
 import os
 from PIL import Image
-
-@st.cache_data
-def load_and_cache_image(image_path):
-    """Load and cache image to avoid repeated file system calls"""
-    if os.path.exists(image_path):
-        try:
-            image = Image.open(image_path)
-            return image
-        except Exception as e:
-            st.error(f"Error loading image {image_path}: {e}")
-            return None
-    return None
+from utils.image_pipeline import image_tag, prepare_images, render_image
+from utils.card_grid import render_card_grid
+from utils.card_templates import CardTemplate
+from utils.prefetch import neighbor_indices, prefetch_images
+from utils.sprites import get_sprite, sprite_cell_html
 
 @st.cache_data
 def get_image_info(image_path):
@@ -83,10 +76,8 @@ def show_heritage_section():
     # Top states by heritage count
     top_states = heritage_df['STATE_NAME'].value_counts().head(3)
 
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.markdown(f"""
+    render_card_grid([
+        f"""
         <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
                     padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
                     margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
@@ -97,10 +88,8 @@ def show_heritage_section():
                         font-weight: bold; font-family: 'Poppins', sans-serif;">{total_sites}</p>
             <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">Documented Sites</p>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown(f"""
+        """,
+        f"""
         <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
                     padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
                     margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
@@ -111,10 +100,8 @@ def show_heritage_section():
                         font-weight: bold; font-family: 'Poppins', sans-serif;">{unique_states}</p>
             <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">States & Territories</p>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        st.markdown(f"""
+        """,
+        f"""
         <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
                     padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
                     margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
@@ -125,10 +112,8 @@ def show_heritage_section():
                         font-weight: bold; font-family: 'Poppins', sans-serif;">{unique_cities}</p>
             <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">Historic Centers</p>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        st.markdown(f"""
+        """,
+        f"""
         <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
                     padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
                     margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
@@ -139,7 +124,9 @@ def show_heritage_section():
                         font-weight: bold; font-family: 'Poppins', sans-serif;">{temple_count}</p>
             <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">Divine Architecture</p>
         </div>
-        """, unsafe_allow_html=True)
+        """,
+    ], columns=4, min_width=200)
+
     # Interactive Heritage Slideshow
     show_heritage_slideshow()
 
@@ -272,15 +259,18 @@ def show_heritage_slideshow():
     # Display current slide
     current_site = featured_sites[st.session_state.heritage_slide_index]
 
+    # Warm the neighbouring slides in the background so Previous/Next hit a built derivative
+    prefetch_images([featured_sites[i]["image"] for i in neighbor_indices(st.session_state.heritage_slide_index, len(featured_sites))],
+                    (800, 600))
+
     # Create slideshow display
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        # Use cached image loading
-        image = load_and_cache_image(current_site["image"])
-        if image:
-            st.image(image, use_container_width=True, caption=f"{current_site['name']}, {current_site['location']}")
-        else:
+        # Serve a slideshow-sized derivative instead of the full-resolution original
+        if not render_image(current_site["image"], (800, 600),
+                            caption=f"{current_site['name']}, {current_site['location']}",
+                            sizes="(max-width: 640px) 100vw, 50vw"):
             st.markdown(f"""
             <div style="background: linear-gradient(135deg, #008080, #20B2AA); color: white;
                         padding: 8rem 2rem; border-radius: 15px; text-align: center; margin: 1rem 0;">
@@ -430,6 +420,9 @@ def show_heritage_gallery(heritage_df):
             key="heritage_city_filter"
         )
 
+    use_sprites = st.toggle("🧩 Contact-sheet thumbnails", key="heritage_gallery_sprites",
+                            help="Load each page of thumbnails as a single image - faster on slow connections")
+
     # Filter data based on selections
     filtered_df = heritage_df.copy()
 
@@ -445,7 +438,8 @@ def show_heritage_gallery(heritage_df):
     # Reset pagination when filters change
     current_filter_key = f"{selected_state}_{selected_type}_{selected_city}"
     if 'last_heritage_filter' not in st.session_state or st.session_state.last_heritage_filter != current_filter_key:
-        st.session_state.heritage_sites_shown = 20  # Reset to initial page size
+        st.session_state.heritage_gallery_pages = 1  # Reset to the first page
+        st.session_state.heritage_gallery_first_page = 0
         st.session_state.last_heritage_filter = current_filter_key
 
     # Display filtered results
@@ -466,329 +460,14 @@ def show_heritage_gallery(heritage_df):
         </div>
         """, unsafe_allow_html=True)
 
-        # Enhanced Pinterest-style CSS for better responsive design
-        st.markdown("""
-        <style>
-        /* Pinterest-style masonry layout */
-        .pinterest-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            grid-gap: 20px;
-            margin: 20px 0;
-            padding: 0 10px;
-        }
-
-        /* Responsive breakpoints */
-        @media (max-width: 1400px) {
-            .pinterest-container {
-                grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            }
-        }
-
-        @media (max-width: 1200px) {
-            .pinterest-container {
-                grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-                grid-gap: 15px;
-            }
-        }
-
-        @media (max-width: 768px) {
-            .pinterest-container {
-                grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-                grid-gap: 12px;
-                padding: 0 5px;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .pinterest-container {
-                grid-template-columns: 1fr;
-                grid-gap: 10px;
-                padding: 0;
-            }
-        }
-
-        /* Pinterest card styling */
-        .pinterest-card {
-            background: white;
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-            border: 2px solid #20B2AA;
-            transition: all 0.1s ease;
-            cursor: pointer;
-            position: relative;
-        }
-
-        .pinterest-card:hover {
-            transform: translateY(-8px) scale(1.02);
-            box-shadow: 0 20px 40px rgba(0,128,128,0.3);
-            border-color: #008080;
-        }
-
-        .pinterest-card img {
-            width: 100%;
-            height: auto;
-            display: block;
-            transition: transform 0.3s ease;
-        }
-
-        .pinterest-card:hover img {
-            transform: scale(1.05);
-        }
-
-        .pinterest-card-content {
-            padding: 15px;
-            background: white;
-        }
-
-        .pinterest-card-title {
-            color: #008080;
-            font-size: 1.1rem;
-            font-weight: 700;
-            margin-bottom: 8px;
-            font-family: 'Playfair Display', serif;
-            line-height: 1.3;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }
-
-        .pinterest-card-location {
-            color: #666;
-            font-size: 0.9rem;
-            margin-bottom: 10px;
-            font-family: 'Poppins', sans-serif;
-            display: flex;
-            align-items: center;
-        }
-
-        .pinterest-card-type {
-            background: linear-gradient(135deg, #008080, #20B2AA);
-            color: white;
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: 600;
-            display: inline-block;
-            font-family: 'Poppins', sans-serif;
-            text-transform: capitalize;
-            box-shadow: 0 2px 8px rgba(0,128,128,0.3);
-        }
-
-        .pinterest-placeholder {
-            width: 100%;
-            height: 200px;
-            background: linear-gradient(135deg, #008080, #20B2AA);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 1.2rem;
-            font-family: 'Poppins', sans-serif;
-            text-align: center;
-            position: relative;
-        }
-
-        .pinterest-placeholder::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(45deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%);
-            animation: shimmer 2s infinite;
-        }
-
-        @keyframes shimmer {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-
-        /* Streamlit column adjustments for Pinterest layout */
-        .stColumn > div {
-            padding: 0 !important;
-        }
-
-        /* Remove default Streamlit margins */
-        .element-container {
-            margin-bottom: 0 !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Create Pinterest-style gallery using Streamlit columns for better performance
-        total_sites = len(filtered_df)
-
-        # Add pagination for better performance with large datasets
-        sites_per_page = 20  # Limit initial load for better performance
-
-        # Add a "Load More" functionality
-        if 'heritage_sites_shown' not in st.session_state:
-            st.session_state.heritage_sites_shown = sites_per_page
-
-        sites_to_show = min(st.session_state.heritage_sites_shown, total_sites)
-        display_df = filtered_df.head(sites_to_show)
-
-        # Display Pinterest-style gallery using Streamlit's native components
-        # This approach is more efficient than base64 encoding all images
-
-        # Create a container for the Pinterest layout
-        st.markdown('<div class="pinterest-container">', unsafe_allow_html=True)
-
-        # Use Streamlit columns to create a masonry-like effect
-        # Responsive column count based on screen size
-        # Note: Streamlit doesn't have built-in responsive detection, so we use a reasonable default
-        num_columns = 4  # Default for desktop
-        cols = st.columns(num_columns, gap="small")
-
-        # Distribute sites across columns for masonry effect
-        for idx, (_, site) in enumerate(display_df.iterrows()):
-            col_idx = idx % num_columns
-
-            with cols[col_idx]:
-                # Create Pinterest-style card
-                with st.container():
-                    # Custom CSS for this specific card
-                    st.markdown(f"""
-                    <div class="pinterest-card" style="
-                        break-inside: avoid;
-                        margin-bottom: 20px;
-                        background: white;
-                        border-radius: 15px;
-                        overflow: hidden;
-                        box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-                        border: 2px solid #20B2AA;
-                        transition: transform 0.3s ease, box-shadow 0.3s ease;
-                    ">
-                    """, unsafe_allow_html=True)
-
-                    # Display image
-                    image_path = f"Images/heritage_images/{site['IMAGE_NAME']}"
-                    image = load_and_cache_image(image_path)
-
-                    if image:
-                        st.image(image, use_container_width=True, caption="")
-                    else:
-                        st.markdown(f"""
-                        <div style="
-                            width: 100%;
-                            height: 200px;
-                            background: linear-gradient(135deg, #008080, #20B2AA);
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            color: white;
-                            font-size: 1.2rem;
-                            font-family: 'Poppins', sans-serif;
-                            text-align: center;
-                        ">
-                            🏛️<br>{site["HERITAGE_NAME"][:20]}...
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    # Card content
-                    st.markdown(f"""
-                    <div style="padding: 5px;">
-                        <div style="
-                            background: linear-gradient(135deg, #004d4d);
-                            color: white;
-                            padding: 4px 10px;
-                            border-radius: 8px;
-                            font-size: 1rem;
-                            font-weight: 600;
-                            margin-bottom: 10px;
-                            font-family: 'Poppins', sans-serif;
-                            line-height: 1.3;
-                            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.5);
-                        ">{site["HERITAGE_NAME"]}<br>
-                        <div style="
-                            background: white;
-                            color: black;
-                            padding: 4px 12px;
-                            border-radius: 8px;
-                            font-size: 0.8rem;
-                            margin-top:10px;
-                            margin-bottom: 10px;
-                            font-family: 'Poppins', sans-serif;
-                            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-                        ">📍 {site["CITY_NAME"]}, {site["STATE_NAME"]}</div>
-                        <div style="
-                            background: white;
-                            color: black;
-                            padding: 4px 12px;
-                            margin-bottom:8px;
-                            border-radius: 8px;
-                            font-size: 0.8rem;
-                            display: inline-block;
-                            font-family: 'Poppins', sans-serif;
-                            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-                        ">{site["HERITAGE_TYPE"]}</div></div>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown('</div>', unsafe_allow_html=True)
-
-        # Status text and Load More button on same line
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            # Create a container with both text and button on same line
-            if sites_to_show < total_sites:
-                col_text, col_button = st.columns([2, 1])
-                with col_text:
-                    st.markdown(f"""
-                    <div style="text-align: center; padding: 0.5rem;">
-                        <span style="color: white; font-family: 'Poppins', sans-serif; font-size: 1.1rem;
-                                   text-shadow: 2px 2px 4px rgba(0,0,0,0.5); font-weight: 600;">
-                            📊 Showing {sites_to_show} of {total_sites} heritage sites
-                        </span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                with col_button:
-                    # Add custom CSS for button styling
-                    st.markdown("""
-                    <style>
-                    div.stButton > button[key="load_more_heritage"] {
-                        background: linear-gradient(135deg, #008080, #20B2AA) !important;
-                        color: white !important;
-                        border: none !important;
-                        border-radius: 25px !important;
-                        padding: 0.5rem 1rem !important;
-                        font-weight: 600 !important;
-                        font-family: 'Poppins', sans-serif !important;
-                        box-shadow: 0 4px 12px rgba(0,128,128,0.3) !important;
-                        transition: all 0.3s ease !important;
-                    }
-                    div.stButton > button[key="load_more_heritage"]:hover {
-                        background: linear-gradient(135deg, #20B2AA, #008080) !important;
-                        transform: translateY(-2px) !important;
-                        box-shadow: 0 6px 16px rgba(0,128,128,0.4) !important;
-                    }
-                    </style>
-                    """, unsafe_allow_html=True)
-
-                    if st.button(f"🔄 Load 20 More",
-                               key="load_more_heritage",
-                               help="Load more heritage sites"):
-                        st.session_state.heritage_sites_shown += sites_per_page
-                        st.rerun()
-            else:
-                st.markdown(f"""
-                        <div style="background: linear-gradient(135deg, #008080, #20B2AA);
-                            color: white;
-                            padding: 0.5rem 0.5rem; border-radius: 15px;
-                            text-align: center;
-                            font-size: 1.2rem;
-                            font-family: 'Poppins', sans-serif;
-                            font-weight: 600;
-                            margin: 1rem 0;">
-                            ✨ Displaying all {total_sites} heritage sites
-                        </div>
-                        """, unsafe_allow_html=True)
+        # Render the gallery as a sliding window of pre-built pages. Each page is one
+        # cached HTML block, so pressing "Load More" only builds the new page; pages
+        # already on screen are re-emitted from the cache without being rebuilt
+        gallery_sites = tuple(
+            filtered_df[['HERITAGE_NAME', 'CITY_NAME', 'STATE_NAME', 'HERITAGE_TYPE', 'IMAGE_NAME']]
+            .itertuples(index=False, name=None)
+        )
+        show_heritage_gallery_pages(gallery_sites, use_sprites)
     else:
         st.markdown("""
         <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
@@ -807,6 +486,164 @@ def show_heritage_gallery(heritage_df):
         </div>
         """, unsafe_allow_html=True)
 
+# Gallery paging: cards are rendered GALLERY_PAGE_SIZE at a time and at most
+# GALLERY_MAX_LIVE_PAGES pages stay in the DOM; older pages collapse behind a
+# "Show Earlier" button so deep scrolling costs the same as the first page
+GALLERY_PAGE_SIZE = 20
+GALLERY_MAX_LIVE_PAGES = 5
+GALLERY_SPRITE_CELL = (480, 360)
+# Rendered card width at the .pinterest-container breakpoints, for srcset selection
+GALLERY_IMAGE_SIZES = "(max-width: 480px) 100vw, (max-width: 768px) 50vw, (max-width: 1200px) 33vw, 25vw"
+
+def gallery_image_path(image_name):
+    """Path of a gallery image, or None when the site has no image"""
+    return f"Images/heritage_images/{image_name}" if pd.notna(image_name) else None
+
+GALLERY_CARD = CardTemplate('heritage_gallery', """
+    <div class="pinterest-card" style="break-inside: avoid; margin-bottom: 20px;">
+        $image_html
+        <div style="padding: 5px;">
+            <div style="
+                background: linear-gradient(135deg, #004d4d);
+                color: white;
+                padding: 4px 10px;
+                border-radius: 8px;
+                font-size: 1rem;
+                font-weight: 600;
+                margin-bottom: 10px;
+                font-family: 'Poppins', sans-serif;
+                line-height: 1.3;
+                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.5);
+            ">$heritage_name<br>
+            <div style="
+                background: white;
+                color: black;
+                padding: 4px 12px;
+                border-radius: 8px;
+                font-size: 0.8rem;
+                margin-top:10px;
+                margin-bottom: 10px;
+                font-family: 'Poppins', sans-serif;
+                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+            ">📍 $city_name, $state_name</div>
+            <div style="
+                background: white;
+                color: black;
+                padding: 4px 12px;
+                margin-bottom:8px;
+                border-radius: 8px;
+                font-size: 0.8rem;
+                display: inline-block;
+                font-family: 'Poppins', sans-serif;
+                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+            ">$heritage_type</div></div>
+        </div>
+    </div>
+""")
+
+def build_gallery_card_html(site, image_src, sprite=None):
+    """Build the HTML for one Pinterest-style gallery card"""
+    heritage_name, city_name, state_name, heritage_type, _ = site
+
+    sprite_html = sprite_cell_html(sprite, gallery_image_path(site[4]), alt=heritage_name)
+    if sprite_html:
+        image_html = sprite_html
+    elif image_src:
+        image_html = image_tag(image_src, gallery_image_path(site[4]), (480, 480), alt=heritage_name, lazy=True,
+                               sizes=GALLERY_IMAGE_SIZES)
+    else:
+        image_html = f'<div class="pinterest-placeholder">🏛️<br>{str(heritage_name)[:20]}...</div>'
+
+    return GALLERY_CARD.render(image_html=image_html, heritage_name=heritage_name, city_name=city_name,
+                               state_name=state_name, heritage_type=heritage_type)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def build_gallery_page_html(page_sites, use_sprites=False):
+    """Build (once) the HTML block for one page of gallery cards"""
+    image_paths = [gallery_image_path(site[4]) for site in page_sites]
+    if use_sprites:
+        # One contact sheet for the whole page: a single transfer and decode in the browser
+        sprite = get_sprite(image_paths, GALLERY_SPRITE_CELL)
+        image_srcs = [None] * len(page_sites)
+    else:
+        # Decode and resize the page's images together on the worker pool
+        sprite = None
+        image_srcs, _ = prepare_images(image_paths, (480, 480))
+    cards_html = "".join(build_gallery_card_html(site, image_src, sprite)
+                         for site, image_src in zip(page_sites, image_srcs))
+    return f'<div class="pinterest-container">{cards_html}</div>'
+
+def _load_more_heritage_sites():
+    """Append a page to the gallery, dropping the oldest live page past the cap"""
+    st.session_state.heritage_gallery_pages += 1
+    live_pages = st.session_state.heritage_gallery_pages - st.session_state.heritage_gallery_first_page
+    if live_pages > GALLERY_MAX_LIVE_PAGES:
+        st.session_state.heritage_gallery_first_page += 1
+
+def _show_earlier_heritage_sites():
+    """Slide the live window back by one page"""
+    st.session_state.heritage_gallery_first_page -= 1
+    st.session_state.heritage_gallery_pages -= 1
+
+@st.fragment
+def show_heritage_gallery_pages(gallery_sites, use_sprites=False):
+    """Render the live window of gallery pages and the paging controls"""
+    if 'heritage_gallery_pages' not in st.session_state:
+        st.session_state.heritage_gallery_pages = 1
+        st.session_state.heritage_gallery_first_page = 0
+
+    total_sites = len(gallery_sites)
+    total_pages = max(1, -(-total_sites // GALLERY_PAGE_SIZE))
+    last_page = min(st.session_state.heritage_gallery_pages, total_pages)
+    first_page = min(st.session_state.heritage_gallery_first_page, last_page - 1)
+
+    if first_page > 0:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.button(f"⬆️ Show Earlier Sites ({first_page * GALLERY_PAGE_SIZE} hidden)",
+                      key="show_earlier_heritage",
+                      on_click=_show_earlier_heritage_sites,
+                      use_container_width=True)
+
+    for page in range(first_page, last_page):
+        page_sites = gallery_sites[page * GALLERY_PAGE_SIZE:(page + 1) * GALLERY_PAGE_SIZE]
+        st.markdown(build_gallery_page_html(page_sites, use_sprites), unsafe_allow_html=True)
+
+    sites_to_show = min(last_page * GALLERY_PAGE_SIZE, total_sites)
+
+    # Status text and Load More button on same line
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if sites_to_show < total_sites:
+            col_text, col_button = st.columns([2, 1])
+            with col_text:
+                st.markdown(f"""
+                <div style="text-align: center; padding: 0.5rem;">
+                    <span style="color: white; font-family: 'Poppins', sans-serif; font-size: 1.1rem;
+                               text-shadow: 2px 2px 4px rgba(0,0,0,0.5); font-weight: 600;">
+                        📊 Showing {sites_to_show} of {total_sites} heritage sites
+                    </span>
+                </div>
+                """, unsafe_allow_html=True)
+            with col_button:
+                st.button(f"🔄 Load {GALLERY_PAGE_SIZE} More",
+                          key="load_more_heritage",
+                          help="Load more heritage sites",
+                          on_click=_load_more_heritage_sites)
+        else:
+            st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #008080, #20B2AA);
+                        color: white;
+                        padding: 0.5rem 0.5rem; border-radius: 15px;
+                        text-align: center;
+                        font-size: 1.2rem;
+                        font-family: 'Poppins', sans-serif;
+                        font-weight: 600;
+                        margin: 1rem 0;">
+                        ✨ Displaying all {total_sites} heritage sites
+                    </div>
+                    """, unsafe_allow_html=True)
+
 # Note: display_heritage_gallery_card function removed - now using CSS Grid approach
 
 def show_regional_heritage_insights(heritage_df):
@@ -822,53 +659,40 @@ def show_regional_heritage_insights(heritage_df):
     state_counts = heritage_df['STATE_NAME'].value_counts().head(5)
     heritage_type_counts = heritage_df['HERITAGE_TYPE'].value_counts().head(6)
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("""
+    def insight_header(title):
+        return f"""
         <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
                     padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
                     margin-bottom: 1rem; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
                     border: 2px solid #20B2AA;">
             <h5 style="color: #008080; margin-bottom: 1.5rem; font-size: 1.4rem; font-weight: 600;
-                       font-family: 'Poppins', sans-serif; text-align: center;">🏆 Heritage Powerhouses</h5>
+                       font-family: 'Poppins', sans-serif; text-align: center;">{title}</h5>
         </div>
-        """, unsafe_allow_html=True)
+        """
+
+    def insight_row(text):
+        return f"""
+        <div style="background: rgba(255,255,255,0.9); padding: 1rem; border-radius: 10px;
+                    margin-bottom: 0.5rem; border-left: 4px solid #20B2AA;">
+            <p style="margin: 0; color: #333; font-family: 'Poppins', sans-serif;">
+                {text}
+            </p>
+        </div>
+        """
 
-        for i, (state, count) in enumerate(state_counts.items()):
-            rank_emoji = ["🥇", "🥈", "🥉", "🏅", "⭐"][i]
-            st.markdown(f"""
-            <div style="background: rgba(255,255,255,0.9); padding: 1rem; border-radius: 10px;
-                        margin-bottom: 0.5rem; border-left: 4px solid #20B2AA;">
-                <p style="margin: 0; color: #333; font-family: 'Poppins', sans-serif;">
-                    {rank_emoji} <strong>{state}</strong>: {count} heritage sites
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+    powerhouses = [insight_header("🏆 Heritage Powerhouses")]
+    for i, (state, count) in enumerate(state_counts.items()):
+        rank_emoji = ["🥇", "🥈", "🥉", "🏅", "⭐"][i]
+        powerhouses.append(insight_row(f"{rank_emoji} <strong>{state}</strong>: {count} heritage sites"))
 
-    with col2:
-        st.markdown("""
-        <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
-                    padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
-                    margin-bottom: 1rem; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-                    border: 2px solid #20B2AA;">
-            <h5 style="color: #008080; margin-bottom: 1.5rem; font-size: 1.4rem; font-weight: 600;
-                       font-family: 'Poppins', sans-serif; text-align: center;">🏛️ Heritage Categories</h5>
-        </div>
-        """, unsafe_allow_html=True)
+    type_emojis = {"Temple": "🕉️", "Monument": "🏛️", "Palace": "👑", "Fort": "🏰", "Church": "⛪", "Mosque": "🕌"}
 
-        type_emojis = {"Temple": "🕉️", "Monument": "🏛️", "Palace": "👑", "Fort": "🏰", "Church": "⛪", "Mosque": "🕌"}
+    categories = [insight_header("🏛️ Heritage Categories")]
+    for heritage_type, count in heritage_type_counts.items():
+        emoji = type_emojis.get(heritage_type, "🏛️")
+        categories.append(insight_row(f"{emoji} <strong>{heritage_type}</strong>: {count} sites"))
 
-        for heritage_type, count in heritage_type_counts.items():
-            emoji = type_emojis.get(heritage_type, "🏛️")
-            st.markdown(f"""
-            <div style="background: rgba(255,255,255,0.9); padding: 1rem; border-radius: 10px;
-                        margin-bottom: 0.5rem; border-left: 4px solid #20B2AA;">
-                <p style="margin: 0; color: #333; font-family: 'Poppins', sans-serif;">
-                    {emoji} <strong>{heritage_type}</strong>: {count} sites
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+    render_card_grid([f"<div>{''.join(powerhouses)}</div>", f"<div>{''.join(categories)}</div>"], columns=2)
 
     # Heritage storytelling insights
     st.markdown("""
@@ -1,8 +1,51 @@
 import streamlit as st
 import pandas as pd
 import os
-from PIL import Image
-from utils.helpers import create_india_map, create_tourism_growth_trend_chart, create_year_over_year_growth_chart, create_decade_comparison_chart, create_gdp_contribution_chart, create_employment_trends_chart
+from utils.image_pipeline import get_image_src, image_tag
+from utils.sprites import get_sprite, sprite_cell_html
+from utils.data_version import get_data_version
+from components.data_loader import load_state_domestic_tourism_data, load_state_foreign_tourism_data
+from utils.helpers import create_animated_india_map, create_india_map, create_tourism_growth_trend_chart, create_year_over_year_growth_chart, create_decade_comparison_chart, create_gdp_contribution_chart, create_employment_trends_chart
+from utils.lite_mode import render_chart
+from utils.card_grid import render_card_grid
+from utils.card_templates import CardTemplate
+
+METRIC_CARD = CardTemplate('home_metric', """
+    <div class="metric-card">
+        <div class="metric-icon">$icon</div>
+        <div class="metric-number">$number</div>
+        <div class="metric-label">$label</div>
+        <div class="metric-sublabel">$sublabel</div>
+    </div>
+""")
+
+# Festival, heritage and dance highlight cards share one layout; $kind picks the class names
+HIGHLIGHT_CARD = CardTemplate('home_highlight', """
+    <div class="enhanced-$kind-card">
+        <div class="$kind-card-header">
+            $image_html
+            <div class="$kind-card-overlay">
+                <div class="$kind-card-category">$category</div>
+            </div>
+        </div>
+        <div class="$kind-card-content">
+            <h4 class="$kind-card-title">$title</h4>
+            <div class="$kind-card-details">
+                <div class="$kind-detail-item">
+                    <span class="detail-icon">📍</span>
+                    <span class="detail-text">$location</span>
+                </div>
+                <div class="$kind-detail-item">
+                    <span class="detail-icon">$detail_icon</span>
+                    <span class="detail-text">$detail</span>
+                </div>
+            </div>
+            <p class="$kind-card-description">
+                $description
+            </p>
+        </div>
+    </div>
+""")
 
 def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, tourism_employment_df=None):
     """Display enhanced homepage with overview including GDP and employment stats"""
@@ -29,23 +72,11 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             latest_gdp_contribution = tourism_gdp_df['DIRECT_CONTRIBUTION_GDP_PERCENT'].iloc[-1]
             latest_year = tourism_gdp_df['YEAR'].iloc[-1]
             first_year = tourism_gdp_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">💰</div>
-                <div class="metric-number">{latest_gdp_contribution:.1f}%</div>
-                <div class="metric-label">GDP Contribution</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="💰", number=f"{latest_gdp_contribution:.1f}%", label="GDP Contribution",
+                                           sublabel=f"Since {first_year} | Latest: {latest_year}"), unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">💰</div>
-                <div class="metric-number">2.6%</div>
-                <div class="metric-label">GDP Contribution</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="💰", number="2.6%", label="GDP Contribution",
+                                           sublabel="Since 2015-16"), unsafe_allow_html=True)
 
     with col6:
         # Tourism employment
@@ -53,23 +84,11 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             latest_employment = tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'].iloc[-1]
             latest_year = tourism_employment_df['YEAR'].iloc[-1]
             first_year = tourism_employment_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">👥</div>
-                <div class="metric-number">{latest_employment:.1f}M</div>
-                <div class="metric-label">Tourism Jobs</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="👥", number=f"{latest_employment:.1f}M", label="Tourism Jobs",
+                                           sublabel=f"Since {first_year} | Latest: {latest_year}"), unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">👥</div>
-                <div class="metric-number">33M</div>
-                <div class="metric-label">Tourism Jobs</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="👥", number="33M", label="Tourism Jobs",
+                                           sublabel="Since 2015-16"), unsafe_allow_html=True)
 
     with col7:
         # Total tourism employment (direct + indirect)
@@ -77,23 +96,11 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             total_employment = tourism_employment_df['DIRECT_INDIRECT_EMPLOYMENT_MILLION'].iloc[-1]
             latest_year = tourism_employment_df['YEAR'].iloc[-1]
             first_year = tourism_employment_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">🏢</div>
-                <div class="metric-number">{total_employment:.1f}M</div>
-                <div class="metric-label">Total Tourism Employment</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="🏢", number=f"{total_employment:.1f}M", label="Total Tourism Employment",
+                                           sublabel=f"Since {first_year} | Latest: {latest_year}"), unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">🏢</div>
-                <div class="metric-number">76M</div>
-                <div class="metric-label">Total Tourism Employment</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="🏢", number="76M", label="Total Tourism Employment",
+                                           sublabel="Since 2015-16"), unsafe_allow_html=True)
 
     with col8:
         # Tourism's share in total employment
@@ -101,23 +108,11 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             employment_share = tourism_employment_df['DIRECT_INDIRECT_SHARE_PERCENT'].iloc[-1]
             latest_year = tourism_employment_df['YEAR'].iloc[-1]
             first_year = tourism_employment_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">📊</div>
-                <div class="metric-number">{employment_share:.1f}%</div>
-                <div class="metric-label">Employment Share</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="📊", number=f"{employment_share:.1f}%", label="Employment Share",
+                                           sublabel=f"Since {first_year} | Latest: {latest_year}"), unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">📊</div>
-                <div class="metric-number">12.6%</div>
-                <div class="metric-label">Employment Share</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(METRIC_CARD.render(icon="📊", number="12.6%", label="Employment Share",
+                                           sublabel="Since 2015-16"), unsafe_allow_html=True)
 
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -129,7 +124,20 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
 
     # Create an interactive map of India with state-wise tourism data
     if not state_tourism_df.empty:
-        create_india_map(state_tourism_df)
+        map_col1, map_col2 = st.columns(2)
+        with map_col1:
+            map_mode = st.radio("Map view", ["Total 2017-2023", "Year by year"], horizontal=True, key='home_map_mode')
+        if map_mode == "Year by year":
+            with map_col2:
+                segment = st.radio("Arrivals", ["Total", "Domestic", "Foreign"], horizontal=True, key='home_map_segment')
+            segment_df = {
+                "Total": lambda: state_tourism_df,
+                "Domestic": load_state_domestic_tourism_data,
+                "Foreign": load_state_foreign_tourism_data,
+            }[segment]()
+            create_animated_india_map(segment_df, segment)
+        else:
+            create_india_map(state_tourism_df)
 
     # Display cultural highlights in an attractive grid
     show_cultural_highlights(festivals_df)
@@ -155,6 +163,8 @@ def show_cultural_highlights(festivals_df):
         return
 
     # Enhanced Cultural Highlights with tabs for different categories
+    use_sprites = st.toggle("🧩 Contact-sheet thumbnails", key="home_highlight_sprites",
+                            help="Load each strip of thumbnails as a single image - faster on slow connections")
 
     # Create tabs for different cultural categories
     tab1, tab2, tab3 = st.tabs(["🎭 **Festivals**", "🏛️ **Heritage**", "💃 **Dance Forms**"])
@@ -163,10 +173,10 @@ def show_cultural_highlights(festivals_df):
         show_festival_highlights(festivals_df)
 
     with tab2:
-        show_heritage_highlights()
+        show_heritage_highlights(use_sprites)
 
     with tab3:
-        show_dance_highlights()
+        show_dance_highlights(use_sprites)
 
 def show_festival_highlights(festivals_df):
     """Display festival highlights with enhanced visual design"""
@@ -203,90 +213,49 @@ def show_festival_highlights(festivals_df):
             })
         highlight_festivals = pd.DataFrame(fallback_data)
 
-    # Create enhanced festival cards
-    cols = st.columns(3)
-
-    for idx, festival in enumerate(highlight_festivals.iterrows()):
-        col_idx = idx % 3
-        festival_data = festival[1]
-
-        with cols[col_idx]:
-            # Create enhanced festival card
-            festival_name = festival_data['FESTIVAL_NAME'].replace(' ', '_').lower()
-            possible_images = [
-                f"Images/Festivals_images/{festival_name}-national.jpg",
-                f"Images/Festivals_images/{festival_name}-national.jpeg",
-                f"Images/Festivals_images/{festival_name}.jpg",
-                f"Images/Festivals_images/{festival_name}.jpeg",
-                f"Images/Festivals_images/{festival_data['FESTIVAL_NAME']}.jpg",
-                f"Images/Festivals_images/{festival_data['FESTIVAL_NAME']}.jpeg",
-                f"Images/Festivals_images/{festival_data['FESTIVAL_NAME'].replace(' ', '_')}.jpg",
-                f"Images/Festivals_images/{festival_data['FESTIVAL_NAME'].replace(' ', '_')}.jpeg"
-            ]
-
-            image_found = False
-            image_html = ""
-
-            for img_path in possible_images:
-                if os.path.exists(img_path):
-                    try:
-                        img = Image.open(img_path)
-                        # Convert image to base64 for embedding
-                        import base64
-                        import io
-
-                        # Resize image
-                        img.thumbnail((400, 250), Image.Resampling.LANCZOS)
-
-                        # Convert to base64
-                        buffered = io.BytesIO()
-                        img.save(buffered, format="JPEG")
-                        img_str = base64.b64encode(buffered.getvalue()).decode()
-
-                        image_html = f'<img src="data:image/jpeg;base64,{img_str}" class="festival-card-image" alt="{festival_data["FESTIVAL_NAME"]}">'
-                        image_found = True
-                        break
-                    except:
-                        continue
-
-            if not image_found:
-                # Create enhanced placeholder
-                image_html = f"""
-                <div class="festival-card-placeholder">
-                    <div class="placeholder-icon">🎪</div>
-                    <div class="placeholder-text">Festival Image</div>
-                </div>
-                """
-
-            # Enhanced festival card with animations and better styling
-            st.markdown(f"""
-            <div class="enhanced-festival-card">
-                <div class="festival-card-header">
-                    {image_html}
-                    <div class="festival-card-overlay">
-                        <div class="festival-card-category">🎭 Festival</div>
-                    </div>
-                </div>
-                <div class="festival-card-content">
-                    <h4 class="festival-card-title">{festival_data['FESTIVAL_NAME']}</h4>
-                    <div class="festival-card-details">
-                        <div class="festival-detail-item">
-                            <span class="detail-icon">📍</span>
-                            <span class="detail-text">{festival_data['STATE']}</span>
-                        </div>
-                        <div class="festival-detail-item">
-                            <span class="detail-icon">📅</span>
-                            <span class="detail-text">{festival_data['MONTH_SEASON']}</span>
-                        </div>
-                    </div>
-                    <p class="festival-card-description">
-                        {festival_data['DESCRIPTION'][:120]}...
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    # Cards are memoized per festival and data version
+    data_version = get_data_version(highlight_festivals)
+    cards = [HIGHLIGHT_CARD.render_cached(festival_data['FESTIVAL_NAME'], data_version,
+                                          lambda festival_data=festival_data: festival_highlight_fields(festival_data))
+             for _, festival_data in highlight_festivals.iterrows()]
 
-def show_heritage_highlights():
+    render_card_grid(cards)
+
+FESTIVAL_HIGHLIGHT_PLACEHOLDER = CardTemplate('home_festival_placeholder', """
+    <div class="festival-card-placeholder">
+        <div class="placeholder-icon">🎪</div>
+        <div class="placeholder-text">Festival Image</div>
+    </div>
+""")
+
+def festival_highlight_fields(festival_data):
+    """Values for a festival HIGHLIGHT_CARD, with the first image found for the festival"""
+    festival_name = festival_data['FESTIVAL_NAME'].replace(' ', '_').lower()
+    possible_images = [
+        f"Images/Festivals_images/{festival_name}-national.jpg",
+        f"Images/Festivals_images/{festival_name}-national.jpeg",
+        f"Images/Festivals_images/{festival_name}.jpg",
+        f"Images/Festivals_images/{festival_name}.jpeg",
+        f"Images/Festivals_images/{festival_data['FESTIVAL_NAME']}.jpg",
+        f"Images/Festivals_images/{festival_data['FESTIVAL_NAME']}.jpeg",
+        f"Images/Festivals_images/{festival_data['FESTIVAL_NAME'].replace(' ', '_')}.jpg",
+        f"Images/Festivals_images/{festival_data['FESTIVAL_NAME'].replace(' ', '_')}.jpeg"
+    ]
+
+    # Create enhanced placeholder unless an image is found
+    image_html = FESTIVAL_HIGHLIGHT_PLACEHOLDER.render()
+    for img_path in possible_images:
+        image_src = get_image_src(img_path, (400, 250))
+        if image_src:
+            image_html = image_tag(image_src, img_path, (400, 250), alt=festival_data["FESTIVAL_NAME"],
+                                   css_class="festival-card-image", sizes="(max-width: 640px) 100vw, 33vw")
+            break
+
+    return dict(kind='festival', image_html=image_html, category='🎭 Festival', title=festival_data['FESTIVAL_NAME'],
+                location=festival_data['STATE'], detail_icon='📅', detail=festival_data['MONTH_SEASON'],
+                description=f"{festival_data['DESCRIPTION'][:120]}...")
+
+def show_heritage_highlights(use_sprites=False):
     """Display heritage site highlights"""
 
     heritage_sites = [
@@ -316,73 +285,32 @@ def show_heritage_highlights():
         }
     ]
 
-    cols = st.columns(3)
-
-    for idx, site in enumerate(heritage_sites):
-        col_idx = idx % 3
-
-        with cols[col_idx]:
-            # Try to load and display heritage image
-            image_html = ""
-            if os.path.exists(site['image_path']):
-                try:
-                    img = Image.open(site['image_path'])
-                    # Convert image to base64 for embedding
-                    import base64
-                    import io
-
-                    # Resize image
-                    img.thumbnail((400, 250), Image.Resampling.LANCZOS)
-
-                    # Convert to base64
-                    buffered = io.BytesIO()
-                    img.save(buffered, format="JPEG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-
-                    image_html = f'<img src="data:image/jpeg;base64,{img_str}" class="heritage-card-image" alt="{site["name"]}">'
-                except:
-                    # Fallback to icon
-                    image_html = f"""
-                    <div class="heritage-icon-container">
-                        <span class="heritage-icon">{site['icon']}</span>
-                    </div>
-                    """
-            else:
-                # Fallback to icon
-                image_html = f"""
-                <div class="heritage-icon-container">
-                    <span class="heritage-icon">{site['icon']}</span>
-                </div>
-                """
-
-            st.markdown(f"""
-            <div class="enhanced-heritage-card">
-                <div class="heritage-card-header">
-                    {image_html}
-                    <div class="heritage-card-overlay">
-                        <div class="heritage-card-category">🏛️ Heritage</div>
-                    </div>
-                </div>
-                <div class="heritage-card-content">
-                    <h4 class="heritage-card-title">{site['name']}</h4>
-                    <div class="heritage-card-details">
-                        <div class="heritage-detail-item">
-                            <span class="detail-icon">📍</span>
-                            <span class="detail-text">{site['location']}</span>
-                        </div>
-                        <div class="heritage-detail-item">
-                            <span class="detail-icon">🏗️</span>
-                            <span class="detail-text">{site['type']}</span>
-                        </div>
-                    </div>
-                    <p class="heritage-card-description">
-                        {site['description']}
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    # In contact-sheet mode the whole strip's thumbnails come from one image
+    heritage_sprite = get_sprite([site['image_path'] for site in heritage_sites], (400, 250)) if use_sprites else None
+
+    cards = []
+
+    for site in heritage_sites:
+        # Try to load and display heritage image
+        image_src = get_image_src(site['image_path'], (400, 250)) if heritage_sprite is None else None
+        sprite_html = sprite_cell_html(heritage_sprite, site['image_path'], alt=site["name"],
+                                       css_class="heritage-card-image sprite-cell")
+        if sprite_html:
+            image_html = sprite_html
+        elif image_src:
+            image_html = image_tag(image_src, site['image_path'], (400, 250), alt=site["name"],
+                                   css_class="heritage-card-image", sizes="(max-width: 640px) 100vw, 33vw")
+        else:
+            # Fallback to icon
+            image_html = f'<div class="heritage-icon-container"><span class="heritage-icon">{site["icon"]}</span></div>'
+
+        cards.append(HIGHLIGHT_CARD.render(kind='heritage', image_html=image_html, category='🏛️ Heritage',
+                                           title=site['name'], location=site['location'], detail_icon='🏗️',
+                                           detail=site['type'], description=site['description']))
+
+    render_card_grid(cards)
 
-def show_dance_highlights():
+def show_dance_highlights(use_sprites=False):
     """Display dance form highlights"""
 
     dance_forms = [
@@ -412,71 +340,30 @@ def show_dance_highlights():
         }
     ]
 
-    cols = st.columns(3)
-
-    for idx, dance in enumerate(dance_forms):
-        col_idx = idx % 3
-
-        with cols[col_idx]:
-            # Try to load and display dance image
-            image_html = ""
-            if os.path.exists(dance['image_path']):
-                try:
-                    img = Image.open(dance['image_path'])
-                    # Convert image to base64 for embedding
-                    import base64
-                    import io
-
-                    # Resize image
-                    img.thumbnail((400, 250), Image.Resampling.LANCZOS)
-
-                    # Convert to base64
-                    buffered = io.BytesIO()
-                    img.save(buffered, format="JPEG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-
-                    image_html = f'<img src="data:image/jpeg;base64,{img_str}" class="dance-card-image" alt="{dance["name"]}">'
-                except:
-                    # Fallback to icon
-                    image_html = f"""
-                    <div class="dance-icon-container">
-                        <span class="dance-icon">{dance['icon']}</span>
-                    </div>
-                    """
-            else:
-                # Fallback to icon
-                image_html = f"""
-                <div class="dance-icon-container">
-                    <span class="dance-icon">{dance['icon']}</span>
-                </div>
-                """
-
-            st.markdown(f"""
-            <div class="enhanced-dance-card">
-                <div class="dance-card-header">
-                    {image_html}
-                    <div class="dance-card-overlay">
-                        <div class="dance-card-category">💃 Dance</div>
-                    </div>
-                </div>
-                <div class="dance-card-content">
-                    <h4 class="dance-card-title">{dance['name']}</h4>
-                    <div class="dance-card-details">
-                        <div class="dance-detail-item">
-                            <span class="detail-icon">📍</span>
-                            <span class="detail-text">{dance['origin']}</span>
-                        </div>
-                        <div class="dance-detail-item">
-                            <span class="detail-icon">🎨</span>
-                            <span class="detail-text">{dance['style']}</span>
-                        </div>
-                    </div>
-                    <p class="dance-card-description">
-                        {dance['description']}
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    # In contact-sheet mode the whole strip's thumbnails come from one image
+    dance_sprite = get_sprite([dance['image_path'] for dance in dance_forms], (400, 250)) if use_sprites else None
+
+    cards = []
+
+    for dance in dance_forms:
+        # Try to load and display dance image
+        image_src = get_image_src(dance['image_path'], (400, 250)) if dance_sprite is None else None
+        sprite_html = sprite_cell_html(dance_sprite, dance['image_path'], alt=dance["name"],
+                                       css_class="dance-card-image sprite-cell")
+        if sprite_html:
+            image_html = sprite_html
+        elif image_src:
+            image_html = image_tag(image_src, dance['image_path'], (400, 250), alt=dance["name"],
+                                   css_class="dance-card-image", sizes="(max-width: 640px) 100vw, 33vw")
+        else:
+            # Fallback to icon
+            image_html = f'<div class="dance-icon-container"><span class="dance-icon">{dance["icon"]}</span></div>'
+
+        cards.append(HIGHLIGHT_CARD.render(kind='dance', image_html=image_html, category='💃 Dance',
+                                           title=dance['name'], location=dance['origin'], detail_icon='🎨',
+                                           detail=dance['style'], description=dance['description']))
+
+    render_card_grid(cards)
 
 def create_tourism_story_section(ita_df, tourism_gdp_df, tourism_employment_df):
     """Create a simple tourism trend section"""
@@ -486,7 +373,7 @@ def create_tourism_story_section(ita_df, tourism_gdp_df, tourism_employment_df):
         # Interactive Tourism Trend Visualization
         st.markdown('<h3 style="color: white; text-align: center; margin: 2rem 0 1rem 0;">📊 India\'s Tourism Journey Through Time</h3>', unsafe_allow_html=True)
         fig_trend = create_tourism_growth_trend_chart(ita_df)
-        st.plotly_chart(fig_trend, use_container_width=True)
+        render_chart(fig_trend)
 
         # Story Insights
         st.markdown("""
@@ -3,6 +3,9 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from utils.downsample import DEFAULT_POINT_BUDGET, downsample
+from utils.ita_metrics import get_ita_metrics
+from utils.lite_mode import render_chart
 
 def show_tourism_analytics(ita_df, ita_monthly_df, state_tourism_df, centrally_protected_df,
                           duration_stay_df, fee_earnings_df, india_world_share_df,
@@ -67,12 +70,12 @@ def show_ita_trends(ita_df):
 
     col1, col2, col3, col4 = st.columns(4)
 
-    latest_arrivals = ita_df['INDIA_ARRIVALS_MILLION'].iloc[-1]
-    previous_arrivals = ita_df['INDIA_ARRIVALS_MILLION'].iloc[-2] if len(ita_df) > 1 else latest_arrivals
-    growth_rate = ((latest_arrivals - previous_arrivals) / previous_arrivals) * 100
+    metrics = get_ita_metrics(ita_df)
+    latest_arrivals = metrics['latest']
+    growth_rate = metrics['latest_growth']
 
-    peak_year = ita_df.loc[ita_df['INDIA_ARRIVALS_MILLION'].idxmax(), 'YEAR']
-    peak_arrivals = ita_df['INDIA_ARRIVALS_MILLION'].max()
+    peak_year = metrics['peak_year']
+    peak_arrivals = metrics['peak_arrivals']
 
     with col1:
         st.markdown(f"""
@@ -97,7 +100,7 @@ def show_ita_trends(ita_df):
         """, unsafe_allow_html=True)
 
     with col3:
-        avg_growth = ita_df['INDIA_ARRIVALS_MILLION'].pct_change().mean() * 100
+        avg_growth = metrics['average_growth']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #45B7D1, #6BC5E8); padding: 1.5rem; border-radius: 12px; text-align: center; color: white; margin-bottom: 1rem;">
             <h3 style="margin: 0; font-size: 2rem;">{avg_growth:.1f}%</h3>
@@ -109,9 +112,7 @@ def show_ita_trends(ita_df):
         """, unsafe_allow_html=True)
 
     with col4:
-        covid_impact = ((ita_df[ita_df['YEAR'] == 2020]['INDIA_ARRIVALS_MILLION'].iloc[0] -
-                        ita_df[ita_df['YEAR'] == 2019]['INDIA_ARRIVALS_MILLION'].iloc[0]) /
-                       ita_df[ita_df['YEAR'] == 2019]['INDIA_ARRIVALS_MILLION'].iloc[0]) * 100
+        covid_impact = metrics['covid_impact']
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #96CEB4, #A8D5C4); padding: 1.5rem; border-radius: 12px; text-align: center; color: white; margin-bottom: 1rem;">
             <h3 style="margin: 0; font-size: 2rem;">{covid_impact:.1f}%</h3>
@@ -170,7 +171,7 @@ def show_ita_trends(ita_df):
 
     # Add recovery annotation with more engaging text
     recovery_year = 2023
-    recovery_value = ita_df[ita_df['YEAR'] == recovery_year]['INDIA_ARRIVALS_MILLION'].iloc[0]
+    recovery_value = metrics['milestones'][recovery_year]
     fig.add_annotation(
         x=recovery_year,
         y=recovery_value,
@@ -185,8 +186,7 @@ def show_ita_trends(ita_df):
     )
 
     # Add milestone annotations for peak years
-    peak_year = ita_df.loc[ita_df['INDIA_ARRIVALS_MILLION'].idxmax(), 'YEAR']
-    peak_value = ita_df['INDIA_ARRIVALS_MILLION'].max()
+    peak_value = peak_arrivals
     fig.add_annotation(
         x=peak_year,
         y=peak_value,
@@ -231,7 +231,7 @@ def show_ita_trends(ita_df):
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    render_chart(fig)
 
     # Add insights section after main chart
     st.markdown("""
@@ -266,18 +266,17 @@ def show_ita_trends(ita_df):
 
     with col1:
         # Year-over-year growth with improved colors
-        ita_df_growth = ita_df.copy()
-        ita_df_growth['Growth Rate'] = ita_df_growth['INDIA_ARRIVALS_MILLION'].pct_change() * 100
+        growth = metrics['growth']
 
         # Create custom colors based on growth rate
-        colors = ['#FF4444' if x < 0 else '#FFA500' if x < 5 else '#32CD32' for x in ita_df_growth['Growth Rate'].fillna(0)]
+        colors = ['#FF4444' if x < 0 else '#FFA500' if x < 5 else '#32CD32' for x in growth.fillna(0)]
 
         fig = go.Figure(data=[
             go.Bar(
-                x=ita_df_growth['YEAR'][1:],
-                y=ita_df_growth['Growth Rate'][1:],
+                x=ita_df['YEAR'][1:],
+                y=growth[1:],
                 marker_color=colors[1:],
-                text=[f"{x:.1f}%" for x in ita_df_growth['Growth Rate'][1:]],
+                text=[f"{x:.1f}%" for x in growth[1:]],
                 textposition='outside',
                 hovertemplate='<b>Year:</b> %{x}<br><b>Growth:</b> %{y:.1f}%<extra></extra>'
             )
@@ -297,15 +296,11 @@ def show_ita_trends(ita_df):
             height=400,
             showlegend=False
         )
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
     with col2:
         # Decade comparison with gradient colors
-        decades = {
-            '2001-2010': ita_df[(ita_df['YEAR'] >= 2001) & (ita_df['YEAR'] <= 2010)]['INDIA_ARRIVALS_MILLION'].mean(),
-            '2011-2020': ita_df[(ita_df['YEAR'] >= 2011) & (ita_df['YEAR'] <= 2020)]['INDIA_ARRIVALS_MILLION'].mean(),
-            '2021-2023': ita_df[(ita_df['YEAR'] >= 2021) & (ita_df['YEAR'] <= 2023)]['INDIA_ARRIVALS_MILLION'].mean()
-        }
+        decades = metrics['decades']
 
         decade_df = pd.DataFrame(list(decades.items()), columns=['Decade', 'Avg Arrivals'])
 
@@ -334,7 +329,7 @@ def show_ita_trends(ita_df):
             height=400,
             showlegend=False
         )
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
     # Add future outlook section
     st.markdown("""
@@ -410,12 +405,13 @@ def show_seasonal_patterns(ita_monthly_df, lean_peak_df, monthly_foreigners_df):
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']  # Warm to cool representing seasonal transition
     year_names = ['2021 - Recovery', '2022 - Rebuilding', '2023 - Revival']
     years = ['YEAR_2021', 'YEAR_2022', 'YEAR_2023']
+    trend_df = downsample(monthly_df, 'MONTH', years, DEFAULT_POINT_BUDGET)
 
     for i, year in enumerate(years):
-        if year in monthly_df.columns:
+        if year in trend_df.columns:
             fig.add_trace(go.Scatter(
-                x=monthly_df['MONTH'],
-                y=monthly_df[year],
+                x=trend_df['MONTH'],
+                y=trend_df[year],
                 mode='lines+markers',
                 name=year_names[i],
                 line=dict(color=colors[i], width=4, shape='spline'),
@@ -469,7 +465,7 @@ def show_seasonal_patterns(ita_monthly_df, lean_peak_df, monthly_foreigners_df):
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    render_chart(fig)
 
     # Add seasonal insights section
     st.markdown("""
@@ -574,7 +570,7 @@ def show_seasonal_patterns(ita_monthly_df, lean_peak_df, monthly_foreigners_df):
                 showlegend=False,
                 xaxis_tickangle=45
             )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart(fig)
 
     # Enhanced seasonal recommendations with immersive storytelling
     st.markdown("""
@@ -832,7 +828,7 @@ def show_state_analysis(state_tourism_df, state_footfall_df):
             showlegend=False,
             yaxis={'categoryorder':'total ascending'}
         )
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
         # Add insights for top states
         st.markdown("#### 🎯 Tourism Powerhouse Insights")
@@ -894,7 +890,7 @@ def show_state_analysis(state_tourism_df, state_footfall_df):
             showlegend=False,
             yaxis={'categoryorder':'total ascending'}
         )
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
         # Add insights for growth champions
         st.markdown("#### 🌟 Growth Story Highlights")
@@ -984,7 +980,7 @@ def show_state_analysis(state_tourism_df, state_footfall_df):
             height=400,
             showlegend=False
         )
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
     with col2:
         # Enhanced regional growth chart with better colors
@@ -1024,7 +1020,7 @@ def show_state_analysis(state_tourism_df, state_footfall_df):
             height=400,
             showlegend=False
         )
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
     # Add concluding insights section
     st.markdown("""
@@ -1154,7 +1150,7 @@ def show_heritage_analytics(centrally_protected_df, top_monuments_df):
                 yaxis={'categoryorder':'total ascending'}
             )
 
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart(fig)
 
             # Enhanced key metrics with heritage storytelling
             total_visitors = monuments_df['YEAR_2019_20'].sum()
@@ -1254,7 +1250,7 @@ def show_heritage_analytics(centrally_protected_df, top_monuments_df):
                     )
                 )
 
-                st.plotly_chart(fig, use_container_width=True)
+                render_chart(fig)
 
                 # Enhanced heritage insights
                 st.markdown("#### 🌟 Global Heritage Champions")
@@ -1482,7 +1478,7 @@ def show_economic_impact(fee_earnings_df, india_world_share_df, tourism_gdp_df=N
                     showlegend=False
                 )
 
-                st.plotly_chart(fig, use_container_width=True)
+                render_chart(fig)
 
                 # Enhanced key metrics with storytelling
                 latest_earnings = earnings_df['Earnings_USD'].iloc[-1]
@@ -1595,7 +1591,7 @@ def show_economic_impact(fee_earnings_df, india_world_share_df, tourism_gdp_df=N
                 showlegend=False
             )
 
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart(fig)
         else:
             st.info("No world tourism share data available")
 
@@ -1611,14 +1607,14 @@ def show_economic_impact(fee_earnings_df, india_world_share_df, tourism_gdp_df=N
                 st.markdown('<h4 style="text-align: center; color: #008080;">💰 Tourism GDP Contribution</h4>', unsafe_allow_html=True)
                 from utils.helpers import create_gdp_contribution_chart
                 fig_gdp = create_gdp_contribution_chart(tourism_gdp_df)
-                st.plotly_chart(fig_gdp, use_container_width=True)
+                render_chart(fig_gdp)
 
         with col2:
             if tourism_employment_df is not None and not tourism_employment_df.empty:
                 st.markdown('<h4 style="text-align: center; color: #008080;">👥 Tourism Employment Trends</h4>', unsafe_allow_html=True)
                 from utils.helpers import create_employment_trends_chart
                 fig_employment = create_employment_trends_chart(tourism_employment_df)
-                st.plotly_chart(fig_employment, use_container_width=True)
+                render_chart(fig_employment)
 
 def show_visitor_demographics(age_statistics_df, duration_stay_df):
     """Display visitor demographics analytics with enhanced storytelling and visual appeal"""
@@ -1731,7 +1727,7 @@ def show_visitor_demographics(age_statistics_df, duration_stay_df):
                     )
                 )
 
-                st.plotly_chart(fig, use_container_width=True)
+                render_chart(fig)
 
                 # Enhanced insights with storytelling
                 dominant_age = age_groups[percentages.index(max(percentages))]
@@ -1847,7 +1843,7 @@ def show_visitor_demographics(age_statistics_df, duration_stay_df):
                     xaxis_tickangle=45
                 )
 
-                st.plotly_chart(fig, use_container_width=True)
+                render_chart(fig)
 
                 # Enhanced duration insights with storytelling
                 longest_stay = regional_data.loc[regional_data['YEAR_2023'].idxmax()]
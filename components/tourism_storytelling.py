@@ -1,13 +1,12 @@
 import streamlit as st
-import pandas as pd
 from components.data_loader import (
     load_unesco_data, load_top_monuments_domestic_data, load_top_monuments_foreign_data,
     load_centrally_protected_domestic_data, load_centrally_protected_foreign_data,
     load_tourism_gdp_data, load_tourism_employment_data, load_fee_earnings_data,
     load_india_world_share_data, load_ita_data, load_ita_monthly_data,
     load_duration_stay_data, load_age_statistics_data, load_all_lean_peak_data,
-    load_state_tourism_data, load_state_foreign_tourism_data, load_dance_data,
-    load_festivals_data
+    load_state_tourism_data, load_state_foreign_tourism_data, load_state_domestic_tourism_data,
+    load_dance_data, load_festivals_data
 )
 from components.chapter1_heritage_heartbeat import show_heritage_heartbeat
 from components.chapter2_economic_multiplier import show_economic_multiplier
@@ -90,11 +89,7 @@ def show_tourism_storytelling():
         dance_df = load_dance_data()
         festivals_df = load_festivals_data()
 
-        # Load domestic data separately
-        try:
-            state_domestic_df = pd.read_csv('Datasets/State_Wise_Domestic_Tourist_Arrivals_2017_2023.csv')
-        except:
-            state_domestic_df = pd.DataFrame()
+        state_domestic_df = load_state_domestic_tourism_data()
 
     # Chapter Content
     if selected_chapter == "🏛️ Chapter 1: The Heritage Heartbeat":
@@ -0,0 +1,73 @@
+"""Count the elements every page sends per rerun
+
+    python -m scripts.audit_element_counts [--page "🎪 Festivals"] [--max-elements 120]
+
+Each page of app.py is run headless with streamlit's AppTest and every node of the
+resulting element tree is counted. Every element and every layout block (column,
+container, tab, expander) is a separate delta message to the browser. The report
+gives the total per page, the blocks among them and the most frequent element
+types, so card layouts that emit a message per card stand out. A page that
+raises is reported as failed, since an aborted rerun sends fewer elements than a
+working one, and the script exits non-zero. With --max-elements, it also exits
+non-zero when any page sends more than that.
+"""
+import argparse
+import os
+import sys
+from collections import Counter
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block
+
+from scripts.audit_figure_payloads import PAGES
+
+def count_nodes(node, counts):
+    """Tally every element and block below node by type"""
+    for child in getattr(node, 'children', {}).values():
+        kind = child.type if isinstance(child, Block) else getattr(child, 'type', type(child).__name__)
+        counts[(isinstance(child, Block), kind)] += 1
+        if isinstance(child, Block):
+            count_nodes(child, counts)
+    return counts
+
+def page_element_counts(page, timeout=300):
+    """(Counter of (is_block, type) for everything one rerun of a page sends, exception messages)"""
+    at = AppTest.from_file(os.path.abspath('app.py'), default_timeout=timeout)
+    at.session_state.page = page
+    at.run()
+    counts = Counter()
+    for root in at._tree.children.values():
+        count_nodes(root, counts)
+    return counts, [exception.value for exception in at.exception]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--page', action='append',
+                        help='only audit pages whose label contains this text (repeatable)')
+    parser.add_argument('--max-elements', type=int,
+                        help='flag pages sending more elements and blocks than this')
+    args = parser.parse_args(argv)
+    pages = [page for page in PAGES if not args.page or any(text in page for text in args.page)]
+
+    flagged = failed = 0
+    for page in pages:
+        counts, exceptions = page_element_counts(page)
+        if exceptions:
+            failed += 1
+            print(f"❌ {page}: raised, so its element count is not meaningful")
+            for message in exceptions:
+                print(f"     {message}")
+            continue
+        total = sum(counts.values())
+        blocks = sum(count for (is_block, _), count in counts.items() if is_block)
+        flag = args.max_elements is not None and total > args.max_elements
+        flagged += flag
+        common = ', '.join(f"{kind} {count}" for (_, kind), count in counts.most_common(5))
+        print(f"{'🚩' if flag else '📄'} {page}: {total} messages ({blocks} blocks) | {common}")
+
+    if failed:
+        print(f"\n{failed} page(s) raised")
+    return 1 if flagged or failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
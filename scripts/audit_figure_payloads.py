@@ -0,0 +1,79 @@
+"""Measure the serialized size of every Plotly figure each page emits
+
+    python -m scripts.audit_figure_payloads [--budget-kb 150] [--page "🗺️ Chapter 4"]
+
+Each page of app.py is run headless with streamlit's AppTest, and every
+plotly_chart element it sends is measured exactly as it goes over the wire. The
+report breaks each figure down into trace data, embedded map geometry, layout and
+animation frames, names its heaviest traces and attributes, and flags figures over
+the budget. Exits non-zero when any figure is over budget.
+"""
+import argparse
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+from utils.figure_payload import FIGURE_PAYLOAD_BUDGET, figure_payload
+
+PAGES = [
+    "🏠 Home",
+    "🎪 Festivals",
+    "💃 Dance Forms",
+    "🏛️ Heritage Sites",
+    "🏛️ Chapter 1: Heritage Heartbeat",
+    "💰 Chapter 2: Economic Multiplier",
+    "🌍 Chapter 3: Traveler's Journey",
+    "🗺️ Chapter 4: Regional Tapestry",
+]
+
+def page_figures(page, timeout=300):
+    """Wire-format specs of every plotly_chart one page emits"""
+    at = AppTest.from_file(os.path.abspath('app.py'), default_timeout=timeout)
+    at.session_state.page = page
+    at.run()
+    for exception in at.exception:
+        print(f"  ⚠️ {page} raised: {exception.value}")
+    return [(chart.proto.spec, chart.proto.ByteSize()) for chart in at.get('plotly_chart')]
+
+def format_kb(size):
+    return f"{size / 1000:7.1f} KB"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-kb', type=float, default=FIGURE_PAYLOAD_BUDGET / 1000,
+                        help='flag figures larger than this (default: %(default)s)')
+    parser.add_argument('--page', action='append',
+                        help='only audit pages whose label contains this text (repeatable)')
+    args = parser.parse_args(argv)
+    budget = int(args.budget_kb * 1000)
+    pages = [page for page in PAGES if not args.page or any(text in page for text in args.page)]
+
+    flagged = 0
+    grand_total = 0
+    for page in pages:
+        figures = page_figures(page)
+        payloads = [(figure_payload(spec), wire_bytes) for spec, wire_bytes in figures]
+        page_total = sum(wire_bytes for _, wire_bytes in payloads)
+        grand_total += page_total
+        print(f"\n📄 {page}: {len(payloads)} figures, {format_kb(page_total).strip()} on the wire")
+
+        for index, (payload, wire_bytes) in enumerate(payloads, 1):
+            flag = wire_bytes > budget
+            flagged += flag
+            title = payload['title'] or '(untitled)'
+            print(f"  {'🚩' if flag else '  '} #{index:<2} {format_kb(wire_bytes)}  {title[:70]}")
+            print(f"          data {format_kb(payload['data'])} | geometry {format_kb(payload['geometry'])} | "
+                  f"layout {format_kb(payload['layout'])} (template {format_kb(payload['template']).strip()}) | frames {format_kb(payload['frames'])}")
+            if flag:
+                for trace in sorted(payload['traces'], key=lambda trace: -trace['bytes'])[:3]:
+                    largest = ', '.join(f"{key} {size / 1000:.1f} KB" for key, size in trace['largest'])
+                    print(f"          └ trace {trace['index']} {trace['type']} '{trace['name'][:30]}' "
+                          f"{format_kb(trace['bytes']).strip()} ({largest})")
+
+    print(f"\n📦 {grand_total / 1000:.1f} KB of figures across {len(pages)} pages; "
+          f"{flagged} over the {budget / 1000:g} KB budget")
+    return 1 if flagged else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Time the figure builders in utils/helpers.py and chapter 4 with and without validation
+
+    python -m scripts.benchmark_figure_builders [repeats]
+
+Each builder runs uncached in the fast path, then the spec it produced is passed
+through validated go.Figure() construction, which is what every render used to
+pay. Chapter 4's builders are local functions, so they are collected by running
+the page once with cached_figure swapped for a recorder.
+"""
+import sys
+import time
+
+import plotly.graph_objects as go
+
+from components import chapter4_regional_tapestry
+from components.data_loader import (load_state_domestic_tourism_data, load_state_foreign_tourism_data,
+                                    load_state_tourism_data)
+from scripts.validate_figure_specs import helper_builders
+
+def _time(function, repeats):
+    """Mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats * 1000
+
+def chapter4_builders():
+    """(name, builder) for every figure chapter 4 renders"""
+    builders = []
+    recorder = lambda builder, *args, **kwargs: (builders.append(builder), builder(*args, **kwargs))[1]
+    original = chapter4_regional_tapestry.cached_figure
+    chapter4_regional_tapestry.cached_figure = recorder
+    try:
+        chapter4_regional_tapestry.show_regional_tapestry(
+            load_state_tourism_data(),
+            load_state_domestic_tourism_data(),
+            load_state_foreign_tourism_data()
+        )
+    finally:
+        chapter4_regional_tapestry.cached_figure = original
+    return [(builder.__name__, builder) for builder in builders]
+
+def main(repeats=20):
+    builders = [(name, lambda builder=builder, args=args: builder.uncached(*args))
+                for name, builder, args in helper_builders()]
+    builders += chapter4_builders()
+
+    print(f"⏱️ {len(builders)} builders, mean of {repeats} runs")
+    print(f"   {'builder':<40} {'fast':>8} {'validated':>10} {'speedup':>8}")
+    fast_total = validated_total = 0.0
+    for name, builder in builders:
+        spec = builder().to_plotly_json()
+        fast = _time(builder, repeats)
+        validated = fast + _time(lambda: go.Figure(spec), repeats)
+        fast_total += fast
+        validated_total += validated
+        print(f"   {name:<40} {fast:6.1f}ms {validated:8.1f}ms {validated / fast:7.1f}x")
+    print(f"   {'total':<40} {fast_total:6.1f}ms {validated_total:8.1f}ms {validated_total / fast_total:7.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:2])))
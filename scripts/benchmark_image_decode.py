@@ -0,0 +1,91 @@
+"""Compare full JPEG decoding against scaled (draft) decoding for card-sized targets
+
+    python -m scripts.benchmark_image_decode [folder] [width] [height]
+
+For every JPEG in the folder, the image is decoded and thumbnailed to the target
+box twice: once at full resolution and once through the pipeline's scaled decode.
+CPU time is measured with process_time(). Peak memory is measured as peak RSS:
+each mode first decodes the whole folder in a fresh child process, and the rise
+of that process's ru_maxrss above its level before the first decode is reported.
+Images are released one by one, so it is the cost of the largest decode. The
+size of the decoded pixel buffers is reported alongside. Needs the resource
+module (Linux/macOS).
+"""
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+
+from utils.image_cache import _decode_image, _draft_scale, image_nbytes
+from utils.image_pipeline import list_source_images
+
+def _max_rss_bytes():
+    """Peak resident set size of this process so far; ru_maxrss is in KB on Linux, bytes on macOS"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+def _measure(image_path, scale, max_size):
+    """Decode + thumbnail one image, returning (cpu seconds, decoded bytes)"""
+    start = time.process_time()
+    img = _decode_image(image_path, scale)
+    decoded_bytes = image_nbytes(img)
+    img.thumbnail(max_size, Image.Resampling.LANCZOS)
+    return time.process_time() - start, decoded_bytes
+
+def _peak_rss_growth(jobs, max_size):
+    """Decode + thumbnail every (path, scale) in a fresh process; returns the peak RSS growth in bytes"""
+    baseline = _max_rss_bytes()
+    for image_path, scale in jobs:
+        img = _decode_image(image_path, scale)
+        img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        del img
+    return _max_rss_bytes() - baseline
+
+def measure_peak_rss(jobs, max_size):
+    """Peak RSS growth of decoding jobs in a child process that starts clean, not forked from this one"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(_peak_rss_growth, jobs, max_size).result()
+
+def main(folder='Images/heritage_images', max_size=(350, 250)):
+    jpegs = [path for path in list_source_images(folder) if path.lower().endswith(('.jpg', '.jpeg'))]
+    if not jpegs:
+        print(f"No JPEG images found in {folder}")
+        return 1
+
+    scales = {}
+    for image_path in jpegs:
+        stat = os.stat(image_path)
+        scales[image_path] = _draft_scale(image_path, (stat.st_mtime_ns, stat.st_size), max_size, False)
+    scale_counts = {}
+    for scale in scales.values():
+        scale_counts[scale] = scale_counts.get(scale, 0) + 1
+    jobs = {'full': [(path, 1) for path in jpegs], 'scaled': list(scales.items())}
+
+    # Peak RSS first: a spawned child starts from this process's high-water mark,
+    # which must not yet include any decode
+    totals = {label: [0.0, 0, measure_peak_rss(label_jobs, max_size)] for label, label_jobs in jobs.items()}
+    for label, label_jobs in jobs.items():
+        for image_path, decode_scale in label_jobs:
+            cpu, decoded_bytes = _measure(image_path, decode_scale, max_size)
+            totals[label][0] += cpu
+            totals[label][1] += decoded_bytes
+
+    print(f"📊 {len(jpegs)} JPEGs from {folder} → {max_size[0]}x{max_size[1]}")
+    print(f"   decode scales used: " + ", ".join(f"1/{s}: {n}" for s, n in sorted(scale_counts.items(), reverse=True)))
+    for label, (cpu, total_bytes, peak_rss) in totals.items():
+        print(f"   {label:>6}: {cpu:6.2f}s CPU ({cpu / len(jpegs) * 1000:5.1f} ms/image), "
+              f"{total_bytes / 1_000_000:8.1f} MB decoded, peak RSS +{peak_rss / 1_000_000:6.1f} MB")
+    full, scaled = totals['full'], totals['scaled']
+    peak_saving = f"{1 - scaled[2] / full[2]:.0%}" if full[2] else "n/a"
+    print(f"   savings: {1 - scaled[0] / full[0]:.0%} CPU, {1 - scaled[1] / full[1]:.0%} decoded bytes, "
+          f"{peak_saving} peak RSS")
+    return 0
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    folder = args[0] if args else 'Images/heritage_images'
+    size = (int(args[1]), int(args[2])) if len(args) >= 3 else (350, 250)
+    sys.exit(main(folder, size))
@@ -0,0 +1,90 @@
+"""Pre-render every page's Plotly figures as static images for lite mode
+
+    python -m scripts.build_chart_images [--page "🗺️ Chapter 4"] [--keep-stale]
+
+Each page of app.py is run headless and every figure it sends is rendered to
+static/charts/<key>.png, where the key hashes the figure's wire JSON exactly as
+utils/lite_mode.render_chart computes it at runtime. Run it after the datasets
+change; images no longer produced by any page are removed unless --keep-stale is
+given. Rendering needs kaleido (pip install kaleido).
+"""
+import argparse
+import json
+import os
+import sys
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from scripts.audit_figure_payloads import PAGES, page_figures
+from utils.figure_payload import figure_title
+from utils.lite_mode import (
+    CHART_IMAGE_DIR, CHART_IMAGE_FORMAT, CHART_IMAGE_HEIGHT, CHART_IMAGE_WIDTH,
+    chart_image_path, chart_key,
+)
+
+MANIFEST_PATH = os.path.join(CHART_IMAGE_DIR, 'manifest.json')
+
+def render_image(spec_json, path):
+    """Write one figure's image at the layout's own height, or the plotly default"""
+    fig = go.Figure(json.loads(spec_json), _validate=False)
+    height = fig.layout.height or CHART_IMAGE_HEIGHT
+    width = fig.layout.width or CHART_IMAGE_WIDTH
+    pio.write_image(fig, path, format=CHART_IMAGE_FORMAT, width=width, height=height)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--page', action='append',
+                        help='only render pages whose label contains this text (repeatable)')
+    parser.add_argument('--keep-stale', action='store_true',
+                        help='keep images no page produced in this run')
+    args = parser.parse_args(argv)
+
+    try:
+        import kaleido  # noqa: F401
+    except ImportError:
+        print("❌ kaleido is required to render chart images: pip install kaleido")
+        return 1
+
+    os.makedirs(CHART_IMAGE_DIR, exist_ok=True)
+    pages = [page for page in PAGES if not args.page or any(text in page for text in args.page)]
+    manifest = {}
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    built = {}
+    rendered = 0
+    for page in pages:
+        figures = page_figures(page)
+        print(f"\n📄 {page}: {len(figures)} figures")
+        for spec_json, _ in figures:
+            key = chart_key(spec_json)
+            path = chart_image_path(key)
+            title = figure_title(json.loads(spec_json).get('layout', {})) or '(untitled)'
+            if not os.path.exists(path):
+                render_image(spec_json, path)
+                rendered += 1
+            built[key] = {'page': page, 'title': title}
+            print(f"   ✅ {os.path.basename(path)}  {title[:70]}")
+
+    # Pages not rebuilt this run keep their entries
+    for key, entry in manifest.items():
+        if entry['page'] not in pages:
+            built.setdefault(key, entry)
+
+    removed = 0
+    if not args.keep_stale:
+        for name in os.listdir(CHART_IMAGE_DIR):
+            key, extension = os.path.splitext(name)
+            if extension == f".{CHART_IMAGE_FORMAT}" and key not in built:
+                os.remove(os.path.join(CHART_IMAGE_DIR, name))
+                removed += 1
+
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(built, f, indent=2, ensure_ascii=False)
+    print(f"\n🖼️ {len(built)} chart images, {rendered} rendered, {removed} stale removed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
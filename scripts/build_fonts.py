@@ -0,0 +1,108 @@
+"""Bundle subset WOFF2 web fonts under static/fonts
+
+    python -m scripts.build_fonts [--source DIR]
+
+Every face in styles/fonts.WEB_FONTS is cut down to the characters the app can
+actually show (its source files plus the datasets, over printable ASCII) and
+written as static/fonts/<family>-<weight>-<hash>.woff2, with fonts.json mapping
+each face to its file. The TTFs are read from --source when given (named as
+upstream, e.g. Poppins-Light.ttf) or downloaded from the Google Fonts repository,
+so run it once with network access and commit the output. The content hash in
+each name lets the files be cached forever. Needs fontTools and brotli
+(pip install fonttools brotli).
+"""
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import urllib.parse
+import urllib.request
+
+from styles.fonts import FONT_DIR, FONT_MANIFEST, WEB_FONTS, font_filename
+
+# Files whose text ends up on screen
+TEXT_SOURCES = ('app.py', 'components/*.py', 'utils/*.py', 'styles/*.py', 'Datasets/**/*.csv')
+
+def used_characters():
+    """Every character the app's code and datasets contain, plus printable ASCII"""
+    characters = {chr(code) for code in range(0x20, 0x7f)}
+    for pattern in TEXT_SOURCES:
+        for path in glob.glob(pattern, recursive=True):
+            with open(path, encoding='utf-8', errors='ignore') as f:
+                characters.update(f.read())
+    return ''.join(sorted(character for character in characters if character.isprintable()))
+
+def read_source_font(url, source_dir, downloaded):
+    """Raw TTF bytes from source_dir when present there, else from url (fetched once)"""
+    name = urllib.parse.unquote(url.rsplit('/', 1)[-1])
+    if source_dir and os.path.exists(os.path.join(source_dir, name)):
+        with open(os.path.join(source_dir, name), 'rb') as f:
+            return f.read()
+    if url not in downloaded:
+        with urllib.request.urlopen(url, timeout=60) as response:
+            downloaded[url] = response.read()
+    return downloaded[url]
+
+def subset_font(data, weight, text):
+    """WOFF2 bytes of the font limited to text, pinned to weight if it is a variable font"""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+
+    font = TTFont(io.BytesIO(data))
+    if 'fvar' in font:
+        font = instancer.instantiateVariableFont(font, {'wght': weight})
+    subsetter = subset.Subsetter(subset.Options())
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    font.flavor = 'woff2'
+    output = io.BytesIO()
+    font.save(output)
+    return output.getvalue()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--source', help='folder with the upstream TTF files, instead of downloading them')
+    args = parser.parse_args(argv)
+
+    try:
+        import brotli  # noqa: F401
+        import fontTools  # noqa: F401
+    except ImportError:
+        print("❌ fontTools and brotli are required to build the fonts: pip install fonttools brotli")
+        return 1
+
+    text = used_characters()
+    print(f"🔤 Subsetting to {len(text)} characters")
+
+    os.makedirs(FONT_DIR, exist_ok=True)
+    manifest = {}
+    downloaded = {}
+    for (family, weight), (_, url) in WEB_FONTS.items():
+        try:
+            data = read_source_font(url, args.source, downloaded)
+            woff2 = subset_font(data, weight, text)
+        except Exception as e:
+            print(f"Error building {family} {weight}: {e}")
+            return 1
+        filename = f"{font_filename(family, weight)}-{hashlib.sha1(woff2).hexdigest()[:12]}.woff2"
+        with open(os.path.join(FONT_DIR, filename), 'wb') as f:
+            f.write(woff2)
+        manifest[f"{family}:{weight}"] = filename
+        print(f"   ✅ {family} {weight}: {len(data) / 1000:.0f} KB TTF → {len(woff2) / 1000:.1f} KB {filename}")
+
+    # Older builds of the same faces
+    for name in os.listdir(FONT_DIR):
+        if name.endswith('.woff2') and name not in manifest.values():
+            os.remove(os.path.join(FONT_DIR, name))
+
+    with open(FONT_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"\n📦 {len(manifest)} faces written to {FONT_DIR}; restart the app to pick them up")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Bundle simplified India state boundaries under Datasets/geo
+
+    python -m scripts.build_geojson [source]
+
+The source is a local GeoJSON file or URL of full-resolution state boundaries
+keyed by properties.ST_NM (default: the gist the map used to fetch at runtime).
+One file is written per GEO_RESOLUTIONS entry; the map picks between them by
+display size, so commit the outputs alongside the datasets.
+"""
+import json
+import os
+import sys
+import urllib.request
+
+from utils.geo import GEO_DIR, GEO_RESOLUTIONS, INDIA_GEOJSON_URL, geojson_path, simplify_geojson
+
+def read_source(source):
+    """Load the full-resolution GeoJSON from a path or URL"""
+    if os.path.exists(source):
+        with open(source, encoding='utf-8') as f:
+            return json.load(f)
+    with urllib.request.urlopen(source, timeout=60) as response:
+        return json.load(response)
+
+def count_points(geojson):
+    """Total coordinate pairs across every ring of every feature"""
+    total = 0
+    for feature in geojson['features']:
+        geometry = feature['geometry']
+        polygons = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+        total += sum(len(ring) for polygon in polygons for ring in polygon)
+    return total
+
+def main(source=INDIA_GEOJSON_URL):
+    try:
+        geojson = read_source(source)
+    except Exception as e:
+        print(f"Error reading {source}: {e}")
+        return 1
+
+    source_bytes = len(json.dumps(geojson, separators=(',', ':')))
+    print(f"🗺️ {len(geojson['features'])} states, {count_points(geojson):,} points, "
+          f"{source_bytes / 1_000_000:.2f} MB at full resolution")
+
+    os.makedirs(GEO_DIR, exist_ok=True)
+    for resolution, tolerance in GEO_RESOLUTIONS.items():
+        simplified = simplify_geojson(geojson, tolerance)
+        data = json.dumps(simplified, separators=(',', ':'))
+        with open(geojson_path(resolution), 'w', encoding='utf-8') as f:
+            f.write(data)
+        print(f"   {resolution:>6} (tolerance {tolerance}°): {count_points(simplified):>8,} points, "
+              f"{len(data) / 1_000:8.1f} KB → {geojson_path(resolution)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:2]))
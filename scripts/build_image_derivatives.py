@@ -0,0 +1,50 @@
+"""Pre-build the resized image derivatives served from ./static/derivatives
+
+Run from the repository root before deploying so the first visitor never pays
+for a resize:
+
+    python -m scripts.build_image_derivatives
+"""
+import os
+import sys
+import time
+
+from utils.image_cache import image_cache_stats
+from utils.image_pipeline import (DERIVATIVE_PRESETS, DERIVATIVES_DIR, PLACEHOLDER_MANIFEST, build_derivative,
+                                  list_source_images, responsive_variants, write_placeholder_manifest)
+
+def main():
+    start = time.perf_counter()
+    source_images = list_source_images()
+    built = 0
+    failed = []
+
+    for image_path in source_images:
+        for max_size, exact in DERIVATIVE_PRESETS.values():
+            try:
+                # Every responsive candidate of the preset (0.5x / 1x / 2x, no upscaling)
+                for box, _ in responsive_variants(image_path, max_size, exact):
+                    build_derivative(image_path, box, exact)
+                    built += 1
+            except Exception as e:
+                failed.append(f"{image_path} {max_size}: {e}")
+
+    # Inline placeholders (blurred thumbnail + dominant colour) for every image
+    placeholders = write_placeholder_manifest(source_images)
+    placeholder_bytes = sum(len(p['src']) for p in placeholders.values())
+
+    total_bytes = sum(os.path.getsize(os.path.join(DERIVATIVES_DIR, name))
+                      for name in os.listdir(DERIVATIVES_DIR)) if os.path.isdir(DERIVATIVES_DIR) else 0
+    print(f"✅ {built} derivatives for {len(source_images)} images in {time.perf_counter() - start:.1f}s "
+          f"({total_bytes / 1_000_000:.1f} MB in {DERIVATIVES_DIR})")
+    print(f"   {len(placeholders)} placeholders in {PLACEHOLDER_MANIFEST} "
+          f"(avg {placeholder_bytes / max(len(placeholders), 1):.0f} bytes inline)")
+    stats = image_cache_stats()
+    print(f"   image cache: {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['evictions']} evictions, {stats['bytes'] / 1_000_000:.0f} MB held")
+    for failure in failed:
+        print(f"  - failed: {failure}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
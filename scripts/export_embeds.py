@@ -0,0 +1,111 @@
+"""Export charts as embeddable HTML fragments and JSON specs for partner sites
+
+    python -m scripts.export_embeds [--base-url https://cdn.example.org/embeds/] [--chart ita_trend] [--force]
+
+Each chart in EMBEDS is written to static/embeds/ as <name>.html, a fragment to
+paste into a page, and <name>.json, the bare figure spec for Plotly.newPlot.
+The fragments do not inline plotly.js. They all load one shared,
+version-named plotly-<version>.min.js, so a page showing many embeds downloads
+the library once and browsers can cache it indefinitely. A chart is only
+re-exported when the data it reads, or the plotly.js version, has changed since
+the last run (tracked in manifest.json); --force rebuilds everything.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import plotly.io as pio
+import plotly.offline
+
+from components.chapter4_regional_tapestry import create_recovery_champions_chart
+from components.data_loader import load_ita_data, load_state_tourism_data, load_tourism_gdp_data
+from utils.data_version import get_data_version
+from utils.helpers import create_gdp_contribution_chart, create_tourism_growth_trend_chart
+from utils.image_pipeline import STATIC_DIR
+
+EMBED_DIR = os.path.join(STATIC_DIR, 'embeds')
+MANIFEST_PATH = os.path.join(EMBED_DIR, 'manifest.json')
+EMBED_CONFIG = {'responsive': True, 'displaylogo': False}
+
+# name -> (figure builder, loaders for the DataFrames it takes)
+EMBEDS = {
+    'ita_trend': (create_tourism_growth_trend_chart, (load_ita_data,)),
+    'gdp_contribution': (create_gdp_contribution_chart, (load_tourism_gdp_data,)),
+    'recovery_champions': (create_recovery_champions_chart, (load_state_tourism_data,)),
+}
+
+def plotly_asset_name():
+    """File name of the shared plotly.js bundle, versioned so it can be cached forever"""
+    return f"plotly-{plotly.offline.get_plotlyjs_version()}.min.js"
+
+def write_plotly_asset():
+    """Write the shared plotly.js bundle once per plotly.js version; True if written"""
+    path = os.path.join(EMBED_DIR, plotly_asset_name())
+    if os.path.exists(path):
+        return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(plotly.offline.get_plotlyjs())
+    return True
+
+def embed_key(name, dataframes):
+    """Changes whenever the chart's input data or the plotly.js version changes"""
+    version = get_data_version(*dataframes)
+    return hashlib.sha1(f"{name}:{version}:{plotly_asset_name()}".encode()).hexdigest()[:16], version
+
+def write_embed(name, fig, script_url):
+    """Write <name>.html and <name>.json; returns their sizes in bytes"""
+    spec_json = pio.to_json(fig, validate=False)
+    fragment = pio.to_html(fig, full_html=False, include_plotlyjs=script_url, div_id=f"embed-{name}",
+                           config=EMBED_CONFIG, validate=False)
+    files = {f"{name}.json": spec_json, f"{name}.html": fragment}
+    for filename, content in files.items():
+        with open(os.path.join(EMBED_DIR, filename), 'w', encoding='utf-8') as f:
+            f.write(content)
+    return {filename: len(content.encode()) for filename, content in files.items()}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--base-url', default='',
+                        help='URL prefix the fragments load the plotly.js bundle from (default: same folder)')
+    parser.add_argument('--chart', action='append', choices=sorted(EMBEDS),
+                        help='only export this chart (repeatable)')
+    parser.add_argument('--force', action='store_true', help='re-export charts whose data has not changed')
+    args = parser.parse_args(argv)
+
+    os.makedirs(EMBED_DIR, exist_ok=True)
+    manifest = {}
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    asset = plotly_asset_name()
+    script_url = f"{args.base_url}{asset}"
+    print(f"📦 {asset}: {'written' if write_plotly_asset() else 'up to date'}")
+
+    exported = 0
+    for name in args.chart or EMBEDS:
+        builder, loaders = EMBEDS[name]
+        dataframes = [load() for load in loaders]
+        key, data_version = embed_key(name, dataframes)
+        entry = manifest.get(name, {})
+        current = (entry.get('key') == key and entry.get('script_url') == script_url
+                   and all(os.path.exists(os.path.join(EMBED_DIR, filename)) for filename in entry.get('files', {})))
+        if current and not args.force:
+            print(f"   ⏭️ {name}: unchanged (data {data_version})")
+            continue
+
+        files = write_embed(name, builder.uncached(*dataframes), script_url)
+        manifest[name] = {'key': key, 'data_version': data_version, 'script_url': script_url, 'files': files}
+        exported += 1
+        sizes = ', '.join(f"{filename} {size / 1000:.1f} KB" for filename, size in files.items())
+        print(f"   ✅ {name}: {sizes}")
+
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"\n🧩 {exported} exported, {len(args.chart or EMBEDS) - exported} unchanged; fragments load {script_url}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
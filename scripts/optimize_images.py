@@ -0,0 +1,255 @@
+"""Shrink the image corpus under Images/ and report near-duplicate images
+
+    python -m scripts.optimize_images            # dry run: report only
+    python -m scripts.optimize_images --apply    # rewrite files in place
+
+For every source image the optimizer:
+- re-encodes JPEGs with the longest side capped at MAX_DIMENSION (the largest
+  layout shows 800px, so this leaves 2x headroom for HiDPI screens) at the lowest
+  quality whose SSIM against the capped original still reaches SSIM_TARGET,
+  found per image by binary search over QUALITY_RANGE;
+- converts PNGs that hold photographs (no transparency, thousands of colours) to
+  JPEG the same way, and with --apply rewrites the filename wherever a dataset
+  CSV or source module names it;
+- re-saves every other PNG losslessly with zlib optimization;
+- groups near-duplicate images by 64-bit difference hash (dHash).
+A rewrite is kept only when it saves at least MIN_SAVING.
+
+EXIF and ICC data are carried over so orientation and colour stay unchanged.
+"""
+import argparse
+import glob
+import io
+import os
+import re
+import sys
+import numpy as np
+from PIL import Image
+
+from utils.image_pipeline import IMAGE_ROOT, _has_transparency, list_source_images
+
+QUALITY_RANGE = (60, 90)
+# Mean SSIM over 7x7 windows of the luma channel; 0.98 is where re-encoding
+# artefacts stop being visible at 100% zoom on this corpus
+SSIM_TARGET = 0.98
+SSIM_WINDOW = 7
+MAX_DIMENSION = 1600
+MIN_SAVING = 0.10
+PHOTO_MIN_COLORS = 4096
+DUPLICATE_MAX_DISTANCE = 4
+# Every file that can name an image by its file name
+REFERENCE_GLOBS = ('Datasets/**/*.csv', '*.py', 'components/*.py', 'utils/*.py', 'styles/*.py', 'scripts/*.py')
+
+def difference_hash(img, hash_size=8):
+    """64-bit dHash: compares neighbouring pixels of a 9x8 grayscale thumbnail"""
+    small = img.convert('L').resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+    pixels = small.tobytes()
+    bits = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return bits
+
+def is_photographic_png(img):
+    """True for PNGs that are really photographs: no transparency and many distinct colours"""
+    if _has_transparency(img):
+        return False
+    sample = img.convert('RGB')
+    sample.thumbnail((256, 256))
+    return sample.getcolors(maxcolors=PHOTO_MIN_COLORS) is None
+
+def _box_mean(values, window):
+    """Mean over every window x window block (valid region only), via an integral image"""
+    total = np.pad(values, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    return (total[window:, window:] - total[:-window, window:]
+            - total[window:, :-window] + total[:-window, :-window]) / (window * window)
+
+def ssim(reference, candidate, window=SSIM_WINDOW):
+    """Mean structural similarity of two same-sized images, compared on luma"""
+    a = np.asarray(reference.convert('L'), dtype=np.float64)
+    b = np.asarray(candidate.convert('L'), dtype=np.float64)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    mean_a, mean_b = _box_mean(a, window), _box_mean(b, window)
+    var_a = _box_mean(a * a, window) - mean_a ** 2
+    var_b = _box_mean(b * b, window) - mean_b ** 2
+    covariance = _box_mean(a * b, window) - mean_a * mean_b
+    similarity = (((2 * mean_a * mean_b + c1) * (2 * covariance + c2))
+                  / ((mean_a ** 2 + mean_b ** 2 + c1) * (var_a + var_b + c2)))
+    return float(similarity.mean())
+
+def encode_jpeg(img, quality):
+    """Encode an image as an optimized progressive JPEG, keeping its EXIF and ICC data"""
+    save_kwargs = {'format': 'JPEG', 'quality': quality, 'optimize': True, 'progressive': True}
+    for key in ('exif', 'icc_profile'):
+        if img.info.get(key):
+            save_kwargs[key] = img.info[key]
+    buffer = io.BytesIO()
+    img.convert('RGB').save(buffer, **save_kwargs)
+    return buffer.getvalue()
+
+def encode_jpeg_to_target(img):
+    """Cap the image at MAX_DIMENSION and encode it at the lowest quality meeting SSIM_TARGET
+
+    Returns (quality, bytes). SSIM is not strictly monotonic in quality for
+    sources that were JPEGs already, so the search returns a quality that meets
+    the target, not always the lowest one; QUALITY_RANGE's top is used when
+    nothing in the range does.
+    """
+    if max(img.size) > MAX_DIMENSION:
+        info = img.info
+        img = img.copy()
+        img.thumbnail((MAX_DIMENSION, MAX_DIMENSION), Image.Resampling.LANCZOS)
+        img.info = info
+    reference = img.convert('RGB')
+    low, high = QUALITY_RANGE
+    best = None
+    while low <= high:
+        quality = (low + high) // 2
+        data = encode_jpeg(img, quality)
+        with Image.open(io.BytesIO(data)) as encoded:
+            if ssim(reference, encoded) >= SSIM_TARGET:
+                best = (quality, data)
+                high = quality - 1
+            else:
+                low = quality + 1
+    return best or (QUALITY_RANGE[1], encode_jpeg(img, QUALITY_RANGE[1]))
+
+def encode_png_lossless(img):
+    """Re-save a PNG with maximum zlib optimization; pixels and metadata are unchanged"""
+    save_kwargs = {'format': 'PNG', 'optimize': True}
+    for key in ('transparency', 'icc_profile', 'exif', 'dpi', 'gamma'):
+        if key in img.info:
+            save_kwargs[key] = img.info[key]
+    buffer = io.BytesIO()
+    img.save(buffer, **save_kwargs)
+    return buffer.getvalue()
+
+def plan_image(image_path):
+    """Work out what to do with one image: returns (action, new_path, new_bytes, quality, dhash)"""
+    with Image.open(image_path) as img:
+        img.load()
+        dhash = difference_hash(img)
+        original_size = os.path.getsize(image_path)
+
+        if img.format == 'PNG':
+            new_path = os.path.splitext(image_path)[0] + '.jpg'
+            if is_photographic_png(img) and not os.path.exists(new_path):
+                quality, data = encode_jpeg_to_target(img)
+                return 'convert', new_path, data, quality, dhash
+            action, new_path, data, quality = 'lossless', image_path, encode_png_lossless(img), None
+        elif img.format == 'JPEG':
+            action, new_path = 'recompress', image_path
+            quality, data = encode_jpeg_to_target(img)
+        else:
+            return None, None, None, None, dhash
+
+        if len(data) <= original_size * (1 - MIN_SAVING):
+            return action, new_path, data, quality, dhash
+        return None, None, None, None, dhash
+
+def find_near_duplicates(hashes):
+    """Group images whose dHashes differ in at most DUPLICATE_MAX_DISTANCE bits"""
+    paths = sorted(hashes)
+    groups = []
+    grouped = set()
+    for i, path in enumerate(paths):
+        if path in grouped:
+            continue
+        group = [other for other in paths[i + 1:]
+                 if other not in grouped and bin(hashes[path] ^ hashes[other]).count('1') <= DUPLICATE_MAX_DISTANCE]
+        if group:
+            groups.append([path] + group)
+            grouped.update(group)
+    return groups
+
+def rewrite_references(old_name, new_name):
+    """Replace an image filename wherever a dataset or source file names it; returns the files changed
+
+    Only whole file names match: the name may follow a path separator, quote or
+    delimiter, but not another file-name character, so e.g. Hornbill.png never
+    rewrites Old_Hornbill.png or Hornbill.png.bak.
+    """
+    pattern = re.compile(rf"(?<![\w.-]){re.escape(old_name)}(?![\w.-])")
+    changed = []
+    for reference_glob in REFERENCE_GLOBS:
+        for path in glob.glob(reference_glob, recursive=True):
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+            new_text = pattern.sub(new_name, text)
+            if new_text != text:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(new_text)
+                changed.append(path)
+    return changed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--apply', action='store_true', help='rewrite images (and references) in place')
+    parser.add_argument('--root', default=IMAGE_ROOT, help='image folder to optimize')
+    args = parser.parse_args(argv)
+
+    image_paths = list_source_images(args.root)
+    name_counts = {}
+    for image_path in image_paths:
+        name = os.path.basename(image_path)
+        name_counts[name] = name_counts.get(name, 0) + 1
+
+    hashes = {}
+    before = after = 0
+    actions = {'recompress': 0, 'convert': 0, 'lossless': 0}
+    qualities = []
+    for image_path in image_paths:
+        original_size = os.path.getsize(image_path)
+        try:
+            action, new_path, data, quality, dhash = plan_image(image_path)
+        except Exception as e:
+            print(f"  - skipped {image_path}: {e}")
+            continue
+        hashes[image_path] = dhash
+        before += original_size
+        if action == 'convert' and name_counts[os.path.basename(image_path)] > 1:
+            # References hold bare file names, which can't tell which folder's image they mean
+            print(f"  - kept {image_path} as PNG: another image has the same name, so references can't be rewritten")
+            action = None
+        if action is None:
+            after += original_size
+            continue
+
+        after += len(data)
+        actions[action] += 1
+        if quality is not None:
+            qualities.append(quality)
+        if original_size - len(data) > 500_000:
+            print(f"  {action:>10}: {image_path} {original_size / 1_000_000:.1f} MB → {len(data) / 1_000_000:.1f} MB"
+                  + (f" (quality {quality})" if quality is not None else ""))
+
+        if args.apply:
+            tmp_path = f"{new_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, new_path)
+            if new_path != image_path:
+                os.remove(image_path)
+                changed = rewrite_references(os.path.basename(image_path), os.path.basename(new_path))
+                print(f"             references updated in: {', '.join(changed) or 'none found'}")
+
+    print(f"\n📦 {len(hashes)} images: {before / 1_000_000:.1f} MB → {after / 1_000_000:.1f} MB "
+          f"({1 - after / before if before else 0:.0%} smaller; "
+          f"{actions['recompress']} recompressed, {actions['convert']} PNG → JPEG, "
+          f"{actions['lossless']} PNG optimized losslessly)")
+    if qualities:
+        print(f"   JPEG quality for SSIM ≥ {SSIM_TARGET}: median {int(np.median(qualities))}, "
+              f"range {min(qualities)}-{max(qualities)}")
+    if not args.apply:
+        print("   dry run: pass --apply to rewrite the files")
+
+    duplicates = find_near_duplicates(hashes)
+    print(f"\n🔍 {len(duplicates)} near-duplicate groups (dHash distance ≤ {DUPLICATE_MAX_DISTANCE})")
+    for group in duplicates:
+        print("  - " + "\n    ".join(group))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
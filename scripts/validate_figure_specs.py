@@ -0,0 +1,61 @@
+"""Validate every plain-dict figure spec against plotly's schema
+
+    python -m scripts.validate_figure_specs
+
+Production builds figures from specs without validation (utils/figure_specs.py).
+This runs the chart builders in utils/helpers.py directly and every page of
+app.py headless with FIGURE_SPEC_VALIDATE=1, so each spec is validated once and
+checked to serialize exactly as its unvalidated fast path does. Exits non-zero if
+any builder or page fails.
+"""
+import os
+import sys
+
+os.environ['FIGURE_SPEC_VALIDATE'] = '1'
+
+from streamlit.testing.v1 import AppTest
+
+from components.data_loader import load_ita_data, load_tourism_employment_data, load_tourism_gdp_data
+from scripts.audit_figure_payloads import PAGES
+from utils import helpers
+
+def helper_builders():
+    """(name, builder, args) for the spec builders in utils/helpers.py"""
+    ita_df = load_ita_data()
+    return [
+        ('create_enhanced_tourism_chart', helpers.create_enhanced_tourism_chart, (ita_df,)),
+        ('create_tourism_growth_trend_chart', helpers.create_tourism_growth_trend_chart, (ita_df,)),
+        ('create_year_over_year_growth_chart', helpers.create_year_over_year_growth_chart, (ita_df,)),
+        ('create_decade_comparison_chart', helpers.create_decade_comparison_chart, (ita_df,)),
+        ('create_gdp_contribution_chart', helpers.create_gdp_contribution_chart, (load_tourism_gdp_data(),)),
+        ('create_employment_trends_chart', helpers.create_employment_trends_chart, (load_tourism_employment_data(),)),
+    ]
+
+def main():
+    failures = 0
+    print("🔎 utils/helpers.py builders")
+    for name, builder, args in helper_builders():
+        try:
+            builder.uncached(*args)
+            print(f"   ✅ {name}")
+        except Exception as e:
+            failures += 1
+            print(f"   ❌ {name}: {e}")
+
+    print("🔎 app pages")
+    for page in PAGES:
+        at = AppTest.from_file(os.path.abspath('app.py'), default_timeout=300)
+        at.session_state.page = page
+        at.run()
+        if at.exception:
+            failures += 1
+            for exception in at.exception:
+                print(f"   ❌ {page}: {exception.value}")
+        else:
+            print(f"   ✅ {page} ({len(at.get('plotly_chart'))} figures)")
+
+    print(f"\n{'✅ all specs valid' if not failures else f'❌ {failures} failures'}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import json
+import os
+from functools import lru_cache
+from utils.image_pipeline import STATIC_DIR
+
+# Poppins and Playfair Display are served as WOFF2 subsets from static/fonts,
+# built by python -m scripts.build_fonts and committed, so no page ever waits on a
+# third-party font host. Every face uses font-display: swap: text paints at once in
+# the fallback family and switches when the file arrives. A face missing from the
+# manifest, or the inlined stylesheet (which can't reach static/fonts), resolves to
+# a locally installed copy or the generic serif/sans-serif fallback.
+FONT_DIR = os.path.join(STATIC_DIR, 'fonts')
+FONT_MANIFEST = os.path.join(FONT_DIR, 'fonts.json')
+# Relative to the stylesheet served from app/static/css/
+FONT_URL_PREFIX = '../fonts'
+
+# (family, weight) -> local font names and the upstream TTF the subset is cut from.
+# Playfair Display only ships as a variable font, so the build pins its weight axis.
+GOOGLE_FONTS_URL = 'https://github.com/google/fonts/raw/main/ofl'
+WEB_FONTS = {
+    ('Poppins', 300): (('Poppins Light', 'Poppins-Light'), f"{GOOGLE_FONTS_URL}/poppins/Poppins-Light.ttf"),
+    ('Poppins', 400): (('Poppins', 'Poppins-Regular'), f"{GOOGLE_FONTS_URL}/poppins/Poppins-Regular.ttf"),
+    ('Poppins', 600): (('Poppins SemiBold', 'Poppins-SemiBold'), f"{GOOGLE_FONTS_URL}/poppins/Poppins-SemiBold.ttf"),
+    ('Poppins', 700): (('Poppins Bold', 'Poppins-Bold'), f"{GOOGLE_FONTS_URL}/poppins/Poppins-Bold.ttf"),
+    ('Playfair Display', 400): (('Playfair Display', 'PlayfairDisplay-Regular'),
+                                f"{GOOGLE_FONTS_URL}/playfairdisplay/PlayfairDisplay%5Bwght%5D.ttf"),
+    ('Playfair Display', 700): (('Playfair Display Bold', 'PlayfairDisplay-Bold'),
+                                f"{GOOGLE_FONTS_URL}/playfairdisplay/PlayfairDisplay%5Bwght%5D.ttf"),
+}
+
+def font_filename(family, weight):
+    """Stem of a bundled face's file name, before the content hash"""
+    return f"{family.lower().replace(' ', '-')}-{weight}"
+
+@lru_cache(maxsize=1)
+def load_font_manifest():
+    """{"family:weight": file name} of the bundled subsets, read once per process; empty when none are built"""
+    if not os.path.exists(FONT_MANIFEST):
+        return {}
+    try:
+        with open(FONT_MANIFEST, encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error reading font manifest {FONT_MANIFEST}: {e}")
+        return {}
+
+def font_face_css(bundled=True):
+    """@font-face rules for every face: the bundled subset when built, else local copies only"""
+    manifest = load_font_manifest() if bundled else {}
+    rules = []
+    for (family, weight), (local_names, _) in WEB_FONTS.items():
+        sources = [f"local('{name}')" for name in local_names]
+        filename = manifest.get(f"{family}:{weight}")
+        if filename:
+            sources.append(f"url('{FONT_URL_PREFIX}/{filename}') format('woff2')")
+        rules.append(f"@font-face {{ font-family: '{family}'; font-style: normal; font-weight: {weight}; "
+                     f"font-display: swap; src: {', '.join(sources)}; }}")
+    return "\n".join(rules)
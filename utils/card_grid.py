@@ -0,0 +1,23 @@
+import streamlit as st
+
+# Card layouts are sent as one markdown element per grid rather than a column,
+# a container and a markdown call per card, so the number of delta messages a
+# rerun sends stays flat however many cards are shown
+# (python -m scripts.audit_element_counts reports it per page)
+
+def compact_html(html):
+    """HTML without indentation or blank lines, so markdown never turns part of it into a code block"""
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+def card_grid_html(cards, columns=3, min_width=250, gap='1rem'):
+    """A CSS grid of up to `columns` cards per row that wraps below min_width pixels per card"""
+    track = f"minmax(max({min_width}px, calc((100% - {columns - 1} * {gap}) / {columns})), 1fr)"
+    return compact_html(f"""
+    <div style="display: grid; grid-template-columns: repeat(auto-fill, {track}); gap: {gap}; align-items: start;">
+        {''.join(cards)}
+    </div>
+    """)
+
+def render_card_grid(cards, columns=3, min_width=250, gap='1rem', styles=''):
+    """Emit a whole grid of card HTML, plus any styles it needs, as a single element"""
+    st.markdown(compact_html(styles) + card_grid_html(cards, columns, min_width, gap), unsafe_allow_html=True)
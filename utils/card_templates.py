@@ -0,0 +1,46 @@
+import string
+import threading
+from collections import OrderedDict
+from utils.card_grid import compact_html
+
+# Card templates are compiled once, at import: the markup is compacted and parsed
+# into a string.Template with $field placeholders. Rendered cards are memoized per
+# (template, record id, data version), so pagination, filter changes and reruns
+# reuse a record's markup instead of formatting it again; new data means a new
+# version and therefore fresh cards. Field values are inserted as given, so
+# numbers are formatted by the caller.
+CARD_CACHE_MAX_ENTRIES = 4096
+
+_rendered_cards = OrderedDict()
+_rendered_cards_lock = threading.Lock()
+
+class CardTemplate:
+    """The HTML of one kind of card, compiled once and rendered per record"""
+
+    def __init__(self, name, source):
+        self.name = name
+        self._template = string.Template(compact_html(source))
+
+    def render(self, **fields):
+        """Fill the template; every $field in it must be given"""
+        return self._template.substitute(fields)
+
+    def render_cached(self, record_id, data_version, fields):
+        """The record's card, calling fields() for the template's values only on a miss"""
+        key = (self.name, record_id, data_version)
+        with _rendered_cards_lock:
+            html = _rendered_cards.get(key)
+            if html is not None:
+                _rendered_cards.move_to_end(key)
+                return html
+        html = self.render(**fields())
+        with _rendered_cards_lock:
+            _rendered_cards[key] = html
+            while len(_rendered_cards) > CARD_CACHE_MAX_ENTRIES:
+                _rendered_cards.popitem(last=False)
+        return html
+
+def clear_card_cache():
+    """Drop every memoized card"""
+    with _rendered_cards_lock:
+        _rendered_cards.clear()
@@ -0,0 +1,10 @@
+import hashlib
+import pandas as pd
+
+def get_data_version(*dataframes):
+    """Short content hash of one or more DataFrames, used to key caches of derived output"""
+    hasher = hashlib.sha1()
+    for df in dataframes:
+        hasher.update(str(tuple(df.columns)).encode())
+        hasher.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return hasher.hexdigest()[:16]
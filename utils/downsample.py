@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+# Most points a line chart sends to the browser; well above what a 1200px-wide
+# chart can show distinctly, so downsampled lines look identical to the full ones
+DEFAULT_POINT_BUDGET = 1000
+
+def _numeric_x(x):
+    """x as floats for triangle areas: datetimes as nanoseconds, categories by position"""
+    x = pd.Series(x)
+    if pd.api.types.is_datetime64_any_dtype(x):
+        return x.astype('int64').to_numpy(dtype=float)
+    if pd.api.types.is_numeric_dtype(x):
+        return x.to_numpy(dtype=float)
+    return np.arange(len(x), dtype=float)
+
+def lttb_indices(x, y, threshold):
+    """Indices of the points Largest-Triangle-Three-Buckets keeps out of len(y)
+
+    The first and last points are always kept; every bucket in between keeps the
+    point forming the largest triangle with the previously kept point and the next
+    bucket's average, which preserves peaks, dips and overall shape.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = _numeric_x(x)
+    y = pd.Series(y).to_numpy(dtype=float)
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(int)
+    keep = np.empty(threshold, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+
+    # Average of every bucket at once; the last "bucket" is just the final point
+    valid = ~np.isnan(y)
+    counts = np.maximum(np.add.reduceat(valid.astype(int), edges), 1)
+    mean_x = np.add.reduceat(x, edges) / np.diff(np.append(edges, n))
+    mean_y = np.add.reduceat(np.where(valid, y, 0.0), edges) / counts
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_x, next_y = mean_x[bucket + 1], mean_y[bucket + 1]
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        keep[bucket + 1] = previous
+    return keep
+
+def downsample(df, x_column, y_columns, max_points=DEFAULT_POINT_BUDGET):
+    """Rows of df that keep the shape of every y column within max_points
+
+    Each column gets an equal share of the budget and the kept rows are merged, so
+    traces drawn from the result still share their x values.
+    """
+    y_columns = [col for col in y_columns if col in df.columns]
+    if len(df) <= max_points or not y_columns:
+        return df
+    per_column = max(3, max_points // len(y_columns))
+    kept = set()
+    for col in y_columns:
+        kept.update(lttb_indices(df[x_column], df[col], per_column).tolist())
+    return df.iloc[sorted(kept)]
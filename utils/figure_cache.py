@@ -0,0 +1,109 @@
+import streamlit as st
+import functools
+import hashlib
+import pickle
+import types
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from utils.data_version import get_data_version
+
+# Figures are cached as their plain plotly JSON spec, keyed by the builder and a
+# fingerprint of everything it reads (DataFrames by content version, widget values
+# by value). A hit skips trace construction and layout validation entirely: the
+# spec is wrapped back into a Figure with _validate=False. Functions are keyed by
+# their code, defaults, closure cells and the module globals their code names, so
+# editing a module-level constant or helper a builder reads invalidates its
+# figures; modules and classes it reads are assumed not to change at runtime.
+FIGURE_CACHE_MAX_ENTRIES = 512
+
+def _code_fingerprint(code):
+    """Hash of a code object's bytecode, names and constants, including nested functions"""
+    hasher = hashlib.sha1(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        hasher.update((_code_fingerprint(const) if hasattr(const, 'co_code') else repr(const)).encode())
+    return hasher.hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _global_names(code):
+    """Names a code object (and the functions nested in it) may look up as globals"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            names |= _global_names(const)
+    return frozenset(names)
+
+def _cell_value(cell):
+    """A closure cell's contents, or a marker for a variable not assigned yet"""
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return ('empty cell',)
+
+def fingerprint(value, _seen=()):
+    """Stable, cheap identity for a builder input"""
+    if isinstance(value, pd.DataFrame):
+        return ('df', get_data_version(value))
+    if isinstance(value, pd.Series):
+        return ('series', value.name, get_data_version(value.to_frame()))
+    if isinstance(value, np.ndarray):
+        return ('array', value.dtype.str, value.shape, hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(fingerprint(item, _seen) for item in value))
+    if isinstance(value, dict):
+        return ('dict', tuple((key, fingerprint(item, _seen)) for key, item in value.items()))
+    if callable(value):
+        name = (getattr(value, '__module__', None), getattr(value, '__qualname__', repr(value)))
+        code = getattr(value, '__code__', None)
+        if code is None or id(value) in _seen:
+            return ('callable',) + name
+        # Lambdas and closures sharing a qualname differ by code, defaults and captured values
+        _seen = _seen + (id(value),)
+        captured = tuple(_cell_value(cell) for cell in value.__closure__ or ())
+        module_globals = getattr(value, '__globals__', {})
+        used_globals = tuple((global_name, module_globals[global_name])
+                             for global_name in sorted(_global_names(code))
+                             if global_name in module_globals
+                             and not isinstance(module_globals[global_name], (types.ModuleType, type)))
+        return ('function',) + name + (_code_fingerprint(code), fingerprint(value.__defaults__ or (), _seen),
+                                       fingerprint(captured, _seen), fingerprint(used_globals, _seen))
+    try:
+        return ('value', hashlib.sha1(pickle.dumps(value)).hexdigest())
+    except Exception:
+        return ('repr', repr(value))
+
+def _builder_name(builder):
+    return f"{builder.__module__}.{builder.__qualname__}"
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_MAX_ENTRIES)
+def _figure_spec(builder_name, inputs, _builder, _args, _kwargs):
+    """Run a figure builder once per input fingerprint and keep its plotly spec"""
+    return _builder(*_args, **_kwargs).to_plotly_json()
+
+def figure_from_spec(spec):
+    """Wrap a cached plotly spec back into a Figure without re-validating it"""
+    return go.Figure(spec, _validate=False)
+
+def cached_figure(builder, *args, **kwargs):
+    """Build a figure through the cache
+
+    The key covers the builder's code, its arguments, the module globals it reads
+    and, for nested builder functions, every variable they close over, so inline
+    chart code can be cached by wrapping it in a local function without listing
+    its inputs by hand.
+    """
+    inputs = (fingerprint(builder), fingerprint(args), fingerprint(kwargs))
+    return figure_from_spec(_figure_spec(_builder_name(builder), inputs, builder, args, kwargs))
+
+def figure_cache(builder):
+    """Decorator form of cached_figure for module-level chart builders"""
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        return cached_figure(builder, *args, **kwargs)
+    wrapper.uncached = builder
+    return wrapper
+
+def clear_figure_cache():
+    """Drop every cached figure spec"""
+    _figure_spec.clear()
@@ -0,0 +1,63 @@
+import json
+import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
+
+# Serialized bytes a single figure may add to a rerun before the auditor flags it
+FIGURE_PAYLOAD_BUDGET = 150_000
+
+# Trace attributes that carry map geometry rather than data
+GEOMETRY_KEYS = ('geojson',)
+
+def _json_size(value):
+    """Bytes of a value serialized the way plotly_chart sends it (compact JSON)"""
+    return len(json.dumps(value, separators=(',', ':'), cls=PlotlyJSONEncoder).encode())
+
+def figure_title(layout):
+    """Plain-text title of a figure layout, or '' if it has none"""
+    title = layout.get('title') or {}
+    return (title.get('text') if isinstance(title, dict) else str(title)) or ''
+
+def figure_payload(figure):
+    """Serialized size of a figure (Figure, dict spec or JSON string) broken down by part
+
+    Returns a dict with total, data, geometry, layout (of which template) and frames
+    byte counts plus one entry per trace holding its bytes and its largest attributes.
+    """
+    if isinstance(figure, go.Figure):
+        spec = figure.to_plotly_json()
+    elif isinstance(figure, str):
+        spec = json.loads(figure)
+    else:
+        spec = figure
+
+    traces = []
+    geometry = 0
+    for index, trace in enumerate(spec.get('data', [])):
+        attributes = sorted(((key, _json_size(value)) for key, value in trace.items()),
+                            key=lambda item: -item[1])
+        trace_geometry = sum(size for key, size in attributes if key in GEOMETRY_KEYS)
+        geometry += trace_geometry
+        traces.append({
+            'index': index,
+            'type': trace.get('type', 'scatter'),
+            'name': trace.get('name') or '',
+            'bytes': _json_size(trace),
+            'geometry': trace_geometry,
+            'largest': attributes[:3],
+        })
+
+    layout = spec.get('layout', {})
+    return {
+        'title': figure_title(layout),
+        'total': _json_size(spec),
+        'traces': traces,
+        'data': sum(trace['bytes'] for trace in traces) - geometry,
+        'geometry': geometry,
+        'layout': _json_size(layout),
+        'template': _json_size(layout['template']) if layout.get('template') else 0,
+        'frames': _json_size(spec.get('frames', [])) if spec.get('frames') else 0,
+    }
+
+def over_budget(payload, budget=FIGURE_PAYLOAD_BUDGET):
+    """True when a figure_payload() result exceeds the byte budget"""
+    return payload['total'] > budget
@@ -0,0 +1,99 @@
+import copy
+import json
+import os
+from functools import lru_cache
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Charts are written as plain {'data': [...], 'layout': {...}} specs and wrapped
+# without plotly's per-property validation, which dominates build time for simple
+# bar and line charts. Specs must therefore use the nested form plotly would
+# produce (marker=dict(color=...), not marker_color=...). Running with
+# FIGURE_SPEC_VALIDATE=1, as python -m scripts.validate_figure_specs does,
+# validates every spec and checks the fast path renders the same JSON.
+VALIDATE_SPECS = os.environ.get('FIGURE_SPEC_VALIDATE') == '1'
+
+def _first_difference(left, right, path='figure'):
+    """Path to the first value that differs between two JSON trees, or None"""
+    if isinstance(left, dict) and isinstance(right, dict):
+        for key in sorted(set(left) | set(right)):
+            found = _first_difference(left.get(key), right.get(key), f"{path}.{key}")
+            if found:
+                return found
+        return None
+    if isinstance(left, list) and isinstance(right, list) and len(left) == len(right):
+        for index, (a, b) in enumerate(zip(left, right)):
+            found = _first_difference(a, b, f"{path}[{index}]")
+            if found:
+                return found
+        return None
+    return None if left == right else path
+
+def check_spec(spec):
+    """Validate a spec and confirm the unvalidated figure serializes identically"""
+    validated = go.Figure(copy.deepcopy(spec))
+    fast = go.Figure(copy.deepcopy(spec), _validate=False)
+    difference = _first_difference(json.loads(validated.to_json()), json.loads(fast.to_json()))
+    if difference:
+        raise ValueError(f"Figure spec renders differently without validation at {difference}")
+    return validated
+
+def build_figure(data, layout=None, frames=None):
+    """Figure from plain trace, layout and frame dicts, validated only when VALIDATE_SPECS is set"""
+    spec = {'data': data, 'layout': layout or {}}
+    if frames:
+        spec['frames'] = frames
+    if VALIDATE_SPECS:
+        return check_spec(spec)
+    return go.Figure(spec, _validate=False)
+
+def axis_style(**style):
+    """Axis properties in nested form; title_font=... becomes title=dict(font=...)"""
+    title_font = style.pop('title_font', None)
+    title_text = style.pop('title_text', None)
+    if title_font or title_text:
+        title = style.setdefault('title', {})
+        if title_text:
+            title['text'] = title_text
+        if title_font:
+            title['font'] = title_font
+    return style
+
+def style_axes(layout, x=None, y=None):
+    """Apply shared x/y axis styles to every x and y axis of a layout, like update_xaxes/update_yaxes"""
+    for key in [key for key in layout if key.startswith(('xaxis', 'yaxis'))] or ['xaxis', 'yaxis']:
+        style = x if key.startswith('xaxis') else y
+        if style:
+            axis = layout.setdefault(key, {})
+            for name, value in copy.deepcopy(style).items():
+                if isinstance(value, dict) and isinstance(axis.get(name), dict):
+                    axis[name].update(value)
+                else:
+                    axis[name] = value
+    return layout
+
+@lru_cache(maxsize=64)
+def _colorscale(name):
+    return tuple(tuple(step) for step in go.bar.Marker(colorscale=name).colorscale)
+
+def colorscale(name):
+    """A named colorscale expanded the way validation would, so specs can use names"""
+    return [list(step) for step in _colorscale(name)]
+
+@lru_cache(maxsize=16)
+def _subplot_grid(rows, cols, specs_json, kwargs_json):
+    """Axis domains and per-cell axis refs from make_subplots, computed once per grid shape"""
+    fig = make_subplots(rows=rows, cols=cols, specs=json.loads(specs_json), **json.loads(kwargs_json))
+    layout = fig.layout.to_plotly_json()
+    layout.pop('template', None)
+    refs = {}
+    for row_index, row in enumerate(fig._grid_ref):
+        for col_index, cell in enumerate(row):
+            if cell:
+                refs[(row_index + 1, col_index + 1)] = dict(cell[0].trace_kwargs)
+    return layout, refs
+
+def subplot_grid(rows, cols, specs=None, **kwargs):
+    """(layout, refs) for a make_subplots grid; refs[(row, col)] holds the xaxis/yaxis keys for that cell"""
+    layout, refs = _subplot_grid(rows, cols, json.dumps(specs), json.dumps(kwargs, sort_keys=True))
+    return copy.deepcopy(layout), copy.deepcopy(refs)
@@ -0,0 +1,167 @@
+import json
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# State boundaries are read from Datasets/geo, pre-simplified at a few tolerances
+# by python -m scripts.build_geojson and committed, so the map never fetches
+# geometry at render time and small maps don't ship detail nobody can see. Only if
+# those files go missing does the map fall back to the remote source, and it says
+# so in the log.
+GEO_DIR = os.path.join('Datasets', 'geo')
+INDIA_GEOJSON_URL = "https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson"
+INDIA_FEATURE_KEY = 'ST_NM'
+
+# Canonical state dimension: one row per state/UT with its GeoJSON name and map
+# centroid, plus the alternate spellings the datasets use, so every map joins
+# against the same table instead of keeping its own name dictionaries
+STATE_DIMENSION_PATH = os.path.join(GEO_DIR, 'india_states.csv')
+
+# Simplification tolerance in degrees for each bundled resolution, finest first
+GEO_RESOLUTIONS = {
+    'high': 0.01,
+    'medium': 0.03,
+    'low': 0.08,
+}
+# Latitude span of the mainland plus islands, used to turn pixels into degrees
+INDIA_LAT_SPAN = 31.0
+
+def geojson_path(resolution):
+    """Bundled GeoJSON file for one resolution"""
+    return os.path.join(GEO_DIR, f"india_states_{resolution}.geojson")
+
+def choose_resolution(display_height):
+    """Coarsest bundled resolution whose tolerance stays under one screen pixel"""
+    degrees_per_pixel = INDIA_LAT_SPAN / max(display_height, 1)
+    for resolution, tolerance in sorted(GEO_RESOLUTIONS.items(), key=lambda item: -item[1]):
+        if tolerance <= degrees_per_pixel:
+            return resolution
+    return next(iter(GEO_RESOLUTIONS))
+
+@lru_cache(maxsize=None)
+def load_india_geojson(resolution):
+    """Bundled state boundaries at one resolution, read once per process; None if not built"""
+    path = geojson_path(resolution)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+        return None
+
+@lru_cache(maxsize=1)
+def _warn_remote_geojson():
+    """Log, once per process, that the browser will fetch the boundaries remotely"""
+    print(f"Warning: no bundled state boundaries in {GEO_DIR}, the map will fetch {INDIA_GEOJSON_URL}. "
+          f"Run python -m scripts.build_geojson and commit the output.")
+
+def get_india_geojson(display_height=600):
+    """State boundaries for a map of this height, falling back (with a warning) to the remote source URL"""
+    geojson = load_india_geojson(choose_resolution(display_height))
+    if geojson is None:
+        _warn_remote_geojson()
+        return INDIA_GEOJSON_URL
+    return geojson
+
+def normalize_state_names(names):
+    """Vectorized join key for state names: case, '&'/'and', 'UT of' and punctuation insensitive"""
+    return (names.astype(str).str.lower()
+            .str.replace('&', ' and ', regex=False)
+            .str.replace(r'^\s*ut of\s+', '', regex=True)
+            .str.replace(r'[^a-z]', '', regex=True))
+
+@lru_cache(maxsize=1)
+def load_state_dimension():
+    """Canonical state table indexed by normalized name, with one row per spelling"""
+    try:
+        states = pd.read_csv(STATE_DIMENSION_PATH, keep_default_na=False)
+    except Exception as e:
+        print(f"Error loading {STATE_DIMENSION_PATH}: {e}")
+        return pd.DataFrame(columns=['STATE', 'GEO_NAME', 'LATITUDE', 'LONGITUDE'])
+    spellings = states['STATE'] + '|' + states['GEO_NAME'] + '|' + states['ALIASES']
+    aliases = states.drop(columns='ALIASES').assign(NAME=spellings.str.split('|')).explode('NAME')
+    aliases = aliases[aliases['NAME'] != '']
+    aliases.index = normalize_state_names(aliases['NAME'])
+    return aliases.drop(columns='NAME')[lambda df: ~df.index.duplicated()]
+
+def attach_state_dimension(df, state_column='STATE'):
+    """df with the canonical STATE_CANONICAL, GEO_NAME, LATITUDE and LONGITUDE joined on state_column"""
+    dimension = load_state_dimension().rename(columns={'STATE': 'STATE_CANONICAL'})
+    matched = dimension.reindex(normalize_state_names(df[state_column]))
+    matched.index = df.index
+    joined = pd.concat([df, matched], axis=1)
+    # Keep unmatched rows; they still get a name the GeoJSON might know
+    joined['GEO_NAME'] = joined['GEO_NAME'].fillna(joined[state_column])
+    return joined
+
+def simplify_line(points, tolerance):
+    """Douglas-Peucker simplification of an (n, 2) coordinate array"""
+    if len(points) < 3:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = np.hypot(*segment)
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return points[keep]
+
+def simplify_ring(ring, tolerance):
+    """Simplify a closed polygon ring, or return None if it collapses below a triangle"""
+    points = np.asarray(ring, dtype=float)
+    if tolerance > 0:
+        points = simplify_line(points, tolerance)
+    if len(points) < 4:
+        return None
+    return points
+
+def simplify_geometry(geometry, tolerance, precision):
+    """Simplify a Polygon/MultiPolygon, dropping rings and islands smaller than the tolerance"""
+    polygons = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+    simplified = []
+    for polygon in polygons:
+        rings = [simplify_ring(ring, tolerance) for ring in polygon]
+        if rings[0] is None:
+            continue
+        simplified.append([np.round(ring, precision).tolist() for ring in rings if ring is not None])
+
+    if not simplified:
+        # Never drop a whole state: keep its largest polygon's outline unsimplified
+        largest = max(polygons, key=lambda polygon: len(polygon[0]))
+        simplified = [[np.round(np.asarray(largest[0], dtype=float), precision).tolist()]]
+    if len(simplified) == 1:
+        return {'type': 'Polygon', 'coordinates': simplified[0]}
+    return {'type': 'MultiPolygon', 'coordinates': simplified}
+
+def simplify_geojson(geojson, tolerance, feature_key=INDIA_FEATURE_KEY):
+    """A copy of a FeatureCollection with simplified geometry and only the id property kept"""
+    # Round coordinates to roughly a tenth of the tolerance; finer digits are noise
+    precision = max(2, int(np.ceil(-np.log10(tolerance))) + 1) if tolerance > 0 else 6
+    features = []
+    for feature in geojson['features']:
+        geometry = feature.get('geometry')
+        if not geometry or geometry['type'] not in ('Polygon', 'MultiPolygon'):
+            continue
+        features.append({
+            'type': 'Feature',
+            'properties': {feature_key: feature['properties'][feature_key]},
+            'geometry': simplify_geometry(geometry, tolerance, precision),
+        })
+    return {'type': 'FeatureCollection', 'features': features}
@@ -5,6 +5,12 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from PIL import Image
 import os
+from utils.downsample import DEFAULT_POINT_BUDGET, downsample
+from utils.figure_cache import figure_cache
+from utils.figure_specs import axis_style, build_figure, style_axes, subplot_grid
+from utils.ita_metrics import get_ita_metrics
+from utils.geo import INDIA_FEATURE_KEY, attach_state_dimension, get_india_geojson
+from utils.lite_mode import render_chart
 
 def display_image_safely(image_path, caption="", width=None):
     """Safely display image with error handling"""
@@ -17,80 +23,43 @@ def display_image_safely(image_path, caption="", width=None):
     except Exception as e:
         st.error(f"Error loading image: {e}")
 
+# Green scale shared by every India map
+MAP_COLOR_SCALE = [[0, '#E8F5E8'], [0.2, '#B8E6B8'], [0.4, '#7DD87D'], [0.6, '#4CAF50'], [0.8, '#2E7D32'], [1, '#1B5E20']]
+
+def prepare_state_map_data(state_tourism_df, year_columns):
+    """Per-state totals, average, 2022-23 growth and map keys, computed column-wise"""
+    if state_tourism_df.empty or 'STATE' not in state_tourism_df.columns:
+        return pd.DataFrame()
+
+    states = attach_state_dimension(state_tourism_df)
+    totals = states[[col for col in year_columns if col in states.columns]].sum(axis=1)
+    previous, latest = states['YEAR_2022'], states['YEAR_2023']
+    growth = ((latest - previous) / previous.where(previous > 0) * 100).fillna(0)
+
+    return pd.DataFrame({
+        'State': states['STATE'],
+        'State_Mapped': states['GEO_NAME'],
+        'Tourism_2023': latest,
+        'Tourism_2022': previous,
+        'Total_All_Years': totals,
+        'Avg_Per_Year': totals / len(year_columns),
+        'Growth_2022_23': growth,
+        'Region': states['REGION'],
+        'Latitude': states['LATITUDE'],
+        'Longitude': states['LONGITUDE'],
+    })
+
 def create_india_map(state_tourism_df):
     """Create an interactive choropleth map of India with tourism data"""
 
-    # State name mapping for GeoJSON compatibility
-    state_name_mapping = {
-        'Andhra Pradesh': 'Andhra Pradesh',
-        'Arunachal Pradesh': 'Arunachal Pradesh',
-        'Assam': 'Assam',
-        'Bihar': 'Bihar',
-        'Chhattisgarh': 'Chhattisgarh',
-        'Goa': 'Goa',
-        'Gujarat': 'Gujarat',
-        'Haryana': 'Haryana',
-        'Himachal Pradesh': 'Himachal Pradesh',
-        'Jharkhand': 'Jharkhand',
-        'Karnataka': 'Karnataka',
-        'Kerala': 'Kerala',
-        'Madhya Pradesh': 'Madhya Pradesh',
-        'Maharashtra': 'Maharashtra',
-        'Manipur': 'Manipur',
-        'Meghalaya': 'Meghalaya',
-        'Mizoram': 'Mizoram',
-        'Nagaland': 'Nagaland',
-        'Odisha': 'Odisha',
-        'Punjab': 'Punjab',
-        'Rajasthan': 'Rajasthan',
-        'Sikkim': 'Sikkim',
-        'Tamil Nadu': 'Tamil Nadu',
-        'Telangana': 'Telangana',
-        'Tripura': 'Tripura',
-        'Uttar Pradesh': 'Uttar Pradesh',
-        'Uttarakhand': 'Uttarakhand',
-        'West Bengal': 'West Bengal',
-        'Andaman & Nicobar Island': 'Andaman & Nicobar',
-        'Chandigarh': 'Chandigarh',
-        'Dadra & Nagar Haveli': 'Dadra and Nagar Haveli and Daman and Diu',
-        'Delhi': 'Delhi',
-        'Jammu & Kashmir': 'Jammu & Kashmir',
-        'Ladakh': 'Ladakh',
-        'Lakshadweep': 'Lakshadweep',
-        'Puducherry': 'Puducherry'
-    }
-
-    # Prepare map data with total tourism across all years (2017-2023)
-    map_data = []
+    # Prepare map data with total tourism across all years (2017-2023), joined to
+    # the canonical state table for GeoJSON names and centroids
     year_columns = ['YEAR_2017', 'YEAR_2018', 'YEAR_2019', 'YEAR_2020', 'YEAR_2021', 'YEAR_2022', 'YEAR_2023']
+    map_df = prepare_state_map_data(state_tourism_df, year_columns)
 
-    for idx, row in state_tourism_df.iterrows():
-        state_name = row['STATE']
-
-        # Calculate total across all years
-        total_all_years = sum([row[col] for col in year_columns if col in row and pd.notna(row[col])])
-
-        # Calculate recent growth (2022 to 2023)
-        growth = ((row['YEAR_2023'] - row['YEAR_2022']) / row['YEAR_2022']) * 100 if row['YEAR_2022'] > 0 else 0
-
-        # Calculate average per year
-        avg_per_year = total_all_years / len(year_columns)
-
-        map_data.append({
-            'State': state_name,
-            'State_Mapped': state_name_mapping.get(state_name, state_name),
-            'Tourism_2023': row['YEAR_2023'],
-            'Tourism_2022': row['YEAR_2022'],
-            'Total_All_Years': total_all_years,
-            'Avg_Per_Year': avg_per_year,
-            'Growth_2022_23': growth,
-            'Region': row['REGION']
-        })
-
-    if map_data:
-        map_df = pd.DataFrame(map_data)
-
-        # Create choropleth map using built-in India geojson
+    if not map_df.empty:
+        # Create choropleth map from the bundled state boundaries, sized to the map
+        map_height = 600
         try:
             fig = px.choropleth(
                 map_df,
@@ -106,9 +75,9 @@ def create_india_map(state_tourism_df):
                     'Avg_Per_Year': False,
                     'Growth_2022_23': False
                 },
-                color_continuous_scale=[[0, '#E8F5E8'], [0.2, '#B8E6B8'], [0.4, '#7DD87D'], [0.6, '#4CAF50'], [0.8, '#2E7D32'], [1, '#1B5E20']],
-                geojson="https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson",
-                featureidkey='properties.ST_NM',
+                color_continuous_scale=MAP_COLOR_SCALE,
+                geojson=get_india_geojson(map_height),
+                featureidkey=f'properties.{INDIA_FEATURE_KEY}',
                 projection='mercator',
                 title='🗺️ India Tourism Map - Total Tourist Arrivals (2017-2023)',
                 labels={
@@ -132,7 +101,7 @@ def create_india_map(state_tourism_df):
             )
 
             fig.update_layout(
-                height=600,
+                height=map_height,
                 font=dict(size=12),
                 title=dict(
                     text='🗺️ India Tourism Map - Total Tourist Arrivals (2017-2023)',
@@ -155,7 +124,7 @@ def create_india_map(state_tourism_df):
                 )
             )
 
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart(fig)
 
             # Map legend as compact single line
             st.markdown("""
@@ -173,55 +142,109 @@ def create_india_map(state_tourism_df):
     else:
         st.warning("Unable to create map - tourism data not available")
 
+def state_year_values(state_df):
+    """(states, years, values): canonical state rows, YEAR_* labels and a states x years array in millions"""
+    year_columns = sorted(col for col in state_df.columns if col.startswith('YEAR_'))
+    states = attach_state_dimension(state_df)
+    values = states[year_columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float) / 1e6
+    return states, [col.removeprefix('YEAR_') for col in year_columns], values
+
+@figure_cache
+def animated_india_map_figure(state_df, segment, map_height=600):
+    """Year-by-year choropleth: geometry lives in the one trace, each frame carries only z"""
+    states, years, values = state_year_values(state_df)
+    latest = len(years) - 1
+
+    def year_values(index):
+        return [None if pd.isna(value) else round(value, 4) for value in values[:, index]]
+
+    data = [dict(
+        type='choropleth',
+        geojson=get_india_geojson(map_height),
+        featureidkey=f'properties.{INDIA_FEATURE_KEY}',
+        locations=states['GEO_NAME'].tolist(),
+        z=year_values(latest),
+        # One colour range for every year so frames compare like for like
+        zmin=0,
+        zmax=float(pd.Series(values.ravel()).max()),
+        colorscale=MAP_COLOR_SCALE,
+        text=states['STATE'].tolist(),
+        hovertemplate='<b>%{text}</b><br>%{z:,.2f}M arrivals<extra></extra>',
+        marker=dict(line=dict(color='white', width=0.5)),
+        colorbar=dict(
+            title=dict(text=f"{segment} Tourists<br>(Million)", font=dict(size=14, color='#008080', family="Arial Black")),
+            tickfont=dict(size=11, color='#008080', family="Arial"),
+            thickness=15,
+            len=0.7,
+            x=1.02,
+        ),
+    )]
+    frames = [dict(name=year, traces=[0], data=[dict(type='choropleth', z=year_values(index))]) for index, year in enumerate(years)]
+
+    frame_args = dict(mode='immediate', frame=dict(duration=700, redraw=True), transition=dict(duration=0))
+    layout = dict(
+        height=map_height,
+        font=dict(size=12),
+        title=dict(
+            text=f'🗺️ India Tourism Map - {segment} Tourist Arrivals by Year',
+            font=dict(size=18, color='#008080', family="Arial Black"),
+            x=0.25,
+            y=0.95
+        ),
+        margin={"r": 0, "t": 60, "l": 0, "b": 0},
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        geo=dict(
+            fitbounds="locations",
+            projection=dict(type='mercator'),
+            visible=False,
+            showframe=False,
+            showcoastlines=False,
+            showland=False,
+            showocean=False,
+            bgcolor='rgba(0,0,0,0)'
+        ),
+        updatemenus=[dict(
+            type='buttons',
+            direction='left',
+            x=0.1, y=0, xanchor='right', yanchor='top',
+            pad=dict(r=10, t=40),
+            showactive=False,
+            buttons=[
+                dict(label='▶', method='animate', args=[None, dict(frame_args, fromcurrent=True)]),
+                dict(label='⏸', method='animate', args=[[None], dict(frame_args, frame=dict(duration=0, redraw=False))]),
+            ],
+        )],
+        sliders=[dict(
+            active=latest,
+            x=0.1, y=0, len=0.85, xanchor='left', yanchor='top',
+            pad=dict(t=30),
+            currentvalue=dict(prefix='Year: ', font=dict(size=14, color='#008080')),
+            steps=[dict(label=year, method='animate', args=[[year], frame_args]) for year in years],
+        )],
+    )
+    return build_figure(data, layout, frames)
+
+def create_animated_india_map(state_df, segment='Total'):
+    """Animated choropleth of one arrivals segment across every YEAR_* column"""
+    if state_df.empty or 'STATE' not in state_df.columns:
+        st.warning("Unable to create map - tourism data not available")
+        return
+
+    render_chart(animated_india_map_figure(state_df, segment))
+    st.markdown("""
+    <div style="background-color: #f0f0f0; padding: 6px; border-radius: 5px; margin: 8px 0;">
+        <p style="font-size: 0.8rem; color: black; text-align: center; margin: 0; font-weight: bold;">
+            <strong>▶️ Animated:</strong> Press play or drag the year slider | <strong>📍 Color Guide:</strong> Same scale for every year
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
 def create_fallback_scatter_map(map_df):
     """Fallback scatter map if choropleth fails"""
 
-    # State coordinates for fallback scatter map
-    state_coordinates = {
-        'Andhra Pradesh': [15.9129, 79.7400],
-        'Arunachal Pradesh': [28.2180, 94.7278],
-        'Assam': [26.2006, 92.9376],
-        'Bihar': [25.0961, 85.3131],
-        'Chhattisgarh': [21.2787, 81.8661],
-        'Goa': [15.2993, 74.1240],
-        'Gujarat': [23.0225, 72.5714],
-        'Haryana': [29.0588, 76.0856],
-        'Himachal Pradesh': [31.1048, 77.1734],
-        'Jharkhand': [23.6102, 85.2799],
-        'Karnataka': [15.3173, 75.7139],
-        'Kerala': [10.8505, 76.2711],
-        'Madhya Pradesh': [22.9734, 78.6569],
-        'Maharashtra': [19.7515, 75.7139],
-        'Manipur': [24.6637, 93.9063],
-        'Meghalaya': [25.4670, 91.3662],
-        'Mizoram': [23.1645, 92.9376],
-        'Nagaland': [26.1584, 94.5624],
-        'Odisha': [20.9517, 85.0985],
-        'Punjab': [31.1471, 75.3412],
-        'Rajasthan': [27.0238, 74.2179],
-        'Sikkim': [27.5330, 88.5122],
-        'Tamil Nadu': [11.1271, 78.6569],
-        'Telangana': [18.1124, 79.0193],
-        'Tripura': [23.9408, 91.9882],
-        'Uttar Pradesh': [26.8467, 80.9462],
-        'Uttarakhand': [30.0668, 79.0193],
-        'West Bengal': [22.9868, 87.8550],
-        'Andaman and Nicobar Islands': [11.7401, 92.6586],
-        'Chandigarh': [30.7333, 76.7794],
-        'Dadra and Nagar Haveli and Daman and Diu': [20.1809, 73.0169],
-        'Delhi': [28.7041, 77.1025],
-        'Jammu and Kashmir': [34.0837, 74.7973],
-        'Ladakh': [34.1526, 77.5771],
-        'Lakshadweep': [10.5667, 72.6417],
-        'Puducherry': [11.9416, 79.8083]
-    }
-
-    # Add coordinates to map data
-    for idx, row in map_df.iterrows():
-        state_name = row['State']
-        if state_name in state_coordinates:
-            map_df.at[idx, 'lat'] = state_coordinates[state_name][0]
-            map_df.at[idx, 'lon'] = state_coordinates[state_name][1]
+    # Centroids come from the state dimension joined in prepare_state_map_data
+    map_df = map_df.rename(columns={'Latitude': 'lat', 'Longitude': 'lon'})
 
     # Filter out states without coordinates
     map_df = map_df.dropna(subset=['lat', 'lon'])
@@ -244,7 +267,7 @@ def create_fallback_scatter_map(map_df):
                 'Avg_Per_Year': False,
                 'Growth_2022_23': False
             },
-            color_continuous_scale=[[0, '#E8F5E8'], [0.2, '#B8E6B8'], [0.4, '#7DD87D'], [0.6, '#4CAF50'], [0.8, '#2E7D32'], [1, '#1B5E20']],
+            color_continuous_scale=MAP_COLOR_SCALE,
             size_max=30,
             zoom=4,
             center={'lat': 20.5937, 'lon': 78.9629},
@@ -276,7 +299,7 @@ def create_fallback_scatter_map(map_df):
             )
         )
 
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(fig)
 
         st.markdown("""
         <div style="background-color: #f0f0f0; padding: 6px; border-radius: 5px; margin: 8px 0;">
@@ -286,11 +309,67 @@ def create_fallback_scatter_map(map_df):
         </div>
         """, unsafe_allow_html=True)
 
+# Shared axis styles for the homepage charts (applied to every axis, like update_xaxes/update_yaxes)
+MINIMAL_AXIS = axis_style(
+    showgrid=True,
+    gridwidth=1,
+    gridcolor='rgba(200,200,200,0.3)',
+    showline=True,
+    linewidth=1,
+    linecolor='rgba(200,200,200,0.5)',
+    tickfont=dict(color='black', size=11),
+    title_font=dict(color='black', size=12)
+)
+TREND_AXIS = axis_style(
+    showgrid=True,
+    gridwidth=1,
+    gridcolor='rgba(200,200,200,0.4)',
+    showline=True,
+    linewidth=2,
+    linecolor='#34495E',
+    tickfont=dict(color='#2C3E50', size=11, family='Arial Black'),
+    title_font=dict(color='#2C3E50', size=13, family='Arial Black'),
+    zeroline=False
+)
+LIGHT_GRID_AXIS = axis_style(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
+HORIZONTAL_LEGEND = dict(
+    orientation="h",
+    yanchor="bottom",
+    y=1.02,
+    xanchor="right",
+    x=1
+)
+
+def growth_rate_bar(ita_df):
+    """Year-over-year growth bar trace (teal for growth, grey for decline)"""
+    metrics = get_ita_metrics(ita_df)
+    return {
+        'type': 'bar',
+        'x': ita_df['YEAR'][1:],
+        'y': metrics['growth'][1:],
+        'name': 'Growth Rate',
+        'marker': {'color': metrics['growth_colors'][1:]},
+        'opacity': 0.6,
+    }
+
+def decade_average_bar(ita_df):
+    """Average arrivals per decade bar trace"""
+    decades = get_ita_metrics(ita_df)['decades']
+    return {
+        'type': 'bar',
+        'x': list(decades.keys()),
+        'y': list(decades.values()),
+        'name': 'Decade Average',
+        'marker': {'color': ['#008080', '#20B2AA', '#66CDAA']},
+        'opacity': 0.6,
+    }
+
+@figure_cache
 def create_enhanced_tourism_chart(ita_df):
     """Create an enhanced tourism growth chart"""
 
-    # Create subplots with increased spacing
-    fig = make_subplots(
+    # Subplot grid with increased spacing
+    layout, refs = subplot_grid(
         rows=2, cols=2,
         subplot_titles=('Tourism Growth Trend', 'Year-over-Year Growth',
                        'Decade Comparison', 'Recovery Analysis'),
@@ -299,23 +378,25 @@ def create_enhanced_tourism_chart(ita_df):
         vertical_spacing=0.25
     )
 
-    # Main trend line - minimalist style
-    fig.add_trace(
-        go.Scatter(
-            x=ita_df['YEAR'],
-            y=ita_df['INDIA_ARRIVALS_MILLION'],
-            mode='lines+markers',
-            name='Tourist Arrivals',
-            line=dict(color='#008080', width=2),
-            marker=dict(size=6, color='#008080'),
-            fill=None
-        ),
-        row=1, col=1
-    )
-
-    # Add COVID impact annotation - minimalist style
-    fig.add_annotation(
-        x=2020, y=ita_df[ita_df['YEAR'] == 2020]['INDIA_ARRIVALS_MILLION'].iloc[0],
+    data = [
+        # Main trend line - minimalist style
+        {
+            'type': 'scatter',
+            'x': ita_df['YEAR'],
+            'y': ita_df['INDIA_ARRIVALS_MILLION'],
+            'mode': 'lines+markers',
+            'name': 'Tourist Arrivals',
+            'line': {'color': '#008080', 'width': 2},
+            'marker': {'size': 6, 'color': '#008080'},
+            **refs[(1, 1)],
+        },
+        {**growth_rate_bar(ita_df), **refs[(2, 1)]},
+        {**decade_average_bar(ita_df), **refs[(2, 2)]},
+    ]
+
+    # COVID impact annotation - minimalist style
+    layout['annotations'].append(dict(
+        x=2020, y=get_ita_metrics(ita_df)['milestones'][2020],
         text="COVID-19",
         showarrow=True,
         arrowhead=1,
@@ -324,126 +405,69 @@ def create_enhanced_tourism_chart(ita_df):
         bordercolor="#ccc",
         borderwidth=1,
         font=dict(size=10, color="#666"),
-        row=1, col=1
-    )
-
-    # Growth rate chart - minimalist colors
-    ita_df_growth = ita_df.copy()
-    ita_df_growth['Growth Rate'] = ita_df_growth['INDIA_ARRIVALS_MILLION'].pct_change() * 100
-
-    colors = ['#008080' if x > 0 else '#999' for x in ita_df_growth['Growth Rate'].fillna(0)]
-
-    fig.add_trace(
-        go.Bar(
-            x=ita_df_growth['YEAR'][1:],
-            y=ita_df_growth['Growth Rate'][1:],
-            name='Growth Rate',
-            marker_color=colors[1:],
-            opacity=0.6
-        ),
-        row=2, col=1
-    )
-
-    # Decade comparison - minimalist colors
-    decades = {
-        '2001-2010': ita_df[(ita_df['YEAR'] >= 2001) & (ita_df['YEAR'] <= 2010)]['INDIA_ARRIVALS_MILLION'].mean(),
-        '2011-2020': ita_df[(ita_df['YEAR'] >= 2011) & (ita_df['YEAR'] <= 2020)]['INDIA_ARRIVALS_MILLION'].mean(),
-        '2021-2023': ita_df[(ita_df['YEAR'] >= 2021) & (ita_df['YEAR'] <= 2023)]['INDIA_ARRIVALS_MILLION'].mean()
-    }
-
-    fig.add_trace(
-        go.Bar(
-            x=list(decades.keys()),
-            y=list(decades.values()),
-            name='Decade Average',
-            marker_color=['#008080', '#20B2AA', '#66CDAA'],
-            opacity=0.6
-        ),
-        row=2, col=2
-    )
+        xref=refs[(1, 1)]['xaxis'], yref=refs[(1, 1)]['yaxis']
+    ))
 
-    # Add horizontal separator line between top and bottom sections
-    fig.add_shape(
+    # Horizontal separator line between top and bottom sections
+    layout['shapes'] = [dict(
         type="line",
         x0=0, x1=1,
         y0=0.50, y1=0.50,
         xref="paper", yref="paper",
         line=dict(color="black", width=3)
-    )
+    )]
 
-    # Update layout - minimalist style
-    fig.update_layout(
+    layout.update(
         height=500,
         showlegend=False,
         plot_bgcolor='white',
         paper_bgcolor='white',
         font=dict(color='#666', size=11),
-        title_text="",
+        title=dict(text=""),
         margin=dict(l=40, r=40, t=40, b=40)
     )
+    style_axes(layout, x=MINIMAL_AXIS, y=MINIMAL_AXIS)
 
-    # Update axes - minimal grid with black bold labels
-    fig.update_xaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.3)',
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(200,200,200,0.5)',
-        tickfont=dict(color='black', size=11),
-        title_font=dict(color='black', size=12)
-    )
-    fig.update_yaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.3)',
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(200,200,200,0.5)',
-        tickfont=dict(color='black', size=11),
-        title_font=dict(color='black', size=12)
-    )
-
-    return fig
+    return build_figure(data, layout)
 
-def create_tourism_growth_trend_chart(ita_df):
+@figure_cache
+def create_tourism_growth_trend_chart(ita_df, max_points=DEFAULT_POINT_BUDGET):
     """Create enhanced tourism growth trend chart with attractive styling"""
 
-    fig = go.Figure()
-
-    # Add area fill first (behind the line)
-    fig.add_trace(
-        go.Scatter(
-            x=ita_df['YEAR'],
-            y=ita_df['INDIA_ARRIVALS_MILLION'],
-            mode='lines',
-            name='Tourist Arrivals',
-            line=dict(color='rgba(0,128,128,0)', width=0),
-            fill='tozeroy',
-            fillcolor='rgba(0,128,128,0.1)',
-            showlegend=False
-        )
-    )
-
-    # Main trend line with enhanced styling
-    fig.add_trace(
-        go.Scatter(
-            x=ita_df['YEAR'],
-            y=ita_df['INDIA_ARRIVALS_MILLION'],
-            mode='lines+markers',
-            name='Tourist Arrivals',
-            line=dict(color='#008080', width=4, shape='spline'),
-            marker=dict(
-                size=8,
-                color='#008080',
-                line=dict(color='white', width=2),
-                symbol='circle'
-            ),
-            hovertemplate='<b>Year:</b> %{x}<br><b>Arrivals:</b> %{y:.2f}M<extra></extra>'
-        )
-    )
+    trend_df = downsample(ita_df, 'YEAR', ['INDIA_ARRIVALS_MILLION'], max_points)
+
+    data = [
+        # Area fill first (behind the line)
+        {
+            'type': 'scatter',
+            'x': trend_df['YEAR'],
+            'y': trend_df['INDIA_ARRIVALS_MILLION'],
+            'mode': 'lines',
+            'name': 'Tourist Arrivals',
+            'line': {'color': 'rgba(0,128,128,0)', 'width': 0},
+            'fill': 'tozeroy',
+            'fillcolor': 'rgba(0,128,128,0.1)',
+            'showlegend': False,
+        },
+        # Main trend line with enhanced styling
+        {
+            'type': 'scatter',
+            'x': trend_df['YEAR'],
+            'y': trend_df['INDIA_ARRIVALS_MILLION'],
+            'mode': 'lines+markers',
+            'name': 'Tourist Arrivals',
+            'line': {'color': '#008080', 'width': 4, 'shape': 'spline'},
+            'marker': {
+                'size': 8,
+                'color': '#008080',
+                'line': {'color': 'white', 'width': 2},
+                'symbol': 'circle',
+            },
+            'hovertemplate': '<b>Year:</b> %{x}<br><b>Arrivals:</b> %{y:.2f}M<extra></extra>',
+        },
+    ]
 
-    # Add milestone markers for significant years
+    # Milestone markers for significant years
     milestones = {
         2001: "Tourism Year",
         2008: "Global Crisis",
@@ -451,12 +475,14 @@ def create_tourism_growth_trend_chart(ita_df):
         2023: "Recovery"
     }
 
+    milestone_arrivals = get_ita_metrics(ita_df)['milestones']
+    annotations = []
     for year, label in milestones.items():
-        if year in ita_df['YEAR'].values:
-            y_val = ita_df[ita_df['YEAR'] == year]['INDIA_ARRIVALS_MILLION'].iloc[0]
+        if year in milestone_arrivals:
+            y_val = milestone_arrivals[year]
             color = '#FF6B6B' if year in [2008, 2020] else '#4ECDC4'
 
-            fig.add_annotation(
+            annotations.append(dict(
                 x=year, y=y_val,
                 text=f"<b>{label}</b>",
                 showarrow=True,
@@ -468,284 +494,167 @@ def create_tourism_growth_trend_chart(ita_df):
                 borderwidth=2,
                 font=dict(size=10, color='white'),
                 ax=0, ay=-40 if year != 2020 else 40
-            )
+            ))
 
-    # Update layout with enhanced styling
-    fig.update_layout(
+    layout = dict(
+        annotations=annotations,
         height=350,
         showlegend=False,
         plot_bgcolor='rgba(248,249,250,0.8)',
         paper_bgcolor='white',
         font=dict(color='#2C3E50', size=12),
-        title_text="",
+        title=dict(text=""),
         margin=dict(l=50, r=50, t=30, b=50),
-        xaxis_title="<b>Year</b>",
-        yaxis_title="<b>Tourist Arrivals (Million)</b>",
+        xaxis=dict(title=dict(text="<b>Year</b>")),
+        yaxis=dict(title=dict(text="<b>Tourist Arrivals (Million)</b>")),
         hovermode='x unified'
     )
+    style_axes(layout, x=TREND_AXIS, y=TREND_AXIS)
 
-    # Enhanced axes styling
-    fig.update_xaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.4)',
-        showline=True,
-        linewidth=2,
-        linecolor='#34495E',
-        tickfont=dict(color='#2C3E50', size=11, family='Arial Black'),
-        title_font=dict(color='#2C3E50', size=13, family='Arial Black'),
-        zeroline=False
-    )
-    fig.update_yaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.4)',
-        showline=True,
-        linewidth=2,
-        linecolor='#34495E',
-        tickfont=dict(color='#2C3E50', size=11, family='Arial Black'),
-        title_font=dict(color='#2C3E50', size=13, family='Arial Black'),
-        zeroline=False
-    )
-
-    return fig
+    return build_figure(data, layout)
 
+@figure_cache
 def create_year_over_year_growth_chart(ita_df):
     """Create year-over-year growth chart"""
 
-    fig = go.Figure()
-
-    # Growth rate chart - minimalist colors
-    ita_df_growth = ita_df.copy()
-    ita_df_growth['Growth Rate'] = ita_df_growth['INDIA_ARRIVALS_MILLION'].pct_change() * 100
-
-    colors = ['#008080' if x > 0 else '#999' for x in ita_df_growth['Growth Rate'].fillna(0)]
-
-    fig.add_trace(
-        go.Bar(
-            x=ita_df_growth['YEAR'][1:],
-            y=ita_df_growth['Growth Rate'][1:],
-            name='Growth Rate',
-            marker_color=colors[1:],
-            opacity=0.6
-        )
-    )
-
-    # Update layout - minimalist style
-    fig.update_layout(
+    layout = dict(
         height=300,
         showlegend=False,
         plot_bgcolor='white',
         paper_bgcolor='white',
         font=dict(color='black', size=11),
-        title_text="",
+        title=dict(text=""),
         margin=dict(l=40, r=40, t=20, b=40),
-        xaxis_title="Year",
-        yaxis_title="Growth Rate (%)"
-    )
-
-    # Update axes - minimal grid with black bold labels
-    fig.update_xaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.3)',
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(200,200,200,0.5)',
-        tickfont=dict(color='black', size=11),
-        title_font=dict(color='black', size=12)
-    )
-    fig.update_yaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.3)',
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(200,200,200,0.5)',
-        tickfont=dict(color='black', size=11),
-        title_font=dict(color='black', size=12)
+        xaxis=dict(title=dict(text="Year")),
+        yaxis=dict(title=dict(text="Growth Rate (%)"))
     )
+    style_axes(layout, x=MINIMAL_AXIS, y=MINIMAL_AXIS)
 
-    return fig
+    return build_figure([growth_rate_bar(ita_df)], layout)
 
+@figure_cache
 def create_decade_comparison_chart(ita_df):
     """Create decade comparison chart"""
 
-    fig = go.Figure()
-
-    # Decade comparison - minimalist colors
-    decades = {
-        '2001-2010': ita_df[(ita_df['YEAR'] >= 2001) & (ita_df['YEAR'] <= 2010)]['INDIA_ARRIVALS_MILLION'].mean(),
-        '2011-2020': ita_df[(ita_df['YEAR'] >= 2011) & (ita_df['YEAR'] <= 2020)]['INDIA_ARRIVALS_MILLION'].mean(),
-        '2021-2023': ita_df[(ita_df['YEAR'] >= 2021) & (ita_df['YEAR'] <= 2023)]['INDIA_ARRIVALS_MILLION'].mean()
-    }
-
-    fig.add_trace(
-        go.Bar(
-            x=list(decades.keys()),
-            y=list(decades.values()),
-            name='Decade Average',
-            marker_color=['#008080', '#20B2AA', '#66CDAA'],
-            opacity=0.6
-        )
-    )
-
-    # Update layout - minimalist style
-    fig.update_layout(
+    layout = dict(
         height=300,
         showlegend=False,
         plot_bgcolor='white',
         paper_bgcolor='white',
         font=dict(color='black', size=11),
-        title_text="",
+        title=dict(text=""),
         margin=dict(l=40, r=40, t=20, b=40),
-        xaxis_title="Decade",
-        yaxis_title="Average Arrivals (Million)"
+        xaxis=dict(title=dict(text="Decade")),
+        yaxis=dict(title=dict(text="Average Arrivals (Million)"))
     )
+    style_axes(layout, x=MINIMAL_AXIS, y=MINIMAL_AXIS)
 
-    # Update axes - minimal grid with black bold labels
-    fig.update_xaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.3)',
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(200,200,200,0.5)',
-        tickfont=dict(color='black', size=11),
-        title_font=dict(color='black', size=12)
-    )
-    fig.update_yaxes(
-        showgrid=True,
-        gridwidth=1,
-        gridcolor='rgba(200,200,200,0.3)',
-        showline=True,
-        linewidth=1,
-        linecolor='rgba(200,200,200,0.5)',
-        tickfont=dict(color='black', size=11),
-        title_font=dict(color='black', size=12)
-    )
-
-    return fig
+    return build_figure([decade_average_bar(ita_df)], layout)
 
+@figure_cache
 def create_gdp_contribution_chart(tourism_gdp_df):
     """Create GDP contribution chart"""
 
-    fig = go.Figure()
-
-    # Add direct contribution line
-    fig.add_trace(
-        go.Scatter(
-            x=tourism_gdp_df['YEAR'],
-            y=tourism_gdp_df['DIRECT_CONTRIBUTION_GDP_PERCENT'],
-            mode='lines+markers',
-            name='Direct Contribution',
-            line=dict(color='#008080', width=3),
-            marker=dict(size=8, color='#008080'),
-            fill='tonexty',
-            fillcolor='rgba(0,128,128,0.1)'
-        )
-    )
-
-    # Add total contribution line
-    fig.add_trace(
-        go.Scatter(
-            x=tourism_gdp_df['YEAR'],
-            y=tourism_gdp_df['TOTAL_CONTRIBUTION_GDP_PERCENT'],
-            mode='lines+markers',
-            name='Total Contribution (Direct + Indirect)',
-            line=dict(color='#20B2AA', width=3),
-            marker=dict(size=8, color='#20B2AA'),
-            fill='tonexty',
-            fillcolor='rgba(32,178,170,0.1)'
-        )
-    )
-
-    # Add COVID impact annotation
-    fig.add_annotation(
-        x='2020-21',
-        y=tourism_gdp_df[tourism_gdp_df['YEAR'] == '2020-21']['DIRECT_CONTRIBUTION_GDP_PERCENT'].iloc[0],
-        text="COVID-19 Impact",
-        showarrow=True,
-        arrowhead=2,
-        arrowcolor="red",
-        bgcolor="rgba(255,0,0,0.1)",
-        bordercolor="red"
-    )
-
-    fig.update_layout(
-        title='Tourism Contribution to India\'s GDP',
-        xaxis_title='Year',
-        yaxis_title='Contribution (%)',
+    data = [
+        # Direct contribution line
+        {
+            'type': 'scatter',
+            'x': tourism_gdp_df['YEAR'],
+            'y': tourism_gdp_df['DIRECT_CONTRIBUTION_GDP_PERCENT'],
+            'mode': 'lines+markers',
+            'name': 'Direct Contribution',
+            'line': {'color': '#008080', 'width': 3},
+            'marker': {'size': 8, 'color': '#008080'},
+            'fill': 'tonexty',
+            'fillcolor': 'rgba(0,128,128,0.1)',
+        },
+        # Total contribution line
+        {
+            'type': 'scatter',
+            'x': tourism_gdp_df['YEAR'],
+            'y': tourism_gdp_df['TOTAL_CONTRIBUTION_GDP_PERCENT'],
+            'mode': 'lines+markers',
+            'name': 'Total Contribution (Direct + Indirect)',
+            'line': {'color': '#20B2AA', 'width': 3},
+            'marker': {'size': 8, 'color': '#20B2AA'},
+            'fill': 'tonexty',
+            'fillcolor': 'rgba(32,178,170,0.1)',
+        },
+    ]
+
+    layout = dict(
+        # COVID impact annotation
+        annotations=[dict(
+            x='2020-21',
+            y=tourism_gdp_df[tourism_gdp_df['YEAR'] == '2020-21']['DIRECT_CONTRIBUTION_GDP_PERCENT'].iloc[0],
+            text="COVID-19 Impact",
+            showarrow=True,
+            arrowhead=2,
+            arrowcolor="red",
+            bgcolor="rgba(255,0,0,0.1)",
+            bordercolor="red"
+        )],
+        title=dict(text='Tourism Contribution to India\'s GDP'),
+        xaxis=dict(title=dict(text='Year')),
+        yaxis=dict(title=dict(text='Contribution (%)')),
         height=400,
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
         font=dict(color='#333', size=11),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
+        legend=HORIZONTAL_LEGEND
     )
+    style_axes(layout, x=LIGHT_GRID_AXIS, y=LIGHT_GRID_AXIS)
 
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-
-    return fig
+    return build_figure(data, layout)
 
+@figure_cache
 def create_employment_trends_chart(tourism_employment_df):
     """Create employment trends chart"""
 
-    fig = go.Figure()
-
-    # Add direct employment
-    fig.add_trace(
-        go.Scatter(
-            x=tourism_employment_df['YEAR'],
-            y=tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'],
-            mode='lines+markers',
-            name='Direct Tourism Jobs',
-            line=dict(color='#FF6B35', width=3),
-            marker=dict(size=8, color='#FF6B35'),
-            fill='tonexty',
-            fillcolor='rgba(255,107,53,0.1)'
-        )
-    )
-
-    # Add total employment
-    fig.add_trace(
-        go.Scatter(
-            x=tourism_employment_df['YEAR'],
-            y=tourism_employment_df['DIRECT_INDIRECT_EMPLOYMENT_MILLION'],
-            mode='lines+markers',
-            name='Total Tourism Employment',
-            line=dict(color='#F18F01', width=3),
-            marker=dict(size=8, color='#F18F01'),
-            fill='tonexty',
-            fillcolor='rgba(241,143,1,0.1)'
-        )
-    )
-
-    # Add employment share percentage as secondary y-axis
-    fig.add_trace(
-        go.Scatter(
-            x=tourism_employment_df['YEAR'],
-            y=tourism_employment_df['DIRECT_INDIRECT_SHARE_PERCENT'],
-            mode='lines+markers',
-            name='Employment Share (%)',
-            line=dict(color='#A23B72', width=2, dash='dash'),
-            marker=dict(size=6, color='#A23B72'),
-            yaxis='y2'
-        )
-    )
-
-    fig.update_layout(
-        title='Tourism Employment in India',
-        xaxis_title='Year',
-        yaxis_title='Employment (Million)',
+    data = [
+        # Direct employment
+        {
+            'type': 'scatter',
+            'x': tourism_employment_df['YEAR'],
+            'y': tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'],
+            'mode': 'lines+markers',
+            'name': 'Direct Tourism Jobs',
+            'line': {'color': '#FF6B35', 'width': 3},
+            'marker': {'size': 8, 'color': '#FF6B35'},
+            'fill': 'tonexty',
+            'fillcolor': 'rgba(255,107,53,0.1)',
+        },
+        # Total employment
+        {
+            'type': 'scatter',
+            'x': tourism_employment_df['YEAR'],
+            'y': tourism_employment_df['DIRECT_INDIRECT_EMPLOYMENT_MILLION'],
+            'mode': 'lines+markers',
+            'name': 'Total Tourism Employment',
+            'line': {'color': '#F18F01', 'width': 3},
+            'marker': {'size': 8, 'color': '#F18F01'},
+            'fill': 'tonexty',
+            'fillcolor': 'rgba(241,143,1,0.1)',
+        },
+        # Employment share percentage on a secondary y-axis
+        {
+            'type': 'scatter',
+            'x': tourism_employment_df['YEAR'],
+            'y': tourism_employment_df['DIRECT_INDIRECT_SHARE_PERCENT'],
+            'mode': 'lines+markers',
+            'name': 'Employment Share (%)',
+            'line': {'color': '#A23B72', 'width': 2, 'dash': 'dash'},
+            'marker': {'size': 6, 'color': '#A23B72'},
+            'yaxis': 'y2',
+        },
+    ]
+
+    layout = dict(
+        title=dict(text='Tourism Employment in India'),
+        xaxis=dict(title=dict(text='Year')),
+        yaxis=dict(title=dict(text='Employment (Million)')),
         yaxis2=dict(
-            title='Share of Total Employment (%)',
+            title=dict(text='Share of Total Employment (%)'),
             overlaying='y',
             side='right',
             range=[10, 16]
@@ -754,16 +663,8 @@ def create_employment_trends_chart(tourism_employment_df):
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)',
         font=dict(color='#333', size=11),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        )
+        legend=HORIZONTAL_LEGEND
     )
+    style_axes(layout, x=LIGHT_GRID_AXIS, y=LIGHT_GRID_AXIS)
 
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-
-    return fig
+    return build_figure(data, layout)
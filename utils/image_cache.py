@@ -0,0 +1,149 @@
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from PIL import Image
+
+# Decoded images are held by reference, never pickled or copied, and evicted
+# least-recently-used once their pixel bytes pass the budget
+IMAGE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Bytes per band for the PIL modes that appear in the image folders
+_MODE_BAND_BYTES = {'I': 4, 'F': 4, 'I;16': 2, 'I;16B': 2, 'I;16L': 2, '1': 1}
+
+def image_nbytes(img):
+    """Approximate decoded size of a PIL image in bytes"""
+    return img.width * img.height * len(img.getbands()) * _MODE_BAND_BYTES.get(img.mode, 1)
+
+class ImageCache:
+    """Thread-safe LRU cache of decoded images bounded by total pixel bytes"""
+
+    def __init__(self, max_bytes=IMAGE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached image for key (marking it recently used) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, img):
+        """Store an image, evicting the least recently used entries to stay in budget"""
+        nbytes = image_nbytes(img)
+        if nbytes > self.max_bytes:
+            return img
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (img, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+        return img
+
+    def get_or_load(self, key, loader):
+        """Return the cached image for key, calling loader() to decode it on a miss"""
+        img = self.get(key)
+        if img is None:
+            img = loader()
+            if img is not None:
+                self.put(key, img)
+        return img
+
+    def contains(self, key):
+        """Check for a key without touching the LRU order or the counters"""
+        with self._lock:
+            return key in self._entries
+
+    def clear(self):
+        """Drop every cached image (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """Snapshot of the cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+# Module-level rather than st.cache_resource so the image worker threads, which
+# run without a ScriptRunContext, share the same instance as the script thread
+_image_cache = ImageCache()
+
+def get_image_cache():
+    """Process-wide decoded image cache shared by every session"""
+    return _image_cache
+
+# JPEG decoding can be scaled by 1/2, 1/4 or 1/8 in the DCT, which is far cheaper
+# than decoding every pixel and throwing most of them away in thumbnail()
+DRAFT_SCALES = (8, 4, 2)
+
+@lru_cache(maxsize=4096)
+def _draft_scale(image_path, signature, max_size, exact):
+    """Largest JPEG decode reduction that still covers the target size (1 = full decode)"""
+    with Image.open(image_path) as img:
+        if img.format != 'JPEG':
+            return 1
+        width, height = img.size
+    target_width, target_height = max_size
+    if not exact:
+        ratio = min(target_width / width, target_height / height, 1)
+        target_width, target_height = max(1, int(width * ratio)), max(1, int(height * ratio))
+    reduction = min(width // target_width, height // target_height)
+    return next((scale for scale in DRAFT_SCALES if reduction >= scale), 1)
+
+def _decode_image(image_path, scale=1):
+    """Decode an image from disk, letting libjpeg downscale by `scale` when above 1"""
+    with Image.open(image_path) as img:
+        if scale > 1:
+            width, height = img.size
+            img.draft(img.mode, (width // scale, height // scale))
+        img.load()
+        return img
+
+def load_image(image_path, max_size=None, exact=False):
+    """Load a decoded image through the shared cache; None if it is missing or unreadable
+
+    With max_size, JPEGs are decoded at the smallest 1/2, 1/4 or 1/8 scale that
+    still covers the target box (filled exactly when exact is True), so callers
+    must still resize the result. The returned image is shared between sessions
+    and must not be modified in place.
+    """
+    if not image_path or not os.path.exists(image_path):
+        return None
+    stat = os.stat(image_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    try:
+        scale = _draft_scale(image_path, signature, tuple(max_size), exact) if max_size else 1
+        key = (image_path, *signature, scale)
+        return get_image_cache().get_or_load(key, lambda: _decode_image(image_path, scale))
+    except Exception as e:
+        print(f"Error loading image {image_path}: {e}")
+        return None
+
+def image_cache_stats():
+    """Hit, miss, eviction and byte counters of the shared image cache"""
+    return get_image_cache().stats()
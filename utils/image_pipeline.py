@@ -0,0 +1,404 @@
+import streamlit as st
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from PIL import Image, ImageFilter
+from utils.image_cache import load_image
+
+# Derivatives are written under ./static so Streamlit can serve them at
+# app/static/... when server.enableStaticServing is on (see .streamlit/config.toml)
+STATIC_DIR = 'static'
+DERIVATIVES_DIR = os.path.join(STATIC_DIR, 'derivatives')
+STATIC_URL_PREFIX = 'app/static/derivatives'
+
+IMAGE_ROOT = 'Images'
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+JPEG_QUALITY = 82
+
+# Low-quality image placeholders: a tiny blurred JPEG plus the dominant colour,
+# painted as the <img> background until the real derivative arrives
+PLACEHOLDER_SIZE = (16, 16)
+PLACEHOLDER_QUALITY = 40
+PLACEHOLDER_MANIFEST = os.path.join(DERIVATIVES_DIR, 'placeholders.json')
+
+# Responsive candidates: each preset is also built at these multiples of its box
+# (never upscaling the source) and offered through srcset, so phones pick the
+# half-size file and HiDPI screens the double-size one
+RESPONSIVE_SCALES = (0.5, 1, 2)
+
+# Worker threads for decoding and resizing batches of images; Pillow releases the
+# GIL while decoding, so a cold page costs roughly its slowest image
+IMAGE_WORKERS = min(8, os.cpu_count() or 2)
+
+# Target boxes (and whether they are filled exactly) used by the card layouts;
+# pre-built for every source image by scripts/build_image_derivatives.py
+DERIVATIVE_PRESETS = {
+    'festival_card': ((350, 250), False),
+    'highlight_card': ((400, 250), False),
+    'gallery_card': ((480, 480), False),
+    'unesco_card': ((480, 320), False),
+    'dance_featured': ((400, 350), False),
+    'heritage_slide': ((800, 600), False),
+    'dance_slide': ((800, 500), True),
+}
+
+def is_static_serving_enabled():
+    """Check whether Streamlit is serving the ./static folder"""
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+def list_source_images(root=IMAGE_ROOT):
+    """List every source image under the Images folder"""
+    image_paths = []
+    for folder, _, files in os.walk(root):
+        for filename in sorted(files):
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                image_paths.append(os.path.join(folder, filename))
+    return sorted(image_paths)
+
+def _file_signature(image_path):
+    """Cheap (mtime, size) signature used to invalidate digests when a file changes"""
+    stat = os.stat(image_path)
+    return stat.st_mtime_ns, stat.st_size
+
+# Digest and format lookups use lru_cache rather than st.cache_data because they
+# also run on the image worker threads, which have no ScriptRunContext
+@lru_cache(maxsize=4096)
+def _source_digest(image_path, signature):
+    """Hash the source bytes once per file version"""
+    hasher = hashlib.sha1()
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def get_source_digest(image_path):
+    """Content hash of a source image"""
+    return _source_digest(image_path, _file_signature(image_path))
+
+def _has_transparency(img):
+    """True when the image actually uses its alpha channel"""
+    if img.mode in ('RGBA', 'LA'):
+        return img.getchannel('A').getextrema()[0] < 255
+    if img.mode == 'P':
+        return 'transparency' in img.info
+    return False
+
+@lru_cache(maxsize=4096)
+def _derivative_format(image_path, signature):
+    """Pick the output format for a source: JPEG unless real transparency is needed"""
+    with Image.open(image_path) as img:
+        return 'PNG' if _has_transparency(img) else 'JPEG'
+
+def derivative_filename(image_path, max_size, exact=False):
+    """Stable, content-hashed filename for a resized derivative"""
+    width, height = max_size
+    fmt = _derivative_format(image_path, _file_signature(image_path))
+    params = f"{width}x{height}:{'exact' if exact else 'fit'}:{fmt}:{JPEG_QUALITY}"
+    key = hashlib.sha1(f"{get_source_digest(image_path)}:{params}".encode()).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    extension = '.png' if fmt == 'PNG' else '.jpg'
+    return f"{stem}-{width}x{height}-{key}{extension}"
+
+def render_derivative(img, max_size, exact=False):
+    """Resize a decoded image to fit (or exactly fill) max_size"""
+    if exact:
+        return img.resize(max_size, Image.Resampling.LANCZOS)
+    resized = img.copy()
+    resized.thumbnail(max_size, Image.Resampling.LANCZOS)
+    return resized
+
+def _temp_path(path):
+    """A temp file name next to path, unique per call so concurrent writers never share one"""
+    return f"{path}.{uuid.uuid4().hex}.tmp"
+
+def _save_derivative(img, output_path):
+    """Write a derivative atomically so concurrent sessions never see partial files"""
+    fmt = 'PNG' if output_path.endswith('.png') else 'JPEG'
+    if fmt == 'JPEG' and img.mode != 'RGB':
+        img = img.convert('RGB')
+    tmp_path = _temp_path(output_path)
+    if fmt == 'JPEG':
+        img.save(tmp_path, format='JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    else:
+        img.save(tmp_path, format='PNG', optimize=True)
+    os.replace(tmp_path, output_path)
+
+def build_derivative(image_path, max_size, exact=False):
+    """Create (if missing) the resized derivative for an image and return its path"""
+    if not os.path.exists(image_path):
+        return None
+    filename = derivative_filename(image_path, max_size, exact)
+    output_path = os.path.join(DERIVATIVES_DIR, filename)
+    if not os.path.exists(output_path):
+        img = load_image(image_path, max_size, exact)
+        if img is None:
+            return None
+        os.makedirs(DERIVATIVES_DIR, exist_ok=True)
+        _save_derivative(render_derivative(img, max_size, exact), output_path)
+    return output_path
+
+@st.cache_data(show_spinner=False)
+def _resolve_derivative(image_path, max_size, exact, signature):
+    """Build the derivative once per source version and remember its path"""
+    try:
+        return build_derivative(image_path, max_size, exact)
+    except Exception as e:
+        print(f"Error building derivative for {image_path}: {e}")
+        return None
+
+def get_derivative_path(image_path, max_size, exact=False):
+    """Path of the resized derivative for an image, or None if it is missing"""
+    if not image_path or not os.path.exists(image_path):
+        return None
+    derivative_path = _resolve_derivative(image_path, tuple(max_size), exact, _file_signature(image_path))
+    if derivative_path is not None and not os.path.exists(derivative_path):
+        # The static folder was cleaned after the path was cached; rebuild in place
+        derivative_path = build_derivative(image_path, tuple(max_size), exact)
+    return derivative_path
+
+@st.cache_data(show_spinner=False)
+def _derivative_src(image_path, max_size, exact, static_serving, signature):
+    """Resolve an image to a browser-usable src (static URL or data URI)"""
+    derivative_path = get_derivative_path(image_path, max_size, exact)
+    if derivative_path is None:
+        return None
+    if static_serving:
+        return f"{STATIC_URL_PREFIX}/{os.path.basename(derivative_path)}"
+    mime = 'image/png' if derivative_path.endswith('.png') else 'image/jpeg'
+    with open(derivative_path, 'rb') as f:
+        encoded = base64.b64encode(f.read()).decode()
+    return f"data:{mime};base64,{encoded}"
+
+def get_image_src(image_path, max_size, exact=False):
+    """Get an <img> src for an image resized to max_size, or None if it is missing"""
+    if not image_path or not os.path.exists(image_path):
+        return None
+    return _derivative_src(image_path, tuple(max_size), exact,
+                           is_static_serving_enabled(), _file_signature(image_path))
+
+def _dominant_color(img):
+    """Most common colour of a (small) image as a hex string"""
+    quantized = img.convert('RGB').quantize(colors=4)
+    palette = quantized.getpalette()
+    _, index = max(quantized.getcolors())
+    red, green, blue = palette[index * 3:index * 3 + 3]
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+def build_placeholder(image_path):
+    """Build the inline placeholder for an image: tiny blurred JPEG, dominant colour and size"""
+    with Image.open(image_path) as header:
+        width, height = header.size
+    img = load_image(image_path, PLACEHOLDER_SIZE)
+    if img is None:
+        return None
+    tiny = img.convert('RGB')
+    tiny.thumbnail(PLACEHOLDER_SIZE, Image.Resampling.BOX)
+    tiny = tiny.filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    tiny.save(buffer, format='JPEG', quality=PLACEHOLDER_QUALITY, optimize=True)
+    return {
+        'src': f"data:image/jpeg;base64,{base64.b64encode(buffer.getvalue()).decode()}",
+        'color': _dominant_color(tiny),
+        'width': width,
+        'height': height,
+    }
+
+@lru_cache(maxsize=4)
+def _load_placeholder_manifest(signature):
+    """Placeholders pre-built by scripts/build_image_derivatives.py, keyed by source digest"""
+    try:
+        with open(PLACEHOLDER_MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+@lru_cache(maxsize=4096)
+def _placeholder(image_path, signature):
+    """Placeholder for one version of a source image, from the manifest or built on demand"""
+    try:
+        manifest_signature = _file_signature(PLACEHOLDER_MANIFEST) if os.path.exists(PLACEHOLDER_MANIFEST) else None
+        manifest = _load_placeholder_manifest(manifest_signature)
+        return manifest.get(_source_digest(image_path, signature)) or build_placeholder(image_path)
+    except Exception as e:
+        print(f"Error building placeholder for {image_path}: {e}")
+        return None
+
+def get_image_placeholder(image_path):
+    """Inline placeholder dict (src, color, width, height) for an image, or None"""
+    if not image_path or not os.path.exists(image_path):
+        return None
+    return _placeholder(image_path, _file_signature(image_path))
+
+def write_placeholder_manifest(image_paths):
+    """Pre-build placeholders for the given images into the manifest read at runtime"""
+    manifest = {}
+    for image_path in image_paths:
+        placeholder = get_image_placeholder(image_path)
+        if placeholder is not None:
+            manifest[get_source_digest(image_path)] = placeholder
+    os.makedirs(DERIVATIVES_DIR, exist_ok=True)
+    tmp_path = _temp_path(PLACEHOLDER_MANIFEST)
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+    os.replace(tmp_path, PLACEHOLDER_MANIFEST)
+    return manifest
+
+def derivative_size(width, height, max_size, exact=False):
+    """Pixel size a derivative of a width x height source will have"""
+    if exact:
+        return tuple(max_size)
+    ratio = min(max_size[0] / width, max_size[1] / height, 1)
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+@lru_cache(maxsize=4096)
+def _source_size(image_path, signature):
+    """Pixel size of a source image, read from its header"""
+    with Image.open(image_path) as img:
+        return img.size
+
+def responsive_variants(image_path, max_size, exact=False):
+    """Distinct (box, derivative width) candidates for an image across RESPONSIVE_SCALES"""
+    width, height = _source_size(image_path, _file_signature(image_path))
+    variants = {}
+    for scale in sorted(RESPONSIVE_SCALES, key=lambda scale: scale != 1):
+        box = (max(1, round(max_size[0] * scale)), max(1, round(max_size[1] * scale)))
+        box_width = derivative_size(width, height, box, exact)[0]
+        # Only the 1x box may upscale (exact presets); larger candidates would add bytes, not detail
+        if scale != 1 and box_width > width:
+            continue
+        variants.setdefault(box_width, box)
+    return [(box, box_width) for box_width, box in sorted(variants.items())]
+
+@st.cache_data(show_spinner=False)
+def _derivative_srcset(image_path, max_size, exact, signature):
+    """Build every responsive candidate once per source version and join them into a srcset"""
+    candidates = []
+    for box, box_width in responsive_variants(image_path, max_size, exact):
+        derivative_path = get_derivative_path(image_path, box, exact)
+        if derivative_path is not None:
+            candidates.append(f"{STATIC_URL_PREFIX}/{os.path.basename(derivative_path)} {box_width}w")
+    return ", ".join(candidates) or None
+
+def get_image_srcset(image_path, max_size, exact=False):
+    """srcset of static derivative URLs for an image, or None without static serving"""
+    if not is_static_serving_enabled() or not image_path or not os.path.exists(image_path):
+        return None
+    return _derivative_srcset(image_path, tuple(max_size), exact, _file_signature(image_path))
+
+def image_tag(src, image_path, max_size, alt="", exact=False, css_class=None, style="", lazy=False, sizes=None):
+    """Build an <img> tag that paints its blurred placeholder until the real image loads
+
+    The width/height attributes reserve the derivative's aspect ratio, so the card
+    layout doesn't jump when the image arrives. With sizes (the rendered width as a
+    CSS media-query list), a srcset of responsive candidates is added as well.
+    """
+    attributes = [f'src="{src}"', f'alt="{html.escape(str(alt))}"']
+    srcset = get_image_srcset(image_path, max_size, exact) if sizes else None
+    if srcset:
+        attributes.append(f'srcset="{srcset}" sizes="{sizes}"')
+    if css_class:
+        attributes.append(f'class="{css_class}"')
+    placeholder = get_image_placeholder(image_path)
+    if placeholder is not None:
+        width, height = derivative_size(placeholder['width'], placeholder['height'], max_size, exact)
+        attributes.append(f'width="{width}" height="{height}"')
+        style = (f"background: {placeholder['color']} url('{placeholder['src']}') center / cover no-repeat; "
+                 f"{style}")
+    if style:
+        attributes.append(f'style="{style.strip()}"')
+    if lazy:
+        attributes.append('loading="lazy" decoding="async"')
+    return f"<img {' '.join(attributes)}>"
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_image_executor():
+    """Shared worker pool used to prepare images off the script thread"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image-worker")
+        return _executor
+
+def _timed_build(image_path, max_size, exact):
+    """Build one derivative on a worker thread, returning (path, seconds, error)"""
+    start = time.perf_counter()
+    try:
+        return build_derivative(image_path, max_size, exact), time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, e
+
+def prepare_images(image_paths, max_size, exact=False):
+    """Decode and resize a batch of images concurrently, then resolve their srcs
+
+    Returns (srcs, timings): srcs is in the same order as image_paths (None for
+    missing images) and timings breaks the batch down into wall time, summed
+    per-image work and the slowest image, all in milliseconds.
+    """
+    start = time.perf_counter()
+    max_size = tuple(max_size)
+    existing = [path for path in dict.fromkeys(image_paths) if path and os.path.exists(path)]
+
+    # With static serving every responsive candidate is built, not just the 1x box
+    jobs = [(path, box) for path in existing
+            for box in ([box for box, _ in responsive_variants(path, max_size, exact)]
+                        if is_static_serving_enabled() else [max_size])]
+    futures = [get_image_executor().submit(_timed_build, path, box, exact) for path, box in jobs]
+    build_times = []
+    for (path, _), future in zip(jobs, futures):
+        _, seconds, error = future.result()
+        build_times.append(seconds)
+        if error is not None:
+            print(f"Error building derivative for {path}: {error}")
+    prepared = time.perf_counter()
+
+    srcs = [get_image_src(path, max_size, exact) for path in image_paths]
+    finished = time.perf_counter()
+
+    timings = {
+        'images': len(image_paths),
+        'wall_ms': (finished - start) * 1000,
+        'prepare_ms': (prepared - start) * 1000,
+        'resolve_ms': (finished - prepared) * 1000,
+        'work_ms': sum(build_times) * 1000,
+        'slowest_ms': max(build_times, default=0) * 1000,
+    }
+    return srcs, timings
+
+def render_image(image_path, max_size, caption=None, alt="", exact=False, sizes=None):
+    """Display an image through the derivative pipeline; returns False if unavailable"""
+    if not image_path or not os.path.exists(image_path):
+        return False
+
+    if is_static_serving_enabled():
+        src = get_image_src(image_path, max_size, exact)
+        if src is None:
+            return False
+        caption_html = f'<p style="text-align: center; color: rgba(49,51,63,0.6); font-size: 0.875rem; margin: 0.25rem 0 0 0;">{caption}</p>' if caption else ''
+        st.markdown(f"""
+        <div style="margin-bottom: 1rem;">
+            {image_tag(src, image_path, max_size, alt=alt or caption or '', exact=exact, style="width: 100%; height: auto; display: block;", sizes=sizes)}
+            {caption_html}
+        </div>
+        """, unsafe_allow_html=True)
+        return True
+
+    # Without static serving, hand Streamlit the small derivative instead of the original
+    derivative_path = get_derivative_path(image_path, max_size, exact)
+    if derivative_path is None:
+        return False
+    st.image(derivative_path, use_container_width=True, caption=caption)
+    return True
@@ -0,0 +1,43 @@
+import streamlit as st
+from utils.data_version import get_data_version
+
+# Decade buckets (label, first year, last year) shared by every decade comparison
+ITA_DECADES = (
+    ('2001-2010', 2001, 2010),
+    ('2011-2020', 2011, 2020),
+    ('2021-2023', 2021, 2023),
+)
+# Years the ITA charts call out
+ITA_MILESTONE_YEARS = (2001, 2008, 2019, 2020, 2023)
+
+@st.cache_data(show_spinner=False)
+def _ita_metrics(data_version, _ita_df):
+    """Every derived ITA series and figure the charts and cards use, computed once per data version"""
+    years = _ita_df['YEAR']
+    arrivals = _ita_df['INDIA_ARRIVALS_MILLION']
+    growth = arrivals.pct_change() * 100
+
+    latest = arrivals.iloc[-1]
+    previous = arrivals.iloc[-2] if len(arrivals) > 1 else latest
+    first_year, last_year = years.iloc[0], years.iloc[-1]
+    span = last_year - first_year
+    milestones = {year: arrivals[years == year].iloc[0] for year in ITA_MILESTONE_YEARS if (years == year).any()}
+
+    return {
+        'growth': growth,
+        'growth_colors': ['#008080' if x > 0 else '#999' for x in growth.fillna(0)],
+        'average_growth': growth.mean(),
+        'latest': latest,
+        'latest_growth': ((latest - previous) / previous) * 100,
+        'cagr': ((latest / arrivals.iloc[0]) ** (1 / span) - 1) * 100 if span > 0 and arrivals.iloc[0] > 0 else 0.0,
+        'decades': {label: arrivals[(years >= start) & (years <= end)].mean() for label, start, end in ITA_DECADES},
+        'peak_year': years.loc[arrivals.idxmax()],
+        'peak_arrivals': arrivals.max(),
+        'milestones': milestones,
+        'covid_impact': ((milestones[2020] - milestones[2019]) / milestones[2019]) * 100
+                        if 2019 in milestones and 2020 in milestones else None,
+    }
+
+def get_ita_metrics(ita_df):
+    """YoY growth, decade averages, CAGR, peak and milestone arrivals for an ITA frame"""
+    return _ita_metrics(get_data_version(ita_df), ita_df)
@@ -0,0 +1,87 @@
+import streamlit as st
+import hashlib
+import html
+import os
+import plotly.io as pio
+from utils.figure_payload import figure_title
+from utils.image_pipeline import STATIC_DIR, is_static_serving_enabled
+
+# Lite mode swaps interactive Plotly charts for static images of the same figures,
+# pre-rendered per data version by python -m scripts.build_chart_images. Images are
+# named after a hash of the figure's wire JSON, so new data simply means new files
+# and a stale image can never be shown for a changed chart.
+CHART_IMAGE_DIR = os.path.join(STATIC_DIR, 'charts')
+CHART_IMAGE_URL_PREFIX = 'app/static/charts'
+CHART_IMAGE_FORMAT = 'png'
+CHART_IMAGE_WIDTH = 1100
+CHART_IMAGE_HEIGHT = 450
+
+# Client hints that mark a constrained client: Save-Data, a slow ECT or little
+# Device-Memory (the last two only where the client already offers them). Being a
+# mobile browser (Sec-CH-UA-Mobile) says nothing about either, so it only counts
+# when a deployment opts in here.
+SLOW_CONNECTION_TYPES = ('slow-2g', '2g', '3g')
+LOW_DEVICE_MEMORY_GB = 2
+LITE_MODE_ON_MOBILE = False
+
+def chart_key(spec_json):
+    """Content hash naming the pre-rendered image of one figure"""
+    return hashlib.sha1(spec_json.encode()).hexdigest()[:16]
+
+def chart_image_path(key):
+    """Pre-rendered image file for a chart key"""
+    return os.path.join(CHART_IMAGE_DIR, f"{key}.{CHART_IMAGE_FORMAT}")
+
+def _header(headers, name):
+    return (headers.get(name) or '').strip().strip('"').lower()
+
+def client_prefers_lite():
+    """True when the request's client hints point at a slow connection or a low-end device"""
+    try:
+        headers = st.context.headers
+    except Exception:
+        return False
+    if _header(headers, 'Save-Data') == 'on':
+        return True
+    if LITE_MODE_ON_MOBILE and _header(headers, 'Sec-CH-UA-Mobile') == '?1':
+        return True
+    if _header(headers, 'ECT') in SLOW_CONNECTION_TYPES:
+        return True
+    try:
+        return float(_header(headers, 'Device-Memory') or 'inf') <= LOW_DEVICE_MEMORY_GB
+    except ValueError:
+        return False
+
+def is_lite_mode():
+    """Whether this session renders charts as static images"""
+    if 'lite_mode' not in st.session_state:
+        requested = st.query_params.get('lite')
+        st.session_state.lite_mode = requested == '1' if requested in ('0', '1') else client_prefers_lite()
+    return st.session_state.lite_mode
+
+def lite_mode_toggle():
+    """Sidebar switch for lite mode, defaulting from ?lite=1 or the client hints"""
+    is_lite_mode()
+    st.sidebar.toggle("🪶 Lite mode", key='lite_mode',
+                      help="Show charts as static images; faster on slow connections and older devices")
+
+def render_chart(fig):
+    """Display a Plotly figure, as its pre-rendered image in lite mode when one exists"""
+    if not is_lite_mode():
+        st.plotly_chart(fig, use_container_width=True)
+        return
+
+    spec_json = pio.to_json(fig, validate=False)
+    path = chart_image_path(chart_key(spec_json))
+    if not os.path.exists(path):
+        # Not pre-rendered yet: still skip hover, zoom and pan handlers
+        st.plotly_chart(fig, use_container_width=True, config={'staticPlot': True})
+        return
+
+    alt = html.escape(figure_title(fig.layout.to_plotly_json()) or 'Chart')
+    if is_static_serving_enabled():
+        st.markdown(f'<img src="{CHART_IMAGE_URL_PREFIX}/{os.path.basename(path)}" alt="{alt}" '
+                    f'loading="lazy" style="width: 100%; height: auto; display: block; margin-bottom: 1rem;">',
+                    unsafe_allow_html=True)
+    else:
+        st.image(path, use_container_width=True)
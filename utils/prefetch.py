@@ -0,0 +1,50 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils.image_pipeline import build_derivative, get_image_placeholder, responsive_variants
+
+# Prefetching runs on its own single worker so it can never take threads from the
+# foreground pool (see get_image_executor), and drops requests once this many are
+# queued so a user paging quickly doesn't build up a backlog of stale work
+PREFETCH_WORKERS = 1
+PREFETCH_MAX_PENDING = 24
+
+_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="image-prefetch")
+_pending = set()
+_pending_lock = threading.Lock()
+
+def _prefetch_one(key):
+    """Build everything an image's <img> tag needs in the background, forgetting the key when done
+
+    That is every srcset candidate (0.5x / 1x / 2x) and the blurred placeholder,
+    so rendering the card afterwards only finds files and cached entries.
+    """
+    image_path, max_size, exact = key
+    try:
+        for box, _ in responsive_variants(image_path, max_size, exact):
+            build_derivative(image_path, box, exact)
+        get_image_placeholder(image_path)
+    except Exception as e:
+        print(f"Error prefetching {image_path}: {e}")
+    finally:
+        with _pending_lock:
+            _pending.discard(key)
+
+def prefetch_images(image_paths, max_size, exact=False):
+    """Warm the derivatives, placeholders (and decoded image cache) for images likely to be shown next"""
+    max_size = tuple(max_size)
+    for image_path in image_paths:
+        if not image_path or not os.path.exists(image_path):
+            continue
+        key = (image_path, max_size, exact)
+        with _pending_lock:
+            if key in _pending or len(_pending) >= PREFETCH_MAX_PENDING:
+                continue
+            _pending.add(key)
+        _executor.submit(_prefetch_one, key)
+
+def neighbor_indices(index, count):
+    """Indices of the next and previous items in a wrapping sequence"""
+    if count <= 1:
+        return []
+    return list(dict.fromkeys([(index + 1) % count, (index - 1) % count]))
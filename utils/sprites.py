@@ -0,0 +1,90 @@
+import streamlit as st
+import base64
+import hashlib
+import html
+import os
+from PIL import Image, ImageOps
+from utils.image_cache import load_image
+from utils.image_pipeline import (DERIVATIVES_DIR, STATIC_URL_PREFIX, _file_signature, _save_derivative,
+                                  get_source_digest, is_static_serving_enabled)
+
+# Contact sheets pack a page of thumbnails into one image so the browser makes one
+# request and one decode per page; each card shows its cell via CSS offsets
+SPRITE_MAX_COLUMNS = 5
+
+def sprite_filename(image_paths, cell_size):
+    """Content-hashed filename for the contact sheet of these images at this cell size"""
+    width, height = cell_size
+    key = hashlib.sha1()
+    for image_path in image_paths:
+        key.update(get_source_digest(image_path).encode())
+    key.update(f"{width}x{height}".encode())
+    return f"sprite-{width}x{height}-{key.hexdigest()[:16]}.jpg"
+
+def build_sprite(image_paths, cell_size):
+    """Create (if missing) a contact sheet of cover-cropped cells; returns (path, columns, rows)
+
+    Each cell is centre-cropped to cell_size here, and the card then crops the
+    cell again to its own box. For sources wider than the cell that shows a
+    narrower slice than object-fit: cover on the single image would.
+    """
+    columns = min(len(image_paths), SPRITE_MAX_COLUMNS)
+    rows = -(-len(image_paths) // columns)
+    output_path = os.path.join(DERIVATIVES_DIR, sprite_filename(image_paths, cell_size))
+
+    if not os.path.exists(output_path):
+        cell_width, cell_height = cell_size
+        sheet = Image.new('RGB', (cell_width * columns, cell_height * rows), (0, 128, 128))
+        for index, image_path in enumerate(image_paths):
+            img = load_image(image_path, cell_size, exact=True)
+            if img is None:
+                continue
+            cell = ImageOps.fit(img.convert('RGB'), cell_size, Image.Resampling.LANCZOS)
+            sheet.paste(cell, ((index % columns) * cell_width, (index // columns) * cell_height))
+        os.makedirs(DERIVATIVES_DIR, exist_ok=True)
+        _save_derivative(sheet, output_path)
+    return output_path, columns, rows
+
+@st.cache_data(show_spinner=False)
+def _sprite(image_paths, cell_size, static_serving, signatures):
+    """Build a contact sheet once per set of source versions and resolve its src"""
+    try:
+        sprite_path, columns, rows = build_sprite(list(image_paths), cell_size)
+    except Exception as e:
+        print(f"Error building sprite: {e}")
+        return None
+    if static_serving:
+        src = f"{STATIC_URL_PREFIX}/{os.path.basename(sprite_path)}"
+    else:
+        with open(sprite_path, 'rb') as f:
+            src = f"data:image/jpeg;base64,{base64.b64encode(f.read()).decode()}"
+    return {
+        'src': src,
+        'columns': columns,
+        'rows': rows,
+        'cell_size': cell_size,
+        'cells': {image_path: index for index, image_path in enumerate(image_paths)},
+    }
+
+def get_sprite(image_paths, cell_size):
+    """Contact sheet for the existing images among image_paths, or None if there are none"""
+    existing = tuple(dict.fromkeys(path for path in image_paths if path and os.path.exists(path)))
+    if not existing:
+        return None
+    return _sprite(existing, tuple(cell_size), is_static_serving_enabled(),
+                   tuple(_file_signature(path) for path in existing))
+
+def sprite_cell_html(sprite, image_path, alt="", css_class=None, style=""):
+    """A <div> showing one image's cell of a contact sheet, or None if it isn't on the sheet"""
+    if sprite is None or image_path not in sprite['cells']:
+        return None
+    index = sprite['cells'][image_path]
+    columns, rows = sprite['columns'], sprite['rows']
+    cell_width, cell_height = sprite['cell_size']
+    x = (index % columns) / (columns - 1) * 100 if columns > 1 else 0
+    y = (index // columns) / (rows - 1) * 100 if rows > 1 else 0
+    class_attr = f' class="{css_class}"' if css_class else ''
+    return (f'<div{class_attr} role="img" aria-label="{html.escape(str(alt))}" '
+            f'style="width: 100%; aspect-ratio: {cell_width} / {cell_height}; '
+            f"background: url('{sprite['src']}') {x:.4f}% {y:.4f}% / {columns * 100}% {rows * 100}% no-repeat; "
+            f'{style}'.rstrip() + '"></div>')